@@ -0,0 +1,241 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Socketless protocol-decoder microbenchmarks for the pure-Python mariadb implementation.
+
+Pre-built result set payloads (from fake_server.py's encoder) are fed straight
+into each decoding layer, with no socket and no database:
+
+- metadata: ColumnDefinitionPacket.decode() on the column definitions
+- reader:   PayloadReader walking every field of every row packet
+- row:      the client's text/binary row parser (one tuple per row packet)
+- result:   SyncStreamingResult.fetch_all() over the row packets
+
+Each layer reports rows/s and MB/s for text and binary rows of int, varchar,
+decimal, datetime and mixed columns, so hot-loop regressions in the row parser
+show up without a server.
+
+Usage:
+    python bench_decode.py
+    python bench_decode.py --rows 1,1000,1000000 --layer row --columns mixed
+    python bench_decode.py --json decode_mariadb.json
+    python run_benchmarks.py --compare --compare-files decode_old.json decode_new.json
+"""
+
+import argparse
+import datetime
+import decimal
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+
+import mariadb
+from mariadb.impl.client.context import Context
+from mariadb.impl.client.sync_client import SyncClient
+from mariadb.impl.configuration import Configuration
+from mariadb.impl.message.payload_reader import PayloadReader
+from mariadb.impl.message.server.column_definition_packet import ColumnDefinitionPacket
+from mariadb.impl.result import SyncStreamingResult
+
+from fake_server import (
+    TYPE_DATETIME, TYPE_LONG, TYPE_NEWDECIMAL, TYPE_VAR_STRING, Column, ResultSet,
+    eof_payload,
+)
+
+
+COLUMN_SETS = {
+    'int': [Column('i', TYPE_LONG, 1234567, 11)],
+    'varchar': [Column('s', TYPE_VAR_STRING, b'abcdefghijabcdefghijabcdefghijaa', 128)],
+    'decimal': [Column('d', TYPE_NEWDECIMAL, decimal.Decimal('1234567.89'), 12)],
+    'datetime': [Column('dt', TYPE_DATETIME, datetime.datetime(2025, 1, 2, 3, 4, 5, 678900), 26)],
+}
+COLUMN_SETS['mixed'] = [c for name in ('int', 'varchar', 'decimal', 'datetime') for c in COLUMN_SETS[name]]
+
+LAYERS = ['metadata', 'reader', 'row', 'result']
+PROTOCOLS = ['text', 'binary']
+DEFAULT_ROWS = [1, 100, 10000, 1000000]
+
+
+def build_payloads(columns, rows, protocol):
+    """Encode column definitions and row packets as memoryviews."""
+    result_set = ResultSet(columns, rows)
+    definitions = [memoryview(c.definition()) for c in columns]
+    row_iter = result_set.binary_rows() if protocol == 'binary' else result_set.text_rows()
+    payloads = [memoryview(row) for row in row_iter]
+    return definitions, payloads
+
+
+def walk_text_rows(payloads, column_count):
+    """Reader layer, text protocol: read every length-encoded field."""
+    reader = PayloadReader(payloads[0]) if payloads else None
+    for payload in payloads:
+        reader.set_buffer(payload)
+        for _ in range(column_count):
+            reader.read_length_encoded_bytes()
+
+
+def walk_binary_rows(payloads, columns):
+    """Reader layer, binary protocol: skip header and NULL bitmap, read every field."""
+    reader = PayloadReader(payloads[0]) if payloads else None
+    bitmap_length = (len(columns) + 9) >> 3
+    type_codes = [c.type_code for c in columns]
+    for payload in payloads:
+        reader.set_buffer(payload, 1 + bitmap_length)
+        for type_code in type_codes:
+            if type_code == TYPE_LONG:
+                reader.read_int32()
+            elif type_code == TYPE_DATETIME:
+                reader.skip(reader.read_byte())
+            else:
+                reader.read_length_encoded_bytes()
+
+
+def make_layer(layer, protocol, columns, definitions, payloads):
+    """Return a zero-argument callable running one pass of the given layer."""
+    context = Context(server_version='11.4.0-MariaDB', is_mariadb=True)
+    config = Configuration()
+    decoded = [ColumnDefinitionPacket.decode(d, context) for d in definitions]
+    client = SyncClient.__new__(SyncClient)
+    row_parser = client._parse_binary_row_data if protocol == 'binary' else client._parse_text_row_data
+
+    if layer == 'metadata':
+        decode = ColumnDefinitionPacket.decode
+        return lambda: [decode(d, context) for d in definitions]
+    if layer == 'reader':
+        if protocol == 'binary':
+            return lambda: walk_binary_rows(payloads, columns)
+        return lambda: walk_text_rows(payloads, len(columns))
+    if layer == 'row':
+        return lambda: [row_parser(p, decoded, config) for p in payloads]
+
+    eof = memoryview(eof_payload())
+
+    def fetch_all():
+        packets = iter(payloads)
+        result = SyncStreamingResult(lambda: next(packets, eof), context, decoded,
+                                     len(decoded), config, row_parser)
+        return result.fetch_all()
+    return fetch_all
+
+
+def measure(func, min_time, min_rounds):
+    """Run func until both min_time and min_rounds are reached; return per-round times."""
+    func()  # warmup
+    times = []
+    total = 0.0
+    while total < min_time or len(times) < min_rounds:
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        times.append(elapsed)
+        total += elapsed
+    return times
+
+
+def run(layers, protocols, column_sets, row_counts, min_time, min_rounds, label):
+    """Run the selected matrix and return pytest-benchmark compatible entries."""
+    benchmarks = []
+    print(f"{'Layer':<10} {'Proto':<7} {'Columns':<9} {'Rows':>8} {'Median (ms)':>12} "
+          f"{'Rows/s':>14} {'MB/s':>9}")
+    print("-" * 75)
+    for column_name in column_sets:
+        columns = COLUMN_SETS[column_name]
+        for protocol in protocols:
+            for rows in row_counts:
+                definitions, payloads = build_payloads(columns, rows, protocol)
+                for layer in layers:
+                    if layer == 'metadata':
+                        # Metadata cost doesn't depend on the row count
+                        if rows != row_counts[0]:
+                            continue
+                        units = len(definitions)
+                        size = sum(len(d) for d in definitions)
+                    else:
+                        units = rows
+                        size = sum(len(p) for p in payloads)
+
+                    times = measure(make_layer(layer, protocol, columns, definitions, payloads),
+                                    min_time, min_rounds)
+                    median = statistics.median(times)
+                    rows_per_sec = units / median
+                    mb_per_sec = size / median / 1e6
+                    shown_rows = units if layer != 'metadata' else f"{units} col"
+                    print(f"{layer:<10} {protocol:<7} {column_name:<9} {shown_rows:>8} "
+                          f"{median * 1000:>12.3f} {rows_per_sec:>14,.0f} {mb_per_sec:>9.1f}")
+
+                    benchmarks.append({
+                        'name': f"test_decode_{layer}_{protocol}_{column_name}_{units}[{label}]",
+                        'fullname': f"bench_decode.py::test_decode_{layer}_{protocol}_{column_name}_{units}[{label}]",
+                        'params': {'layer': layer, 'protocol': protocol, 'columns': column_name, 'rows': units},
+                        'stats': {
+                            'min': min(times),
+                            'max': max(times),
+                            'mean': statistics.mean(times),
+                            'median': median,
+                            'stddev': statistics.stdev(times) if len(times) > 1 else 0,
+                            'rounds': len(times),
+                            'iterations': 1,
+                        },
+                        'extra_info': {
+                            'rows_per_sec': rows_per_sec,
+                            'bytes_per_sec': size / median,
+                            'payload_bytes': size,
+                        },
+                    })
+    return benchmarks
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Socketless decoder microbenchmarks for pure-Python mariadb')
+    parser.add_argument('--layer', action='append', choices=LAYERS,
+                        help='Layer to benchmark, repeatable (default: all)')
+    parser.add_argument('--protocol', action='append', choices=PROTOCOLS,
+                        help='Row protocol, repeatable (default: text and binary)')
+    parser.add_argument('--columns', action='append', choices=list(COLUMN_SETS),
+                        help='Column set, repeatable (default: all)')
+    parser.add_argument('--rows', default=','.join(str(r) for r in DEFAULT_ROWS),
+                        help='Comma-separated row counts (default: %(default)s)')
+    parser.add_argument('--min-time', type=float, default=0.5,
+                        help='Minimum measured seconds per case (default: %(default)s)')
+    parser.add_argument('--min-rounds', type=int, default=3,
+                        help='Minimum rounds per case (default: %(default)s)')
+    parser.add_argument('--label', default=f"mariadb {mariadb.__version__}",
+                        help='Label used as driver name in JSON results (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    row_counts = [int(r) for r in args.rows.split(',') if r.strip()]
+    benchmarks = run(args.layer or LAYERS, args.protocol or PROTOCOLS, args.columns or list(COLUMN_SETS),
+                     row_counts, args.min_time, args.min_rounds, args.label)
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Database-free connection pool overhead microbenchmark.
+
+Plugs a zero-cost fake connection (ping, reset and close do nothing) into the
+pool adapters from pools.py and runs acquire + release in a tight loop on
+1..64 threads (sync pools) or tasks (async pools). What is left is the pool's
+own bookkeeping: locking, queueing, health checks and the lifecycle
+timestamps, and how that cost grows under contention.
+
+Pools:
+- mariadb_pool:       mariadb_pool.ConnectionPool
+- mariadb_pool_async: mariadb_pool.AsyncConnectionPool
+- dbutils:            DBUtils PooledDB
+
+Usage:
+    python bench_pool_overhead.py
+    python bench_pool_overhead.py --pool mariadb_pool --workers 1,8,64 --pool-size 4
+    python bench_pool_overhead.py --json pool_overhead.json
+"""
+
+import argparse
+import asyncio
+import json
+import platform
+import statistics
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+from pools import AsyncMariaDBPool, DBUtilsPool, MariaDBPool
+
+
+POOLS = ['mariadb_pool', 'mariadb_pool_async', 'dbutils']
+DEFAULT_WORKERS = [1, 2, 4, 8, 16, 32, 64]
+
+
+class FakeConnection:
+    """Connection stand-in with the methods the pools call, all free."""
+
+    server_status = 0
+    # DB-API connection exception attributes, DBUtils looks them up to detect failures
+    OperationalError = InterfaceError = InternalError = ConnectionError
+
+    def _set_pooled_connection(self, pooled_connection):
+        self._pooled_connection = pooled_connection
+
+    def ping(self, reconnect=False):
+        return None
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def reset(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeAsyncConnection(FakeConnection):
+    """Async connection stand-in."""
+
+    async def ping(self, reconnect=False):
+        return None
+
+    async def rollback(self):
+        pass
+
+    async def reset(self):
+        pass
+
+    async def close(self):
+        pass
+
+
+async def async_connect(**kwargs):
+    return FakeAsyncConnection()
+
+
+# Stands in for a DB-API driver module
+FAKE_DRIVER = SimpleNamespace(
+    threadsafety=1,
+    connect=lambda *args, **kwargs: FakeConnection(),
+    asyncConnect=async_connect,
+)
+
+
+def run_threads(pool, workers, iterations, rounds):
+    """Per-round wall times for `workers` threads each doing `iterations` acquire + release."""
+    start_barrier = threading.Barrier(workers + 1)
+    done_barrier = threading.Barrier(workers + 1)
+
+    def worker():
+        acquire = pool.acquire
+        release = pool.release
+        for _ in range(rounds):
+            start_barrier.wait()
+            for _ in range(iterations):
+                release(acquire())
+            done_barrier.wait()
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for thread in threads:
+        thread.start()
+    times = []
+    for _ in range(rounds):
+        start_barrier.wait()
+        start = time.perf_counter()
+        done_barrier.wait()
+        times.append(time.perf_counter() - start)
+    for thread in threads:
+        thread.join()
+    return times
+
+
+async def run_tasks(pool, workers, iterations, rounds):
+    """Per-round wall times for `workers` tasks each doing `iterations` acquire + release."""
+    await pool.open()
+
+    async def worker():
+        acquire = pool.acquire
+        release = pool.release
+        for _ in range(iterations):
+            await release(await acquire())
+
+    times = []
+    try:
+        for _ in range(rounds):
+            start = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(workers)))
+            times.append(time.perf_counter() - start)
+    finally:
+        await pool.close()
+    return times
+
+
+def measure(implementation, workers, pool_size, iterations, rounds):
+    """Return per-round times for one pool / worker count, after one warmup round."""
+    if implementation == 'mariadb_pool_async':
+        return asyncio.run(run_tasks(AsyncMariaDBPool(FAKE_DRIVER, pool_size), workers, iterations, rounds + 1))[1:]
+    pool = MariaDBPool(FAKE_DRIVER, pool_size) if implementation == 'mariadb_pool' else DBUtilsPool(FAKE_DRIVER, pool_size)
+    try:
+        return run_threads(pool, workers, iterations, rounds + 1)[1:]
+    finally:
+        pool.close()
+
+
+def run(implementations, worker_counts, pool_size, operations, rounds, label):
+    """Run the selected matrix and return pytest-benchmark compatible entries."""
+    benchmarks = []
+    print(f"{'Pool':<20} {'Workers':>8} {'ns/op':>10} {'Ops/s':>14} {'vs 1 worker':>12}")
+    print("-" * 68)
+    for implementation in implementations:
+        single = None
+        for workers in worker_counts:
+            iterations = max(1, operations // workers)
+            total = iterations * workers
+            times = measure(implementation, workers, pool_size, iterations, rounds)
+            median = statistics.median(times)
+            ns_per_op = median / total * 1e9
+            if single is None and workers == 1:
+                single = ns_per_op
+            relative = f"{ns_per_op / single:.2f}x" if single else "-"
+            print(f"{implementation:<20} {workers:>8} {ns_per_op:>10.0f} {total / median:>14,.0f} {relative:>12}")
+
+            name = f"test_pool_overhead_{implementation}_{workers}[{label}]"
+            benchmarks.append({
+                'name': name,
+                'fullname': f"bench_pool_overhead.py::{name}",
+                'params': {'pool': implementation, 'workers': workers, 'pool_size': pool_size,
+                           'operations': total},
+                'stats': {
+                    'min': min(times) / total,
+                    'max': max(times) / total,
+                    'mean': statistics.mean(times) / total,
+                    'median': median / total,
+                    'stddev': statistics.stdev(times) / total if len(times) > 1 else 0,
+                    'rounds': len(times),
+                    'iterations': total,
+                },
+                'extra_info': {'ns_per_op': ns_per_op, 'ops_per_sec': total / median},
+            })
+    return benchmarks
+
+
+def pool_version():
+    try:
+        import mariadb_pool
+        return f"mariadb_pool {mariadb_pool.__version__}"
+    except ImportError:
+        return "mariadb_pool"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Database-free connection pool overhead microbenchmark')
+    parser.add_argument('--pool', action='append', choices=POOLS,
+                        help='Pool implementation, repeatable (default: all)')
+    parser.add_argument('--workers', default=','.join(str(w) for w in DEFAULT_WORKERS),
+                        help='Comma-separated thread/task counts (default: %(default)s)')
+    parser.add_argument('--pool-size', type=int, default=8,
+                        help='Connections in the pool (default: %(default)s)')
+    parser.add_argument('--operations', type=int, default=20000,
+                        help='Acquire + release pairs per round, split across workers (default: %(default)s)')
+    parser.add_argument('--rounds', type=int, default=10,
+                        help='Measured rounds per case (default: %(default)s)')
+    parser.add_argument('--label', default=pool_version(),
+                        help='Label used as driver name in JSON results (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    worker_counts = [int(w) for w in args.workers.split(',') if w.strip()]
+    benchmarks = run(args.pool or POOLS, worker_counts, args.pool_size, args.operations, args.rounds, args.label)
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,10 +10,16 @@ Benchmark configuration and fixtures for comparing mariadb, mariadb_c, and pymys
 
 import os
 import sys
+import time
 import pytest
 import pytest_asyncio
 from contextlib import asynccontextmanager
 
+from event_loops import EVENT_LOOP, event_loop_policy as make_event_loop_policy
+from latency import latency_summary
+from memory import MEMORY_ENABLED, measure_memory
+from tls import TLS_MODE, tls_options
+
 
 # Database configuration from environment variables
 DB_CONFIG = {
@@ -24,6 +30,15 @@ DB_CONFIG = {
     'database': os.environ.get('TEST_DB_DATABASE', 'testp'),
 }
 
+# Batch insert tables created by create_tables(), besides perfTestTextBatch
+BATCH_TABLES = {
+    'perfTestIntBatch': "i0 INT, i1 INT, i2 INT, i3 INT",
+    'perfTestMixedBatch': "i0 BIGINT, d0 DOUBLE, n0 DECIMAL(12,2), t0 VARCHAR(100), dt0 DATETIME",
+}
+
+# Every table create_tables() knows; runners outside pytest create the ones they use
+BENCHMARK_TABLES = ['test100', 'perfTestTextBatch'] + list(BATCH_TABLES)
+
 # Global variable to store mysql_connector implementation type
 _mysql_connector_impl = None
 
@@ -133,8 +148,13 @@ def warmup_session(driver, driver_name):
     driver_key = id(driver)
     if driver_key not in _driver_warmed_up:
         # Create a temporary connection just for warmup
-        warmup_conn = driver.connect(**DB_CONFIG)
+        warmup_conn = driver.connect(**connect_config(driver_name))
         warmup_cursor = warmup_conn.cursor()
+        _tls_versions[driver_name] = session_tls_version(warmup_cursor)
+        if TLS_MODE != 'off' and _tls_versions[driver_name] is None:
+            warmup_cursor.close()
+            warmup_conn.close()
+            pytest.skip(f"{driver_name} connected without TLS, the server has no TLS enabled")
         
         # Warm up with simple queries (simulates running test_do_1 first)
         for _ in range(6000):
@@ -160,7 +180,7 @@ def connection(driver, driver_name):
         pytest.skip(f"{driver_name} requires async tests")
     
     # Now create the actual test connection
-    conn = driver.connect(**DB_CONFIG)
+    conn = driver.connect(**connect_config(driver_name))
     yield conn
     try:
         conn.close()
@@ -184,6 +204,53 @@ async def get_async_cursor(connection, driver_name):
             yield cursor
 
 
+def connect_config(driver_name, tls=TLS_MODE, **config):
+    """DB_CONFIG with `driver_name`'s arguments for TLS `tls`, overridden by `config`."""
+    merged = dict(DB_CONFIG)
+    merged.update(tls_options(driver_name, tls))
+    merged.update(config)
+    return merged
+
+
+# driver_name: TLS version the benchmark connections negotiated, None over plaintext
+_tls_versions = {}
+
+
+def tls_version(row):
+    """Value of a SHOW STATUS LIKE 'Ssl_version' row, None over plaintext."""
+    if not row or not row[1]:
+        return None
+    return row[1].decode() if isinstance(row[1], (bytes, bytearray)) else row[1]
+
+
+def session_tls_version(cursor):
+    """TLS version of the cursor's connection, None over plaintext."""
+    cursor.execute("SHOW SESSION STATUS LIKE 'Ssl_version'")
+    return tls_version(cursor.fetchone())
+
+
+async def session_tls_version_async(connection, driver_name):
+    """session_tls_version for an async connection."""
+    async with get_async_cursor(connection, driver_name) as cursor:
+        await cursor.execute("SHOW SESSION STATUS LIKE 'Ssl_version'")
+        return tls_version(await cursor.fetchone())
+
+
+async def async_connect(driver_name, tls=TLS_MODE, **config):
+    """Open an async connection with the driver's own connect coroutine, over TLS `tls`."""
+    config = connect_config(driver_name, tls, **config)
+    if driver_name == 'async-mariadb':
+        import mariadb
+        return await mariadb.asyncConnect(**config)
+    elif driver_name == 'mysql_connector_async':
+        import mysql.connector.aio
+        return await mysql.connector.aio.connect(**config)
+    elif driver_name == 'asyncmy':
+        import asyncmy
+        return await asyncmy.connect(**config)
+    raise ValueError(f"{driver_name} doesn't support async")
+
+
 @pytest_asyncio.fixture(scope='function')
 async def async_connection(driver, driver_name):
     """Create an async database connection for each test."""
@@ -191,15 +258,12 @@ async def async_connection(driver, driver_name):
     if driver_name not in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
         pytest.skip(f"{driver_name} doesn't support async")
     
-    if driver_name == 'async-mariadb':
-        import mariadb
-        conn = await mariadb.asyncConnect(**DB_CONFIG)
-    elif driver_name == 'mysql_connector_async':
-        import mysql.connector.aio
-        conn = await mysql.connector.aio.connect(**DB_CONFIG)
-    elif driver_name == 'asyncmy':
-        import asyncmy
-        conn = await asyncmy.connect(**DB_CONFIG)
+    conn = await async_connect(driver_name)
+    if driver_name not in _tls_versions:
+        _tls_versions[driver_name] = await session_tls_version_async(conn, driver_name)
+    if TLS_MODE != 'off' and _tls_versions[driver_name] is None:
+        await conn.close()
+        pytest.skip(f"{driver_name} connected without TLS, the server has no TLS enabled")
     
     yield conn
     try:
@@ -208,6 +272,62 @@ async def async_connection(driver, driver_name):
         pass
 
 
+def table_statements(table):
+    """
+    Statements (re)creating benchmark `table`, each a list of alternatives of
+    which the first the server accepts is used: the MEMORY and BLACKHOLE
+    engines are preferred but optional.
+    """
+    if table == 'test100':
+        # 100 integer columns, one row
+        create = f"CREATE TABLE test100 ({','.join(f'i{i} int' for i in range(1, 101))})"
+        return [["DROP TABLE IF EXISTS test100"],
+                [create + " ENGINE = MEMORY", create],
+                [f"INSERT INTO test100 VALUES ({','.join(str(i) for i in range(1, 101))})"]]
+    if table == 'perfTestTextBatch':
+        id_column, columns = "id MEDIUMINT NOT NULL AUTO_INCREMENT", "t0 text"
+    else:
+        id_column, columns = "id INT NOT NULL AUTO_INCREMENT", BATCH_TABLES[table]
+    create = f"CREATE TABLE {table} ({id_column}, {columns}, PRIMARY KEY (id)) COLLATE='utf8mb4_unicode_ci'"
+    return [[f"DROP TABLE IF EXISTS {table}"],
+            [create + " ENGINE = BLACKHOLE", create]]
+
+
+def create_tables(connection, tables=None):
+    """(Re)create the benchmark `tables` (default: all) over a DB-API connection."""
+    cursor = connection.cursor()
+    try:
+        for table in BENCHMARK_TABLES if tables is None else tables:
+            for alternatives in table_statements(table):
+                for sql in alternatives[:-1]:
+                    try:
+                        cursor.execute(sql)
+                        break
+                    except Exception:
+                        pass
+                else:
+                    cursor.execute(alternatives[-1])
+        connection.commit()
+    finally:
+        cursor.close()
+
+
+async def create_tables_async(connection, driver_name, tables=None):
+    """create_tables() over an async driver's connection."""
+    async with get_async_cursor(connection, driver_name) as cursor:
+        for table in BENCHMARK_TABLES if tables is None else tables:
+            for alternatives in table_statements(table):
+                for sql in alternatives[:-1]:
+                    try:
+                        await cursor.execute(sql)
+                        break
+                    except Exception:
+                        pass
+                else:
+                    await cursor.execute(alternatives[-1])
+    await connection.commit()
+
+
 @pytest.fixture(scope='session')
 def setup_database():
     """Setup test database tables once per session."""
@@ -225,36 +345,13 @@ def setup_database():
         except:
             pass
         
-        # Create test100 table (100 integer columns)
-        cursor.execute("DROP TABLE IF EXISTS test100")
-        cols = ",".join([f"i{i} int" for i in range(1, 101)])
-        table_sql = f"CREATE TABLE test100 ({cols})"
-        try:
-            cursor.execute(table_sql + " ENGINE = MEMORY")
-        except:
-            cursor.execute(table_sql)
-        vals = ",".join([str(i) for i in range(1, 101)])
-        cursor.execute(f"INSERT INTO test100 VALUES ({vals})")
+        create_tables(conn)
         
         # Warm up the test100 table by accessing it multiple times
         for _ in range(100):
             cursor.execute("SELECT * FROM test100")
             cursor.fetchone()
         
-        # Create perfTestTextBatch table
-        cursor.execute("DROP TABLE IF EXISTS perfTestTextBatch")
-        create_table = (
-            "CREATE TABLE perfTestTextBatch ("
-            "id MEDIUMINT NOT NULL AUTO_INCREMENT, "
-            "t0 text, "
-            "PRIMARY KEY (id)"
-            ") COLLATE='utf8mb4_unicode_ci'"
-        )
-        try:
-            cursor.execute(create_table + " ENGINE = BLACKHOLE")
-        except:
-            cursor.execute(create_table)
-        
         conn.commit()
     finally:
         cursor.close()
@@ -266,8 +363,8 @@ def setup_database():
     conn = mariadb.connect(**DB_CONFIG)
     cursor = conn.cursor()
     try:
-        cursor.execute("DROP TABLE IF EXISTS test100")
-        cursor.execute("DROP TABLE IF EXISTS perfTestTextBatch")
+        for table in BENCHMARK_TABLES:
+            cursor.execute(f"DROP TABLE IF EXISTS {table}")
         conn.commit()
     finally:
         cursor.close()
@@ -278,12 +375,76 @@ def setup_database():
 _async_benchmark_results = {}
 
 
+def per_operation(result, operations, **params):
+    """
+    Rescale an async_benchmark result measured over ``operations`` operations
+    per round to per-operation times, so 1 / mean is aggregate ops/s.
+    Extra keyword arguments are stored as benchmark params in the JSON output.
+    The round times are dropped: divided by ``operations`` they are averages,
+    not per-operation latencies, so no latency percentiles are recorded.
+    """
+    scaled = dict(result)
+    for key in ('min', 'max', 'mean', 'median', 'stddev'):
+        if key in scaled:
+            scaled[key] = scaled[key] / operations
+    scaled.pop('raw_times', None)
+    memory = scaled.get('extra_info', {}).get('memory')
+    if memory:
+        scaled['extra_info'] = dict(scaled['extra_info'], memory=dict(memory, blocks=memory['blocks'] / operations))
+    scaled['params'] = dict(result.get('params', {}), operations=operations, **params)
+    return scaled
+
+
+async def mean_call_time(func, rounds, warmup_rounds=0):
+    """
+    Mean seconds per call of coroutine function `func`: the baseline a test
+    compares its benchmark with, measured in the same test so the comparison
+    doesn't depend on which other tests ran before it.
+    """
+    for _ in range(warmup_rounds):
+        await func()
+    start = time.perf_counter()
+    for _ in range(rounds):
+        await func()
+    return (time.perf_counter() - start) / rounds
+
+
+@pytest.fixture
+def async_benchmark(async_benchmark):
+    """
+    pytest-async-benchmark's fixture; with TEST_DB_MEMORY=1 the benchmarked
+    function is then profiled (see memory.py) into extra_info['memory'].
+    """
+    if not MEMORY_ENABLED:
+        return async_benchmark
+
+    async def benchmark(func, *args, **kwargs):
+        result = dict(await async_benchmark(func, *args, **kwargs))
+        call_kwargs = {k: v for k, v in kwargs.items() if k not in ('rounds', 'iterations', 'warmup_rounds')}
+        memory = await measure_memory(func, *args, **call_kwargs)
+        result['extra_info'] = dict(result.get('extra_info', {}), memory=memory)
+        return result
+    return benchmark
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy():
+    """Override of pytest-asyncio's fixture: every async test runs on TEST_DB_EVENT_LOOP (see event_loops.py)."""
+    return make_event_loop_policy(EVENT_LOOP)
+
+
 @pytest.fixture
 def capture_benchmark_result(request):
     """Fixture to capture and store benchmark results."""
     def capture(result):
         if isinstance(result, dict) and ('mean' in result or 'times' in result):
             print(f"\nDEBUG: Capturing result for {request.node.nodeid}")
+            driver_name = getattr(request.node, 'callspec', None) and request.node.callspec.params.get('driver_name')
+            params = {'tls': TLS_MODE}
+            if driver_name in _tls_versions:
+                params['tls_version'] = _tls_versions[driver_name]
+            params.update(result.get('params', {}))
+            result = dict(result, params=dict(params, event_loop=EVENT_LOOP))
             _async_benchmark_results[request.node.nodeid] = {
                 'nodeid': request.node.nodeid,
                 'name': request.node.name,
@@ -347,11 +508,19 @@ def pytest_sessionfinish(session, exitstatus):
             if not times and mean_time > 0:
                 # Use mean if we have it but not times array
                 times = [mean_time] * rounds
+
+            # Per-round latencies as an HDR-style histogram with the percentiles
+            # the number of rounds supports
+            extra_info = dict(results.get('extra_info', {})) if isinstance(results, dict) else {}
+            raw_times = results.get('raw_times') if isinstance(results, dict) else None
+            if raw_times and 'latency' not in extra_info:
+                extra_info['latency'] = latency_summary(raw_times)
             
             benchmark_data = {
                 'name': result_data['name'],
                 'fullname': nodeid,
-                'params': {},
+                'params': results.get('params', {}) if isinstance(results, dict) else {},
+                'extra_info': extra_info,
                 'stats': {
                     'min': min_time if min_time > 0 else (min(times) if times else 0),
                     'max': max_time if max_time > 0 else (max(times) if times else 0),
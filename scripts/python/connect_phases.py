@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Per-phase timing of connection establishment.
+
+While measure_phases() runs, socket.socket and ssl.SSLContext.sslsocket_class
+are replaced with subclasses timestamping the points that separate the
+phases of a connect(), as seen by the client:
+
+- tcp:            connect() call until the TCP connection is up
+- greeting:       until the server handshake packet is received
+- tls:            SSL request and TLS handshake (0 without TLS)
+- auth:           handshake response and auth plugin exchange, until the
+                  first command packet (sequence id 0) is sent
+- session_setup:  the driver's own queries after authentication (SET NAMES,
+                  autocommit, ...), until connect() returns
+- close:          close()
+
+Only drivers doing their I/O through Python sockets can be split this way
+(mariadb pure Python, pymysql, mysql_connector pure Python); for the others
+measure_phases() returns None. The timestamps cost a few microseconds per
+call, which is why the timed benchmark rounds run without them.
+"""
+
+import socket
+import ssl
+import statistics
+import time
+
+
+PHASES = ['tcp', 'greeting', 'tls', 'auth', 'session_setup', 'close']
+
+# Marks of the connection being opened, None outside measure_phases()
+_marks = None
+
+
+def _mark(name):
+    if _marks is not None and name not in _marks:
+        _marks[name] = time.perf_counter()
+
+
+def _mark_sent(data):
+    # every command starts with sequence id 0, the handshake response and auth packets don't
+    if _marks is not None and 'greeting' in _marks and len(data) >= 4 and data[3] == 0:
+        _mark('command')
+
+
+class TimedSocket(socket.socket):
+    def connect(self, address):
+        super().connect(address)
+        _mark('connected')
+
+    def recv(self, *args):
+        data = super().recv(*args)
+        if data:
+            _mark('greeting')
+        return data
+
+    def recv_into(self, *args):
+        received = super().recv_into(*args)
+        if received:
+            _mark('greeting')
+        return received
+
+    def sendall(self, data, *args):
+        _mark_sent(data)
+        return super().sendall(data, *args)
+
+
+class TimedSSLSocket(ssl.SSLSocket):
+    def do_handshake(self, *args):
+        super().do_handshake(*args)
+        _mark('tls')
+
+    def sendall(self, data, *args):
+        _mark_sent(data)
+        return super().sendall(data, *args)
+
+
+def _phases(marks, start, connected, closed):
+    if 'connected' not in marks or 'greeting' not in marks:
+        return None
+    auth_start = marks.get('tls', marks['greeting'])
+    command = marks.get('command', connected)
+    return {
+        'tcp': marks['connected'] - start,
+        'greeting': marks['greeting'] - marks['connected'],
+        'tls': auth_start - marks['greeting'],
+        'auth': command - auth_start,
+        'session_setup': connected - command,
+        'close': closed - connected,
+    }
+
+
+def measure_phases(connect, close, rounds):
+    """
+    Median seconds per phase over `rounds` connect() / close(connection)
+    calls, None when the driver's sockets can't be observed.
+    """
+    global _marks
+    original_socket = socket.socket
+    original_sslsocket = ssl.SSLContext.sslsocket_class
+    samples = []
+    socket.socket = TimedSocket
+    ssl.SSLContext.sslsocket_class = TimedSSLSocket
+    try:
+        for _ in range(rounds):
+            _marks = {}
+            start = time.perf_counter()
+            connection = connect()
+            connected = time.perf_counter()
+            marks, _marks = _marks, None
+            close(connection)
+            phases = _phases(marks, start, connected, time.perf_counter())
+            if phases is None:
+                return None
+            samples.append(phases)
+    finally:
+        _marks = None
+        socket.socket = original_socket
+        ssl.SSLContext.sslsocket_class = original_sslsocket
+    return {phase: statistics.median(sample[phase] for sample in samples) for phase in PHASES}
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Event loop implementations the async benchmarks can run on.
+
+Selected with TEST_DB_EVENT_LOOP (run_benchmarks.py / run_async_concurrency.py
+--event-loop), the pytest suite installing it through pytest-asyncio's
+event_loop_policy fixture:
+
+- asyncio:   the platform default policy (a selector loop on Unix, a proactor
+             loop on Windows)
+- selector:  asyncio.SelectorEventLoop
+- proactor:  asyncio.ProactorEventLoop, Windows only
+- uvloop:    uvloop's libuv loop, when installed
+- winloop:   winloop, the Windows port of uvloop, when installed
+
+Results record the loop in params['event_loop'], so the same async driver
+can be compared on every loop.
+"""
+
+import asyncio
+import os
+import sys
+
+
+EVENT_LOOPS = ['asyncio', 'selector', 'proactor', 'uvloop', 'winloop']
+DEFAULT_EVENT_LOOP = 'asyncio'
+EVENT_LOOP = os.environ.get('TEST_DB_EVENT_LOOP', DEFAULT_EVENT_LOOP)
+
+
+class SelectorEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    def new_event_loop(self):
+        return asyncio.SelectorEventLoop()
+
+
+class ProactorEventLoopPolicy(asyncio.DefaultEventLoopPolicy):
+    def new_event_loop(self):
+        return asyncio.ProactorEventLoop()
+
+
+def event_loop_policy(name=EVENT_LOOP):
+    """
+    Policy creating `name` event loops. Raises ValueError for an unknown loop
+    or one that isn't available on this platform / installation.
+    """
+    if name == 'asyncio':
+        return asyncio.DefaultEventLoopPolicy()
+    if name == 'selector':
+        return SelectorEventLoopPolicy()
+    if name == 'proactor':
+        if sys.platform != 'win32':
+            raise ValueError("proactor event loop requires Windows")
+        return ProactorEventLoopPolicy()
+    if name in ('uvloop', 'winloop'):
+        try:
+            module = __import__(name)
+        except ImportError:
+            raise ValueError(f"{name} event loop requires: pip install {name}")
+        return module.EventLoopPolicy()
+    raise ValueError(f"unknown event loop {name!r}, expected one of {', '.join(EVENT_LOOPS)}")
+
+
+def install_event_loop(name=EVENT_LOOP):
+    """Make asyncio.run() and new_event_loop() create `name` loops."""
+    asyncio.set_event_loop_policy(event_loop_policy(name))
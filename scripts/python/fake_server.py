@@ -0,0 +1,645 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Local MySQL/MariaDB wire-protocol stand-in server.
+
+Speaks just enough of the protocol (handshake, COM_QUERY including LOAD DATA
+LOCAL INFILE, COM_STMT_PREPARE, COM_STMT_EXECUTE, COM_STMT_BULK_EXECUTE and
+the usual housekeeping commands)
+to answer the benchmark workloads with canned result sets, so drivers can be
+measured on pure client-side cost without server CPU or scheduler noise.
+SHOW SESSION STATUS LIKE 'Com_stmt_prepare' (or 'Com_stmt_close') returns
+the connection's own counter, as a real server would.
+
+With --tls-cert / --tls-key the server offers TLS (see tls.py) and
+reports the negotiated Ssl_version and Ssl_cipher the same way, so the
+client-side cost of encryption can be measured too.
+
+Encoded responses are cached per statement, so once warmed up the server only
+does a dictionary lookup and a sendall() per command.
+
+Usage:
+    # Start standalone (prints the listening port)
+    python fake_server.py --port 3307
+
+    # Offering TLS
+    python fake_server.py --port 3307 --tls-cert tls/server-cert.pem --tls-key tls/server-key.pem
+
+    # Or let the runner start it
+    python run_benchmarks.py --server fake --driver pymysql
+"""
+
+import argparse
+import os
+import re
+import socket
+import socketserver
+import ssl
+import struct
+import subprocess
+import sys
+import threading
+
+
+SERVER_VERSION = "5.5.5-11.4.0-MariaDB-fake"
+AUTH_PLUGIN = "mysql_native_password"
+CHARSET_UTF8MB4 = 45
+CHARSET_BINARY = 63
+MAX_PACKET = 0xFFFFFF
+
+# Capabilities (see mariadb_shared/constants/CAPABILITY.py)
+CLIENT_CONNECT_WITH_DB = 8
+CLIENT_LOCAL_FILES = 128
+CLIENT_IGNORE_SPACE = 256
+CLIENT_PROTOCOL_41 = 512
+CLIENT_SSL = 2048
+CLIENT_TRANSACTIONS = 8192
+CLIENT_SECURE_CONNECTION = 32768
+CLIENT_MULTI_STATEMENTS = 1 << 16
+CLIENT_MULTI_RESULTS = 1 << 17
+CLIENT_PS_MULTI_RESULTS = 1 << 18
+CLIENT_PLUGIN_AUTH = 1 << 19
+CLIENT_CONNECT_ATTRS = 1 << 20
+CLIENT_PLUGIN_AUTH_LENENC_CLIENT_DATA = 1 << 21
+MARIADB_CLIENT_STMT_BULK_OPERATIONS = 1 << 34
+
+SERVER_CAPABILITIES = (
+    CLIENT_CONNECT_WITH_DB | CLIENT_LOCAL_FILES | CLIENT_IGNORE_SPACE | CLIENT_PROTOCOL_41 |
+    CLIENT_TRANSACTIONS | CLIENT_SECURE_CONNECTION | CLIENT_MULTI_STATEMENTS |
+    CLIENT_MULTI_RESULTS | CLIENT_PS_MULTI_RESULTS | CLIENT_PLUGIN_AUTH |
+    CLIENT_CONNECT_ATTRS | CLIENT_PLUGIN_AUTH_LENENC_CLIENT_DATA |
+    MARIADB_CLIENT_STMT_BULK_OPERATIONS
+)
+
+SERVER_STATUS_AUTOCOMMIT = 0x0002
+
+# Commands
+COM_QUIT = 0x01
+COM_INIT_DB = 0x02
+COM_QUERY = 0x03
+COM_PING = 0x0E
+COM_CHANGE_USER = 0x11
+COM_STMT_PREPARE = 0x16
+COM_STMT_EXECUTE = 0x17
+COM_STMT_SEND_LONG_DATA = 0x18
+COM_STMT_CLOSE = 0x19
+COM_STMT_RESET = 0x1A
+COM_SET_OPTION = 0x1B
+COM_RESET_CONNECTION = 0x1F
+COM_STMT_BULK_EXECUTE = 0xFA
+
+# MariaDB "execute the statement prepared last" id, used by pipelined PREPARE+EXECUTE
+LAST_PREPARED_STMT_ID = 0xFFFFFFFF
+
+# Column types
+TYPE_LONG = 3
+TYPE_LONGLONG = 8
+TYPE_DATETIME = 12
+TYPE_NEWDECIMAL = 246
+TYPE_VAR_STRING = 253
+
+UNSIGNED_FLAG = 32
+BINARY_FLAG = 128
+NOT_NULL_FLAG = 1
+
+
+# =========================================================================
+# Packet encoding
+# =========================================================================
+
+def lenenc_int(value):
+    """Encode a length-encoded integer."""
+    if value < 251:
+        return bytes((value,))
+    if value < 0x10000:
+        return b'\xfc' + struct.pack('<H', value)
+    if value < 0x1000000:
+        return b'\xfd' + struct.pack('<I', value)[:3]
+    return b'\xfe' + struct.pack('<Q', value)
+
+
+def lenenc_str(value):
+    """Encode a length-encoded string."""
+    return lenenc_int(len(value)) + value
+
+
+def packet(seq, payload):
+    """Frame a payload, splitting it into 16MB chunks if needed."""
+    out = bytearray()
+    while True:
+        chunk = payload[:MAX_PACKET]
+        payload = payload[MAX_PACKET:]
+        out += struct.pack('<I', len(chunk))[:3] + bytes((seq & 0xFF,)) + chunk
+        seq += 1
+        if len(chunk) < MAX_PACKET:
+            return bytes(out), seq
+
+
+def ok_payload(affected_rows=0, last_insert_id=0):
+    return (b'\x00' + lenenc_int(affected_rows) + lenenc_int(last_insert_id)
+            + struct.pack('<HH', SERVER_STATUS_AUTOCOMMIT, 0))
+
+
+def eof_payload():
+    return b'\xfe' + struct.pack('<HH', 0, SERVER_STATUS_AUTOCOMMIT)
+
+
+def err_payload(code, message):
+    return (b'\xff' + struct.pack('<H', code) + b'#HY000'
+            + message.encode('utf-8', 'replace'))
+
+
+def encode_binary_datetime(value):
+    """Encode a datetime in binary protocol format (length byte + fields)."""
+    if value.microsecond:
+        return b'\x0b' + struct.pack('<HBBBBBI', value.year, value.month, value.day, value.hour,
+                                      value.minute, value.second, value.microsecond)
+    return b'\x07' + struct.pack('<HBBBBB', value.year, value.month, value.day, value.hour,
+                                  value.minute, value.second)
+
+
+class Column:
+    """A canned result set column: name, type and the value to emit per row."""
+
+    def __init__(self, name, type_code, value=None, length=20, flags=0):
+        self.name = name
+        self.type_code = type_code
+        self.value = value
+        self.length = length
+        self.flags = flags
+
+    @property
+    def charset(self):
+        return CHARSET_UTF8MB4 if self.type_code == TYPE_VAR_STRING else CHARSET_BINARY
+
+    @property
+    def decimals(self):
+        if self.type_code == TYPE_NEWDECIMAL and self.value is not None:
+            return max(-self.value.as_tuple().exponent, 0)
+        if self.type_code == TYPE_DATETIME and self.value is not None and self.value.microsecond:
+            return 6
+        return 0
+
+    def definition(self):
+        """Encode the column definition packet payload (protocol 4.1)."""
+        name = self.name.encode('utf-8')
+        return (lenenc_str(b'def') + lenenc_str(b'') + lenenc_str(b'') + lenenc_str(b'')
+                + lenenc_str(name) + lenenc_str(name) + b'\x0c'
+                + struct.pack('<HIBHB', self.charset, self.length, self.type_code,
+                              self.flags, self.decimals)
+                + b'\x00\x00')
+
+
+class ResultSet:
+    """Canned result set. ``row_values(i)`` yields the column values of row i."""
+
+    def __init__(self, columns, row_count=1, row_values=None):
+        self.columns = columns
+        self.row_count = row_count
+        self._row_values = row_values
+
+    def row_values(self, index):
+        if self._row_values is not None:
+            return self._row_values(index)
+        return [c.value for c in self.columns]
+
+    def text_rows(self):
+        for i in range(self.row_count):
+            out = bytearray()
+            for value in self.row_values(i):
+                if value is None:
+                    out += b'\xfb'
+                else:
+                    if not isinstance(value, bytes):
+                        value = str(value).encode('utf-8')
+                    out += lenenc_str(value)
+            yield bytes(out)
+
+    def binary_rows(self):
+        bitmap_len = (len(self.columns) + 7 + 2) // 8
+        for i in range(self.row_count):
+            bitmap = bytearray(bitmap_len)
+            values = bytearray()
+            for pos, (column, value) in enumerate(zip(self.columns, self.row_values(i))):
+                if value is None:
+                    bitmap[(pos + 2) // 8] |= 1 << ((pos + 2) % 8)
+                elif column.type_code == TYPE_LONGLONG:
+                    values += struct.pack('<Q' if column.flags & UNSIGNED_FLAG else '<q', value)
+                elif column.type_code == TYPE_LONG:
+                    values += struct.pack('<i', value)
+                elif column.type_code == TYPE_DATETIME:
+                    values += encode_binary_datetime(value)
+                else:
+                    if not isinstance(value, bytes):
+                        value = str(value).encode('utf-8')
+                    values += lenenc_str(value)
+            yield b'\x00' + bytes(bitmap) + bytes(values)
+
+    def encode(self, binary=False):
+        """Encode the whole response: column count, definitions, rows, EOFs."""
+        out = bytearray()
+        data, seq = packet(1, lenenc_int(len(self.columns)))
+        out += data
+        for column in self.columns:
+            data, seq = packet(seq, column.definition())
+            out += data
+        data, seq = packet(seq, eof_payload())
+        out += data
+        for row in (self.binary_rows() if binary else self.text_rows()):
+            data, seq = packet(seq, row)
+            out += data
+        data, seq = packet(seq, eof_payload())
+        out += data
+        return bytes(out)
+
+
+# =========================================================================
+# Canned workloads
+# =========================================================================
+
+_LOCAL_INFILE_RE = re.compile(r"^\s*LOAD\s+DATA\s+LOCAL\s+INFILE\s+'([^']*)'", re.IGNORECASE)
+_SEQ_RE = re.compile(r'\bFROM\s+seq_1_to_(\d+)\b', re.IGNORECASE)
+_SELECT_LIST_RE = re.compile(r'^\s*SELECT\s+(.*?)(?:\s+FROM\s+.*)?$', re.IGNORECASE | re.DOTALL)
+_REPEAT_RE = re.compile(r"^REPEAT\s*\(\s*'((?:[^'\\]|\\.)*)'\s*,\s*(\d+)\s*\)$", re.IGNORECASE)
+_INT_RE = re.compile(r'^-?\d+$')
+
+
+def split_select_list(select_list):
+    """Split a SELECT list on top-level commas, ignoring quoted text and parentheses."""
+    items, current, depth, quote = [], [], 0, None
+    for ch in select_list:
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            items.append(''.join(current).strip())
+            current = []
+            continue
+        current.append(ch)
+    items.append(''.join(current).strip())
+    return [item for item in items if item]
+
+
+def column_for_expression(expr, seq_table=False):
+    """Build a Column for a SELECT list expression (literal, REPEAT() or seq)."""
+    name = expr
+    alias = re.match(r'^(.*?)\s+(?:AS\s+)?`?(\w+)`?$', expr, re.IGNORECASE | re.DOTALL)
+    if alias and not expr.endswith("'"):
+        expr, name = alias.group(1).strip(), alias.group(2)
+    if seq_table and expr.lower() == 'seq':
+        return Column(name, TYPE_LONGLONG, None, 20, UNSIGNED_FLAG | NOT_NULL_FLAG)
+    if _INT_RE.match(expr):
+        return Column(name, TYPE_LONGLONG, int(expr), len(expr), NOT_NULL_FLAG)
+    if len(expr) >= 2 and expr[0] == expr[-1] and expr[0] in ("'", '"'):
+        value = expr[1:-1].encode('utf-8')
+        return Column(name, TYPE_VAR_STRING, value, max(len(value), 1) * 4, NOT_NULL_FLAG)
+    repeat = _REPEAT_RE.match(expr)
+    if repeat:
+        value = repeat.group(1).encode('utf-8') * int(repeat.group(2))
+        return Column(name, TYPE_VAR_STRING, value, max(len(value), 1) * 4, NOT_NULL_FLAG)
+    return Column(name, TYPE_VAR_STRING, None, 255)
+
+
+def canned_result(sql):
+    """
+    Return the canned ResultSet for a statement, or None if it only gets an OK.
+
+    Understands the workloads used by the benchmark suite: SELECT 1, SELECT ...
+    FROM seq_1_to_N, SELECT * FROM test100 and literal-only SELECTs.
+    Everything else (DO, INSERT, SET, DDL) is answered with an OK packet.
+    """
+    stripped = sql.strip().rstrip(';')
+    if not stripped[:6].upper() == 'SELECT':
+        return None
+
+    if re.search(r'\bFROM\s+test100\b', stripped, re.IGNORECASE):
+        columns = [Column(f"i{i}", TYPE_LONG, i, 11) for i in range(1, 101)]
+        return ResultSet(columns)
+
+    match = _SELECT_LIST_RE.match(stripped)
+    items = split_select_list(match.group(1)) if match else ['1']
+    seq = _SEQ_RE.search(stripped)
+    if seq:
+        columns = [column_for_expression(item, seq_table=True) for item in items]
+        seq_positions = [pos for pos, c in enumerate(columns)
+                         if c.type_code == TYPE_LONGLONG and c.value is None]
+
+        def row_values(index, columns=columns, seq_positions=seq_positions):
+            values = [c.value for c in columns]
+            for pos in seq_positions:
+                values[pos] = index + 1
+            return values
+
+        return ResultSet(columns, int(seq.group(1)), row_values)
+
+    return ResultSet([column_for_expression(item) for item in items])
+
+
+_SHOW_STATUS_RE = re.compile(r"^\s*SHOW\s+(?:SESSION\s+)?STATUS\s+LIKE\s+'([^']*)'", re.IGNORECASE)
+
+
+def status_result(status, pattern):
+    """SHOW STATUS LIKE result over the connection's counters (exact names only)."""
+    columns = [Column('Variable_name', TYPE_VAR_STRING, length=256),
+               Column('Value', TYPE_VAR_STRING, length=4096)]
+    names = [name for name in status if name.lower() == pattern.lower()]
+    return ResultSet(columns, len(names),
+                     lambda index: [names[index].encode(), str(status[names[index]]).encode()])
+
+
+def count_placeholders(sql):
+    """Count '?' placeholders outside of quoted strings."""
+    count, quote = 0, None
+    for ch in sql:
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"', '`'):
+            quote = ch
+        elif ch == '?':
+            count += 1
+    return count
+
+
+def insert_row_count(sql):
+    """Rough affected-rows count for a (possibly rewritten multi-value) INSERT."""
+    if sql.lstrip()[:6].upper() != 'INSERT':
+        return 0
+    return sql.count('),(') + sql.count('), (') + 1
+
+
+# =========================================================================
+# Server
+# =========================================================================
+
+class FakeServerHandler(socketserver.BaseRequestHandler):
+    """Handle one client connection: handshake, then a command loop."""
+
+    def setup(self):
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.buffer = bytearray()
+        self.statements = {}
+        self.last_stmt_id = 0
+        self.status = {'Com_stmt_prepare': 0, 'Com_stmt_close': 0}
+
+    def read_packet(self):
+        """Read one (possibly multi-part) client packet. Returns (seq, payload) or None on EOF."""
+        payload = bytearray()
+        while True:
+            header = self._read_exact(4)
+            if header is None:
+                return None
+            length = header[0] | (header[1] << 8) | (header[2] << 16)
+            body = self._read_exact(length)
+            if body is None:
+                return None
+            payload += body
+            if length < MAX_PACKET:
+                return header[3], bytes(payload)
+
+    def _read_exact(self, size):
+        while len(self.buffer) < size:
+            data = self.request.recv(max(65536, size - len(self.buffer)))
+            if not data:
+                return None
+            self.buffer += data
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def _recv_exact(self, size):
+        """Unbuffered _read_exact, leaving whatever follows in the socket."""
+        data = b''
+        while len(data) < size:
+            chunk = self.request.recv(size - len(data))
+            if not chunk:
+                return None
+            data += chunk
+        return data
+
+    def read_ssl_request(self):
+        """
+        First client packet of a TLS server: on an SSL request, switch to TLS
+        and read the handshake response that follows. The SSL request is read
+        unbuffered, as the TLS client hello comes right after it.
+        """
+        header = self._recv_exact(4)
+        if header is None:
+            return None
+        length = header[0] | (header[1] << 8) | (header[2] << 16)
+        payload = self._recv_exact(length)
+        if payload is None:
+            return None
+        if length != 32 or not struct.unpack_from('<I', payload)[0] & CLIENT_SSL:
+            return header[3], payload
+        try:
+            self.request = self.server.ssl_context.wrap_socket(self.request, server_side=True)
+        except (ssl.SSLError, OSError):
+            return None
+        self.status['Ssl_version'] = self.request.version()
+        self.status['Ssl_cipher'] = self.request.cipher()[0]
+        return self.read_packet()
+
+    def send_payload(self, payload, seq=1):
+        self.request.sendall(packet(seq, payload)[0])
+
+    def handshake(self):
+        scramble = os.urandom(20).translate(bytes.maketrans(b'\x00', b'\x01'))
+        caps = SERVER_CAPABILITIES | (CLIENT_SSL if self.server.ssl_context else 0)
+        greeting = (b'\x0a' + SERVER_VERSION.encode() + b'\x00'
+                    + struct.pack('<I', threading.get_ident() & 0xFFFFFFFF)
+                    + scramble[:8] + b'\x00'
+                    + struct.pack('<HBHH', caps & 0xFFFF, CHARSET_UTF8MB4,
+                                  SERVER_STATUS_AUTOCOMMIT, (caps >> 16) & 0xFFFF)
+                    + bytes((21,)) + b'\x00' * 6 + struct.pack('<I', caps >> 32)
+                    + scramble[8:] + b'\x00' + AUTH_PLUGIN.encode() + b'\x00')
+        self.send_payload(greeting, seq=0)
+        response = self.read_ssl_request() if self.server.ssl_context else self.read_packet()
+        if response is None:
+            return False
+        # Any credentials are accepted
+        self.send_payload(ok_payload(), seq=response[0] + 1)
+        return True
+
+    def load_local_infile(self, filename):
+        """Request the file, read its contents up to the empty packet and report the lines as rows."""
+        self.send_payload(b'\xfb' + filename.encode('utf-8'))
+        rows = 0
+        seq = 1
+        while True:
+            received = self.read_packet()
+            if received is None:
+                return
+            seq, data = received
+            if not data:
+                break
+            rows += data.count(b'\n')
+        self.send_payload(ok_payload(rows), seq=seq + 1)
+
+    def handle(self):
+        if not self.handshake():
+            return
+        server = self.server
+        while True:
+            received = self.read_packet()
+            if received is None or not received[1]:
+                return
+            payload = received[1]
+            command = payload[0]
+
+            if command == COM_QUERY:
+                sql = payload[1:].decode('utf-8', 'replace')
+                local_infile = _LOCAL_INFILE_RE.match(sql)
+                status = _SHOW_STATUS_RE.match(sql)
+                if local_infile:
+                    self.load_local_infile(local_infile.group(1))
+                elif status:
+                    self.request.sendall(status_result(self.status, status.group(1)).encode())
+                else:
+                    self.request.sendall(server.query_response(sql))
+            elif command == COM_STMT_PREPARE:
+                sql = payload[1:].decode('utf-8', 'replace')
+                self.last_stmt_id += 1
+                self.statements[self.last_stmt_id] = sql
+                self.status['Com_stmt_prepare'] += 1
+                self.request.sendall(server.prepare_response(self.last_stmt_id, sql))
+            elif command == COM_STMT_EXECUTE:
+                stmt_id = struct.unpack_from('<I', payload, 1)[0]
+                if stmt_id == LAST_PREPARED_STMT_ID:
+                    stmt_id = self.last_stmt_id
+                sql = self.statements.get(stmt_id)
+                if sql is None:
+                    self.send_payload(err_payload(1243, f"Unknown prepared statement handler ({stmt_id})"))
+                else:
+                    self.request.sendall(server.execute_response(sql))
+            elif command == COM_STMT_BULK_EXECUTE:
+                self.send_payload(ok_payload())
+            elif command in (COM_STMT_CLOSE, COM_STMT_SEND_LONG_DATA):
+                if command == COM_STMT_CLOSE:
+                    self.statements.pop(struct.unpack_from('<I', payload, 1)[0], None)
+                    self.status['Com_stmt_close'] += 1
+            elif command == COM_QUIT:
+                return
+            elif command in (COM_PING, COM_INIT_DB, COM_STMT_RESET, COM_SET_OPTION,
+                             COM_RESET_CONNECTION, COM_CHANGE_USER):
+                self.send_payload(ok_payload())
+            else:
+                self.send_payload(err_payload(1047, f"Unknown command {command:#x}"))
+
+
+class FakeServer(socketserver.ThreadingTCPServer):
+    """Threaded fake server holding the shared response cache."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address=('127.0.0.1', 0), tls_cert=None, tls_key=None):
+        super().__init__(address, FakeServerHandler)
+        self.ssl_context = None
+        if tls_cert:
+            self.ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            self.ssl_context.load_cert_chain(tls_cert, tls_key)
+        self._cache = {}
+        self._lock = threading.Lock()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def _cached(self, key, build):
+        response = self._cache.get(key)
+        if response is None:
+            response = build()
+            with self._lock:
+                self._cache[key] = response
+        return response
+
+    def query_response(self, sql):
+        def build():
+            result = canned_result(sql)
+            if result is None:
+                return packet(1, ok_payload(insert_row_count(sql)))[0]
+            return result.encode(binary=False)
+        return self._cached(('query', sql), build)
+
+    def execute_response(self, sql):
+        def build():
+            result = canned_result(sql)
+            if result is None:
+                return packet(1, ok_payload(insert_row_count(sql)))[0]
+            return result.encode(binary=True)
+        return self._cached(('execute', sql), build)
+
+    def prepare_response(self, stmt_id, sql):
+        result = canned_result(sql)
+        columns = result.columns if result is not None else []
+        params = count_placeholders(sql)
+        out = bytearray()
+        data, seq = packet(1, b'\x00' + struct.pack('<IHHBH', stmt_id, len(columns), params, 0, 0))
+        out += data
+        if params:
+            param_def = Column('?', TYPE_VAR_STRING).definition()
+            for _ in range(params):
+                data, seq = packet(seq, param_def)
+                out += data
+            data, seq = packet(seq, eof_payload())
+            out += data
+        if columns:
+            for column in columns:
+                data, seq = packet(seq, column.definition())
+                out += data
+            data, seq = packet(seq, eof_payload())
+            out += data
+        return bytes(out)
+
+
+def start_fake_server_process(host='127.0.0.1', port=0, tls_cert=None, tls_key=None):
+    """
+    Start the fake server in a separate process so its CPU use does not compete
+    with the driver under test for the GIL. With tls_cert / tls_key it offers TLS.
+
+    Returns:
+        (process, port) tuple. Terminate the process when done.
+    """
+    cmd = [sys.executable, os.path.abspath(__file__), '--host', host, '--port', str(port)]
+    if tls_cert:
+        cmd += ['--tls-cert', tls_cert, '--tls-key', tls_key]
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith('FAKE_SERVER_PORT='):
+        process.terminate()
+        raise RuntimeError(f"fake server failed to start: {line!r}")
+    return process, int(line.strip().split('=', 1)[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description='MySQL/MariaDB protocol stand-in server for driver benchmarks')
+    parser.add_argument('--host', default='127.0.0.1', help='Listen address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=3307, help='Listen port, 0 for any free port (default: 3307)')
+    parser.add_argument('--tls-cert', help='Server certificate (PEM); offers TLS when given')
+    parser.add_argument('--tls-key', help='Server private key (PEM) for --tls-cert')
+    args = parser.parse_args()
+
+    server = FakeServer((args.host, args.port), args.tls_cert, args.tls_key)
+    print(f"FAKE_SERVER_PORT={server.port}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
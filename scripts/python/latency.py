@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+HDR-style latency histogram.
+
+Values are recorded in nanoseconds into log-linear buckets: exact below
+2^SUB_BUCKET_BITS, then 2^(SUB_BUCKET_BITS - 1) buckets per power of two, so
+any recorded value is reported within 1 / 2^(SUB_BUCKET_BITS - 1) (under 1%)
+whatever its magnitude. Only non-empty buckets are stored, which keeps a
+histogram of millions of samples to a few hundred entries in the result JSON,
+and histograms from several threads or processes can be merged exactly.
+
+A summary only has the percentiles its sample count supports: pN needs at
+least 100 / (100 - N) samples (100 for p99, 1000 for p99.9), below that it
+would just repeat the max. format_ms() prints a missing one as "-".
+"""
+
+import math
+
+
+SUB_BUCKET_BITS = 8
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with nanosecond resolution."""
+
+    def __init__(self, samples=()):
+        self.counts = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+        for sample in samples:
+            self.record(sample)
+
+    @staticmethod
+    def _index(value):
+        if value < (1 << SUB_BUCKET_BITS):
+            return value
+        shift = value.bit_length() - SUB_BUCKET_BITS
+        return (shift << (SUB_BUCKET_BITS - 1)) + (value >> shift)
+
+    @staticmethod
+    def _highest_value(index):
+        """Highest value that falls in the bucket `index`."""
+        if index < (1 << SUB_BUCKET_BITS):
+            return index
+        shift = (index >> (SUB_BUCKET_BITS - 1)) - 1
+        mantissa = index - (shift << (SUB_BUCKET_BITS - 1))
+        return ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds, count=1):
+        """Record a latency given in seconds."""
+        value = max(0, int(seconds * 1e9))
+        index = self._index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    def merge(self, other):
+        """Add the samples of another histogram to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+        return self
+
+    def percentile(self, percent):
+        """Latency in seconds below which `percent` % of the samples fall."""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(percent / 100.0 * self.count))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(self._highest_value(index), self.max) / 1e9
+        return self.max / 1e9
+
+    def summary(self):
+        """Count, mean, the supported percentiles and max in seconds, plus the histogram itself."""
+        result = {'count': self.count, 'mean': self.total / self.count / 1e9 if self.count else 0.0}
+        for percent in PERCENTILES:
+            if self.count >= min_samples(percent):
+                result[f"p{percent:g}"] = self.percentile(percent)
+        result['max'] = self.max / 1e9
+        result['histogram'] = self.to_dict()
+        return result
+
+    def to_dict(self):
+        return {
+            'unit': 'ns',
+            'sub_bucket_bits': SUB_BUCKET_BITS,
+            'count': self.count,
+            'total': self.total,
+            'min': self.min or 0,
+            'max': self.max,
+            'buckets': [[index, self.counts[index]] for index in sorted(self.counts)],
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get('sub_bucket_bits', SUB_BUCKET_BITS) != SUB_BUCKET_BITS:
+            raise ValueError(f"Histogram uses {data['sub_bucket_bits']} sub-bucket bits, expected {SUB_BUCKET_BITS}")
+        histogram = cls()
+        histogram.counts = {index: count for index, count in data['buckets']}
+        histogram.count = data['count']
+        histogram.total = data['total']
+        histogram.min = data['min'] if data['count'] else None
+        histogram.max = data['max']
+        return histogram
+
+
+def min_samples(percent):
+    """Fewest samples for which the `percent` percentile isn't just the max."""
+    return math.ceil(round(100.0 / (100 - percent), 6))
+
+
+def latency_summary(samples):
+    """Summarize latency samples (seconds): count, mean, p50, p90, p99, p99.9, max and histogram."""
+    return LatencyHistogram(samples).summary()
+
+
+def format_ms(latency, key, width=0):
+    """`key` of a summary in milliseconds, "-" when the sample count doesn't support it."""
+    value = latency.get(key)
+    return f"{'-' if value is None else f'{value * 1000:.3f}':<{width}}"
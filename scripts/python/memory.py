@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Memory measurement for the benchmarks.
+
+Enabled with TEST_DB_MEMORY=1 (run_benchmarks.py --memory). After the timed
+rounds, the benchmarked function runs MEMORY_ROUNDS more times, first plain to
+take the process RSS delta (psutil), then under tracemalloc for the peak
+Python heap growth of a single call and the number of memory blocks a call
+leaves allocated. tracemalloc slows allocation down several times, which is
+why it never runs during the timed rounds.
+
+Python exposes no count of every allocation made, only of the blocks alive at
+a given time, so `blocks` is the net number of blocks per call still
+allocated once it returned (objects cached or leaked per call), while
+transient per-row objects show up in `tracemalloc_peak`.
+"""
+
+import gc
+import inspect
+import os
+import sys
+import tracemalloc
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+MEMORY_ENABLED = os.environ.get('TEST_DB_MEMORY', '') not in ('', '0')
+MEMORY_ROUNDS = int(os.environ.get('TEST_DB_MEMORY_ROUNDS', '20'))
+
+
+def rss():
+    """Resident set size of this process in bytes, or None without psutil."""
+    if psutil is None:
+        return None
+    return psutil.Process().memory_info().rss
+
+
+def peak_rss():
+    """Peak resident set size of this process so far, in bytes."""
+    if resource is not None:
+        # KB on Linux, bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    info = psutil.Process().memory_info()
+    return getattr(info, 'peak_wset', info.rss)
+
+
+async def _call(func, *args, **kwargs):
+    result = func(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result
+
+
+async def measure_memory(func, *args, rounds=MEMORY_ROUNDS, **kwargs):
+    """
+    Run ``func`` ``rounds`` times and return its memory profile:
+    tracemalloc_peak (bytes above the heap size at the start of a call, worst
+    call), blocks (net blocks still allocated per call), rss_delta (bytes the
+    process grew over all rounds, None without psutil) and rounds.
+    """
+    gc.collect()
+    rss_before = rss()
+    for _ in range(rounds):
+        await _call(func, *args, **kwargs)
+    gc.collect()
+    rss_after = rss()
+
+    peak = 0
+    tracemalloc.start()
+    try:
+        gc.collect()
+        blocks_before = sys.getallocatedblocks()
+        for _ in range(rounds):
+            tracemalloc.reset_peak()
+            start, _ = tracemalloc.get_traced_memory()
+            await _call(func, *args, **kwargs)
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - start)
+        gc.collect()
+        blocks = (sys.getallocatedblocks() - blocks_before) / rounds
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'tracemalloc_peak': peak,
+        'blocks': blocks,
+        'rss_delta': rss_after - rss_before if rss_before is not None else None,
+        'rounds': rounds,
+    }
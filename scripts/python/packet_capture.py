@@ -0,0 +1,693 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Record and replay of server responses for deterministic client-side benchmarks.
+
+record: a TCP proxy between the driver and a real server that stores, for
+        every client command, the raw server bytes that answered it.
+replay: a local server that answers each client command with the recorded
+        bytes, doing no server-side work at all.
+count:  an in-process TCP proxy (CountingProxy) that counts the commands a
+        driver sends and the network round trips they take, to see what a
+        driver actually does on the wire (e.g. how executemany is executed).
+latency: a TCP proxy (LatencyProxy) that holds every chunk for half the given
+        round trip time in each direction, without serialising them, so
+        pipelined commands still overlap as they would on a slow network.
+
+Responses are deduplicated by command payload, so a capture of thousands of
+identical benchmark rounds stays small. Replay answers the exact payload
+recorded, with two explicit exceptions for payloads that change between runs:
+prepared statement commands match on command and statement id (parameter
+values differ), and INSERT queries on the text before VALUES and their row
+count (random insert data). A command matching neither gets an error packet,
+so the driver fails instead of decoding an unrelated response, and the replay
+server reports the misses on exit.
+A LOAD DATA LOCAL INFILE query gets its file request, then the rest of its
+response once the client has sent the file, whatever the file holds.
+
+Limitations: TLS and compression cannot be captured, and all replayed
+connections reuse the greeting and auth exchange of the first recorded one.
+
+Capture file format (gzip compressed):
+    MAGIC, then records of <kind:B><fallback:20s><digest:20s><length:I><response bytes>
+    (fallback: the fallback_key() digest, zeros when there is none)
+
+Usage:
+    python packet_capture.py record --upstream 127.0.0.1:3306 --output select.mdbcap --port 3307
+    python packet_capture.py replay --input select.mdbcap --port 3307
+    python packet_capture.py latency --upstream 127.0.0.1:3306 --rtt-ms 5 --port 3307
+
+    # Or let the runner manage it
+    python run_benchmarks.py --driver mariadb --benchmark select_1000_rows --server record
+    python run_benchmarks.py --driver mariadb --benchmark select_1000_rows --server replay
+"""
+
+import argparse
+import gzip
+import hashlib
+import os
+import queue
+import re
+import signal
+import socket
+import socketserver
+import struct
+import subprocess
+import sys
+import threading
+import time
+
+from fake_server import (
+    COM_QUERY, COM_QUIT, COM_STMT_BULK_EXECUTE, COM_STMT_CLOSE, COM_STMT_EXECUTE, COM_STMT_PREPARE,
+    COM_STMT_RESET, COM_STMT_SEND_LONG_DATA, MAX_PACKET, err_payload, insert_row_count, ok_payload, packet,
+)
+
+
+MAGIC = b'MDBCAP2\n'
+RECORD = struct.Struct('<B20s20sI')
+NO_FALLBACK = b'\x00' * 20
+
+KIND_GREETING = 0
+KIND_AUTH = 1
+KIND_RESPONSE = 2
+
+# Commands the server never answers
+NO_RESPONSE_COMMANDS = (COM_QUIT, COM_STMT_CLOSE, COM_STMT_SEND_LONG_DATA)
+# Commands addressing a prepared statement by the 4-byte id after the command byte
+STATEMENT_ID_COMMANDS = (COM_STMT_EXECUTE, COM_STMT_BULK_EXECUTE, COM_STMT_SEND_LONG_DATA, COM_STMT_RESET)
+
+_VALUES_RE = re.compile(r'\sVALUES\b', re.IGNORECASE)
+
+# Code of the error packet answering a command without recorded response
+ER_UNKNOWN_ERROR = 1105
+# First payload byte of the server's LOAD DATA LOCAL INFILE file request
+LOCAL_INFILE_REQUEST = 0xFB
+
+
+def fallback_key(payload):
+    """
+    Digest matching payloads that differ between recording and replay only in
+    data, or None when only the exact payload may match: the statement id of
+    prepared statement commands, the text before VALUES plus the row count of
+    INSERT queries.
+    """
+    command = payload[0]
+    if command in STATEMENT_ID_COMMANDS:
+        key = payload[:5]
+    elif command == COM_QUERY:
+        sql = payload[1:].decode('utf-8', 'replace')
+        rows = insert_row_count(sql)
+        head = _VALUES_RE.split(sql, 1)
+        if not rows or len(head) < 2:
+            return None
+        key = b'%c%d:' % (command, rows) + head[0].encode('utf-8')
+    else:
+        return None
+    return hashlib.sha1(key).digest()
+
+
+def first_packet_length(data):
+    """Length of the first packet (header included) in `data`."""
+    return 4 + (data[0] | (data[1] << 8) | (data[2] << 16))
+
+
+def is_infile_request(response):
+    """True when `response` starts with a LOAD DATA LOCAL INFILE file request."""
+    return len(response) > 4 and response[4] == LOCAL_INFILE_REQUEST
+
+
+def renumber(data, seq):
+    """`data` with its packets' sequence ids counting up from `seq`."""
+    out = bytearray(data)
+    position = 0
+    while position < len(out):
+        out[position + 3] = seq & 0xFF
+        position += first_packet_length(out[position:position + 3])
+        seq += 1
+    return bytes(out)
+
+
+class Capture:
+    """In-memory capture: greeting, auth exchange and deduplicated responses."""
+
+    def __init__(self):
+        self.greeting = None
+        self.auth = []
+        self.responses = {}
+        self.by_fallback = {}
+        self.misses = {}
+        self._lock = threading.Lock()
+
+    def add_response(self, payload, response):
+        digest = hashlib.sha1(payload).digest()
+        fallback = fallback_key(payload) or NO_FALLBACK
+        with self._lock:
+            if digest in self.responses:
+                return
+            self.responses[digest] = (fallback, response)
+            if fallback != NO_FALLBACK:
+                self.by_fallback.setdefault(fallback, response)
+
+    def lookup(self, payload):
+        """Recorded response to `payload`, None (counted in misses) when there is none."""
+        found = self.responses.get(hashlib.sha1(payload).digest())
+        if found is not None:
+            return found[1]
+        fallback = fallback_key(payload)
+        response = self.by_fallback.get(fallback) if fallback else None
+        if response is None:
+            miss = payload[:40]
+            with self._lock:
+                self.misses[miss] = self.misses.get(miss, 0) + 1
+        return response
+
+    def save(self, path):
+        with self._lock:
+            responses = list(self.responses.items())
+        with gzip.open(path, 'wb') as f:
+            f.write(MAGIC)
+            if self.greeting is not None:
+                f.write(RECORD.pack(KIND_GREETING, b'', b'', len(self.greeting)) + self.greeting)
+            for response in self.auth:
+                f.write(RECORD.pack(KIND_AUTH, b'', b'', len(response)) + response)
+            for digest, (fallback, response) in responses:
+                f.write(RECORD.pack(KIND_RESPONSE, fallback, digest, len(response)) + response)
+
+    @classmethod
+    def load(cls, path):
+        capture = cls()
+        with gzip.open(path, 'rb') as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a packet capture file")
+            while True:
+                header = f.read(RECORD.size)
+                if not header:
+                    break
+                kind, fallback, digest, length = RECORD.unpack(header)
+                response = f.read(length)
+                if kind == KIND_GREETING:
+                    capture.greeting = response
+                elif kind == KIND_AUTH:
+                    capture.auth.append(response)
+                else:
+                    capture.responses[digest] = (fallback, response)
+                    if fallback != NO_FALLBACK:
+                        capture.by_fallback.setdefault(fallback, response)
+        return capture
+
+
+class PacketReader:
+    """Split a byte stream into (seq, payload) packets, joining 16MB continuations."""
+
+    def __init__(self, sock):
+        self.sock = sock
+        self.buffer = bytearray()
+
+    def _read_exact(self, size):
+        while len(self.buffer) < size:
+            data = self.sock.recv(max(65536, size - len(self.buffer)))
+            if not data:
+                return None
+            self.buffer += data
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+    def read_packet(self):
+        """Return (seq of the first fragment, payload, raw bytes) or None on EOF."""
+        payload = bytearray()
+        raw = bytearray()
+        seq = None
+        while True:
+            header = self._read_exact(4)
+            if header is None:
+                return None
+            length = header[0] | (header[1] << 8) | (header[2] << 16)
+            body = self._read_exact(length)
+            if body is None:
+                return None
+            if seq is None:
+                seq = header[3]
+            payload += body
+            raw += header + body
+            if length < MAX_PACKET:
+                return seq, bytes(payload), bytes(raw)
+
+
+# =========================================================================
+# Record
+# =========================================================================
+
+class RecordHandler(socketserver.BaseRequestHandler):
+    """
+    Forward one connection upstream, attributing server bytes to the last
+    client command. Packets with a non-zero sequence id are the auth exchange
+    before the first command and belong to the current command after it, as
+    do the file contents sent for LOAD DATA LOCAL INFILE.
+    """
+
+    def setup(self):
+        self.lock = threading.Lock()
+        # Current exchange: [kind, client payload, response bytes]
+        self.current = [KIND_GREETING, b'', bytearray()]
+        self.first_connection = self.server.register(self)
+
+    def finish_exchange(self, next_exchange=None):
+        """Store the current exchange in the capture. Call with self.lock held."""
+        kind, payload, response = self.current
+        capture = self.server.capture
+        if kind == KIND_RESPONSE:
+            capture.add_response(payload, bytes(response))
+        elif self.first_connection and kind is not None:
+            if kind == KIND_GREETING:
+                capture.greeting = bytes(response)
+            else:
+                capture.auth.append(bytes(response))
+        self.current = next_exchange or [None, b'', bytearray()]
+
+    def flush(self):
+        """Store the in-flight exchange, for connections still open at shutdown."""
+        with self.lock:
+            self.finish_exchange()
+
+    def pump_server(self, upstream):
+        client = self.request
+        try:
+            while True:
+                data = upstream.recv(65536)
+                if not data:
+                    break
+                # Record before forwarding, so the client can't send its next
+                # command before this response is attributed
+                with self.lock:
+                    self.current[2] += data
+                client.sendall(data)
+        except OSError:
+            pass
+        finally:
+            try:
+                client.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    def handle(self):
+        client = self.request
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        upstream = socket.create_connection(self.server.upstream)
+        upstream.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        thread = threading.Thread(target=self.pump_server, args=(upstream,), daemon=True)
+        thread.start()
+        reader = PacketReader(client)
+        authenticated = False
+        file_sent = False
+        try:
+            while True:
+                received = reader.read_packet()
+                if received is None:
+                    break
+                seq, payload, raw = received
+                with self.lock:
+                    # the file request is recorded before the client sees it
+                    sending_file = (self.current[0] == KIND_RESPONSE and not file_sent
+                                    and is_infile_request(self.current[2]))
+                    if sending_file:
+                        # file contents, up to the empty packet ending them
+                        file_sent = not payload
+                    elif seq == 0:
+                        authenticated = True
+                        file_sent = False
+                        self.finish_exchange([KIND_RESPONSE, payload, bytearray()])
+                    elif not authenticated:
+                        self.finish_exchange([KIND_AUTH, payload, bytearray()])
+                upstream.sendall(raw)
+        except OSError:
+            pass
+        finally:
+            try:
+                upstream.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+            thread.join()
+            self.flush()
+            upstream.close()
+            self.server.unregister(self)
+
+
+class RecordServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, upstream, capture=None):
+        super().__init__(address, RecordHandler)
+        self.upstream = upstream
+        self.capture = capture or Capture()
+        self._handlers = set()
+        self._first_claimed = False
+        self._lock = threading.Lock()
+
+    def register(self, handler):
+        """Track an open connection. Returns True for the first connection ever."""
+        with self._lock:
+            self._handlers.add(handler)
+            first = not self._first_claimed
+            self._first_claimed = True
+            return first
+
+    def unregister(self, handler):
+        with self._lock:
+            self._handlers.discard(handler)
+
+    def flush(self):
+        """Store in-flight exchanges of all open connections."""
+        with self._lock:
+            handlers = list(self._handlers)
+        for handler in handlers:
+            handler.flush()
+
+
+# =========================================================================
+# Replay
+# =========================================================================
+
+class ReplayHandler(socketserver.BaseRequestHandler):
+    """Answer each client packet with its recorded response."""
+
+    def handle(self):
+        capture = self.server.capture
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.request.sendall(capture.greeting)
+        reader = PacketReader(self.request)
+        authenticated = False
+        auth_step = 0
+        # Recorded response after a LOAD DATA LOCAL INFILE file request, sent
+        # once the client has sent the file
+        after_file = None
+        while True:
+            received = reader.read_packet()
+            if received is None:
+                return
+            seq, payload, _ = received
+            if after_file is not None:
+                # file contents, up to the empty packet ending them
+                if not payload:
+                    self.request.sendall(renumber(after_file, seq + 1))
+                    after_file = None
+                continue
+            if seq != 0:
+                # the auth exchange before the first command, after it part of
+                # the current command, which the server doesn't answer
+                if not authenticated:
+                    if auth_step < len(capture.auth):
+                        self.request.sendall(capture.auth[auth_step])
+                    else:
+                        self.request.sendall(packet(seq + 1, ok_payload())[0])
+                    auth_step += 1
+                continue
+            authenticated = True
+            if not payload or payload[0] == COM_QUIT:
+                return
+            if payload[0] in NO_RESPONSE_COMMANDS:
+                continue
+            response = capture.lookup(payload)
+            if response is None:
+                response = packet(1, err_payload(ER_UNKNOWN_ERROR, "packet_capture replay: no recorded response "
+                                                 f"for {payload[:40]!r}"))[0]
+            elif is_infile_request(response):
+                request_length = first_packet_length(response)
+                response, after_file = response[:request_length], response[request_length:]
+            if response:
+                self.request.sendall(response)
+
+
+class ReplayServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, capture):
+        if capture.greeting is None:
+            raise ValueError("capture has no server greeting")
+        super().__init__(address, ReplayHandler)
+        self.capture = capture
+
+
+# =========================================================================
+# Count
+# =========================================================================
+
+COMMAND_NAMES = {
+    COM_QUERY: 'COM_QUERY',
+    COM_STMT_PREPARE: 'COM_STMT_PREPARE',
+    COM_STMT_EXECUTE: 'COM_STMT_EXECUTE',
+    COM_STMT_BULK_EXECUTE: 'COM_STMT_BULK_EXECUTE',
+    COM_STMT_SEND_LONG_DATA: 'COM_STMT_SEND_LONG_DATA',
+    COM_STMT_CLOSE: 'COM_STMT_CLOSE',
+}
+
+
+class CountingHandler(socketserver.BaseRequestHandler):
+    """Forward one connection upstream, counting client commands and round trips."""
+
+    def pump_server(self, upstream):
+        client = self.request
+        try:
+            while True:
+                data = upstream.recv(65536)
+                if not data:
+                    break
+                client.sendall(data)
+        except OSError:
+            pass
+        finally:
+            try:
+                client.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+
+    def handle(self):
+        client = self.request
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        upstream = socket.create_connection(self.server.upstream)
+        upstream.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        thread = threading.Thread(target=self.pump_server, args=(upstream,), daemon=True)
+        thread.start()
+        reader = PacketReader(client)
+        try:
+            while True:
+                received = reader.read_packet()
+                if received is None:
+                    break
+                seq, payload, raw = received
+                if seq == 0 and payload:
+                    self.server.count(payload)
+                upstream.sendall(raw)
+        except OSError:
+            pass
+        finally:
+            try:
+                upstream.shutdown(socket.SHUT_WR)
+            except OSError:
+                pass
+            thread.join()
+            upstream.close()
+
+
+class CountingProxy(socketserver.ThreadingTCPServer):
+    """
+    Proxy counting, since the last reset(): client commands by name, round
+    trips (commands the server answers; a driver pipelining them still waits
+    for every answer) and the largest row count of a COM_QUERY INSERT
+    (more than one means a multi-value rewrite).
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, upstream, address=('127.0.0.1', 0)):
+        super().__init__(address, CountingHandler)
+        self.upstream = upstream
+        self._lock = threading.Lock()
+        self._thread = None
+        self.reset()
+
+    @property
+    def port(self):
+        return self.server_address[1]
+
+    def reset(self):
+        with self._lock:
+            self.commands = {}
+            self.round_trips = 0
+            self.max_query_rows = 0
+
+    def count(self, payload):
+        command = payload[0]
+        name = COMMAND_NAMES.get(command, f"{command:#04x}")
+        with self._lock:
+            self.commands[name] = self.commands.get(name, 0) + 1
+            if command not in NO_RESPONSE_COMMANDS:
+                self.round_trips += 1
+            if command == COM_QUERY:
+                rows = insert_row_count(payload[1:].decode('utf-8', 'replace'))
+                self.max_query_rows = max(self.max_query_rows, rows)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                'commands': dict(self.commands),
+                'round_trips': self.round_trips,
+                'max_query_rows': self.max_query_rows,
+            }
+
+    def start(self):
+        self._thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class LatencyHandler(socketserver.BaseRequestHandler):
+    """Forward one connection upstream, delaying each direction by half the RTT."""
+
+    def pipe(self, source, destination, delay):
+        pending = queue.Queue()
+
+        def send():
+            try:
+                while True:
+                    due, data = pending.get()
+                    if data is None:
+                        break
+                    wait = due - time.monotonic()
+                    if wait > 0:
+                        time.sleep(wait)
+                    destination.sendall(data)
+            except OSError:
+                pass
+            finally:
+                try:
+                    destination.shutdown(socket.SHUT_WR)
+                except OSError:
+                    pass
+
+        sender = threading.Thread(target=send, daemon=True)
+        sender.start()
+        try:
+            while True:
+                data = source.recv(65536)
+                if not data:
+                    break
+                pending.put((time.monotonic() + delay, data))
+        except OSError:
+            pass
+        finally:
+            pending.put((0, None))
+            sender.join()
+
+    def handle(self):
+        client = self.request
+        client.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        upstream = socket.create_connection(self.server.upstream)
+        upstream.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        delay = self.server.rtt / 2
+
+        thread = threading.Thread(target=self.pipe, args=(upstream, client, delay), daemon=True)
+        thread.start()
+        self.pipe(client, upstream, delay)
+        thread.join()
+        upstream.close()
+
+
+class LatencyProxy(socketserver.ThreadingTCPServer):
+    """Proxy adding `rtt` seconds of round trip time to every exchange."""
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, upstream, rtt):
+        super().__init__(address, LatencyHandler)
+        self.upstream = upstream
+        self.rtt = rtt
+
+
+def start_capture_process(mode, path=None, upstream=None, host='127.0.0.1', port=0, rtt_ms=0):
+    """
+    Start a record proxy, replay server or latency proxy in a separate process.
+
+    Returns:
+        (process, port) tuple. Terminate the process when done; a record
+        process writes its capture file on SIGTERM.
+    """
+    cmd = [sys.executable, os.path.abspath(__file__), mode, '--host', host, '--port', str(port)]
+    if mode == 'record':
+        cmd.extend(['--output', path, '--upstream', upstream])
+    elif mode == 'latency':
+        cmd.extend(['--upstream', upstream, '--rtt-ms', str(rtt_ms)])
+    else:
+        cmd.extend(['--input', path])
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    if not line.startswith('CAPTURE_SERVER_PORT='):
+        process.terminate()
+        raise RuntimeError(f"{mode} server failed to start: {line!r}")
+    return process, int(line.strip().split('=', 1)[1])
+
+
+def _raise_keyboard_interrupt(signum, frame):
+    raise KeyboardInterrupt
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Record or replay MySQL/MariaDB server responses')
+    parser.add_argument('mode', choices=['record', 'replay', 'latency'])
+    parser.add_argument('--host', default='127.0.0.1', help='Listen address (default: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=3307, help='Listen port, 0 for any free port (default: 3307)')
+    parser.add_argument('--upstream', default='127.0.0.1:3306', help='record, latency: server host:port')
+    parser.add_argument('--output', help='record: capture file to write')
+    parser.add_argument('--input', help='replay: capture file to read')
+    parser.add_argument('--rtt-ms', type=float, default=1.0, help='latency: added round trip time (default: 1.0)')
+    args = parser.parse_args()
+
+    if args.mode == 'record':
+        if not args.output:
+            parser.error('record requires --output')
+        host, _, port = args.upstream.rpartition(':')
+        server = RecordServer((args.host, args.port), (host, int(port)))
+    elif args.mode == 'latency':
+        host, _, port = args.upstream.rpartition(':')
+        server = LatencyProxy((args.host, args.port), (host, int(port)), args.rtt_ms / 1000)
+    else:
+        if not args.input:
+            parser.error('replay requires --input')
+        server = ReplayServer((args.host, args.port), Capture.load(args.input))
+
+    signal.signal(signal.SIGTERM, _raise_keyboard_interrupt)
+    print(f"CAPTURE_SERVER_PORT={server.server_address[1]}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if args.mode == 'replay' and server.capture.misses:
+            misses = server.capture.misses
+            print(f"{sum(misses.values())} commands had no recorded response and got an error:", file=sys.stderr)
+            for payload, count in sorted(misses.items(), key=lambda item: -item[1]):
+                print(f"  {count:>8}  {payload!r}", file=sys.stderr)
+        if args.mode == 'record':
+            server.flush()
+            server.capture.save(args.output)
+            print(f"Saved {len(server.capture.responses)} responses to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Connection pool adapters shared by the pool benchmarks.
+
+Each adapter wraps one pool implementation behind the same small interface:
+acquire() returns a handle, connection(handle) the DB-API connection and
+release(handle) gives it back, so the benchmark loop is identical for all of
+them. Async adapters have the same methods as coroutines, plus open().
+All adapters take optional connection settings overriding DB_CONFIG;
+get_sync_pool() and get_async_pool() pass the TEST_DB_TLS ones.
+
+Implementations:
+- mariadb_pool: mariadb_pool.ConnectionPool / AsyncConnectionPool (mariadb drivers only)
+- dbutils:      DBUtils PooledDB (all sync drivers)
+- asyncmy:      asyncmy's own pool
+"""
+
+import pytest
+
+from conftest import DB_CONFIG, tls_options
+
+
+SYNC_POOLS = ['mariadb_pool', 'dbutils']
+ASYNC_POOLS = ['mariadb_pool', 'asyncmy']
+
+
+class MariaDBPool:
+    """mariadb_pool.ConnectionPool; acquire() health-checks the connection with a ping."""
+
+    def __init__(self, driver, size, **config):
+        from mariadb_pool import ConnectionPool, PoolConfig
+        self.pool = ConnectionPool(driver.connect, PoolConfig(min_size=size, max_size=size),
+                                   **dict(DB_CONFIG, **config))
+
+    def acquire(self):
+        return self.pool.acquire()
+
+    def connection(self, handle):
+        return handle.connection
+
+    def release(self, handle):
+        self.pool.release(handle)
+
+    def close(self):
+        self.pool.close()
+
+
+class DBUtilsPool:
+    """DBUtils PooledDB, blocking when all connections are in use."""
+
+    def __init__(self, driver, size, **config):
+        from dbutils.pooled_db import PooledDB
+        self.pool = PooledDB(creator=driver, maxconnections=size, mincached=size, maxcached=size,
+                             blocking=True, **dict(DB_CONFIG, **config))
+
+    def acquire(self):
+        return self.pool.connection()
+
+    def connection(self, handle):
+        return handle
+
+    def release(self, handle):
+        handle.close()
+
+    def close(self):
+        self.pool.close()
+
+
+class AsyncMariaDBPool:
+    """mariadb_pool.AsyncConnectionPool over mariadb.asyncConnect."""
+
+    def __init__(self, driver, size, **config):
+        from mariadb_pool import AsyncConnectionPool, PoolConfig
+        self.pool = AsyncConnectionPool(driver.asyncConnect, PoolConfig(min_size=size, max_size=size),
+                                        **dict(DB_CONFIG, **config))
+
+    async def open(self):
+        await self.pool.open()
+
+    async def acquire(self):
+        return await self.pool.acquire()
+
+    def connection(self, handle):
+        return handle.connection
+
+    async def release(self, handle):
+        await self.pool.release(handle)
+
+    async def close(self):
+        await self.pool.close()
+
+
+class AsyncmyPool:
+    """asyncmy.create_pool(); release() is not a coroutine but returns an awaitable."""
+
+    def __init__(self, driver, size, **config):
+        self.driver = driver
+        self.size = size
+        self.config = dict(DB_CONFIG, **config)
+        self.pool = None
+
+    async def open(self):
+        self.pool = await self.driver.create_pool(minsize=self.size, maxsize=self.size, **self.config)
+
+    async def acquire(self):
+        return await self.pool.acquire()
+
+    def connection(self, handle):
+        return handle
+
+    async def release(self, handle):
+        await self.pool.release(handle)
+
+    async def close(self):
+        self.pool.close()
+        await self.pool.wait_closed()
+
+
+def get_sync_pool(driver, driver_name, implementation, size):
+    """Create a sync pool adapter, skipping unsupported driver/pool combinations."""
+    if driver_name in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} requires async tests")
+    try:
+        if implementation == 'mariadb_pool':
+            if driver_name not in ['mariadb', 'mariadb_c']:
+                pytest.skip(f"mariadb_pool doesn't support {driver_name}")
+            return MariaDBPool(driver, size, **tls_options(driver_name))
+        return DBUtilsPool(driver, size, **tls_options(driver_name))
+    except ImportError as e:
+        pytest.skip(f"{implementation} not installed: {e}")
+
+
+async def get_async_pool(driver, driver_name, implementation, size):
+    """Create and open an async pool adapter, skipping unsupported driver/pool combinations."""
+    if driver_name not in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} doesn't support async")
+    if implementation == 'mariadb_pool' and driver_name == 'async-mariadb':
+        try:
+            pool = AsyncMariaDBPool(driver, size, **tls_options(driver_name))
+        except ImportError as e:
+            pytest.skip(f"mariadb_pool not installed: {e}")
+    elif implementation == 'asyncmy' and driver_name == 'asyncmy':
+        pool = AsyncmyPool(driver, size, **tls_options(driver_name))
+    else:
+        pytest.skip(f"{implementation} pool doesn't support {driver_name}")
+    await pool.open()
+    return pool
@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Async concurrency sweep: many in-flight queries over N connections.
+
+The *_async.py benchmarks await one query at a time on one connection. Here
+C tasks share N connections on one event loop, each task looping for
+--duration seconds: take an idle connection, run the workload, give the
+connection back. Every (C, N) point runs on a fresh event loop.
+
+Native async drivers await the driver directly. Sync drivers (mariadb,
+mariadb_c, pymysql, mysql_connector) run the same workloads the way services
+wrap them, through loop.run_in_executor() on a ThreadPoolExecutor of
+--threads workers (default: one per connection), so both architectures can
+be compared point by point.
+
+Reported per point:
+- throughput:  operations/s over all tasks
+- latency:     per operation, including the wait for a free connection
+               (p50 / p90 / p99 / p99.9 / max)
+- loop lag:    how late a --lag-interval ms sleep wakes up, sampled by a
+               monitor task for the whole point; high lag means callbacks
+               (driver decoding included) hold the loop
+
+Every point runs on the --event-loop implementation (see event_loops.py),
+recorded in the results so loops can be compared for the same driver.
+
+Points where N > C are skipped (the extra connections would stay idle). N up
+to 256 needs a server max_connections above that. The tables the workload
+uses are (re)created first.
+
+Usage:
+    python run_async_concurrency.py --driver async-mariadb
+    python run_async_concurrency.py --driver asyncmy --tasks 100,1000,10000 --connections 8,32,128,256
+    python run_async_concurrency.py --driver asyncmy --event-loop uvloop
+    python run_async_concurrency.py --driver mariadb_c --workload select_1000_rows --connections 16 --threads 8
+    python run_async_concurrency.py --driver mysql_connector_async --json ../../bench_results_python_mysql_connector_async_async_concurrency_results.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import TLS_MODE, async_connect, connect_config, create_tables, create_tables_async, get_driver_module
+from event_loops import DEFAULT_EVENT_LOOP, EVENT_LOOPS, install_event_loop
+from latency import LatencyHistogram, format_ms
+from workloads import ASYNC_WORKLOADS, WORKLOADS, workload_tables
+
+
+ASYNC_DRIVERS = ['async-mariadb', 'mysql_connector_async', 'asyncmy']
+SYNC_DRIVERS = ['mariadb', 'mariadb_c', 'pymysql', 'mysql_connector']
+
+
+class IdleConnections:
+    """
+    FIFO hand-off of connections between tasks. An asyncio.Queue lets the
+    releasing task take the connection straight back and starve the waiters.
+    """
+
+    def __init__(self, connections):
+        self.idle = deque(connections)
+        self.waiters = deque()
+
+    async def acquire(self):
+        if self.idle:
+            return self.idle.popleft()
+        waiter = asyncio.get_running_loop().create_future()
+        self.waiters.append(waiter)
+        return await waiter
+
+    def release(self, conn):
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(conn)
+                return
+        self.idle.append(conn)
+
+
+async def monitor_loop_lag(histogram, interval, stop):
+    """Record how late each `interval` second sleep wakes up until `stop` is set."""
+    perf_counter = time.perf_counter
+    while not stop.is_set():
+        start = perf_counter()
+        await asyncio.sleep(interval)
+        histogram.record(max(0.0, perf_counter() - start - interval))
+
+
+async def create_tables_native(driver_name, tables):
+    """(Re)create `tables` over a connection of an async driver."""
+    connection = await async_connect(driver_name)
+    try:
+        await create_tables_async(connection, driver_name, tables)
+    finally:
+        await connection.close()
+
+
+async def open_native(driver, driver_name, workload_name, connections, threads):
+    """Returns (connections, workload coroutine function, close coroutine function)."""
+    opened = [await async_connect(driver_name) for _ in range(connections)]
+
+    async def close():
+        for conn in opened:
+            try:
+                await conn.close()
+            except:
+                pass
+
+    return opened, ASYNC_WORKLOADS[workload_name][0], close
+
+
+async def open_thread_pool(driver, driver_name, workload_name, connections, threads):
+    """open_native for a sync driver, every call going through run_in_executor()."""
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=threads)
+    opened = [await loop.run_in_executor(executor, lambda: driver.connect(**connect_config(driver_name))) for _ in range(connections)]
+    sync_workload = WORKLOADS[workload_name][0]
+
+    def workload(conn, driver_name):
+        return loop.run_in_executor(executor, sync_workload, conn, driver_name)
+
+    async def close():
+        for conn in opened:
+            try:
+                await loop.run_in_executor(executor, conn.close)
+            except:
+                pass
+        executor.shutdown()
+
+    return opened, workload, close
+
+
+async def run_point(driver, driver_name, workload_name, tasks, connections, threads, duration, lag_interval):
+    """Returns (operations/s, latency histogram, loop lag histogram)."""
+    open_connections = open_native if driver_name in ASYNC_DRIVERS else open_thread_pool
+    opened, workload, close = await open_connections(driver, driver_name, workload_name, connections, threads)
+    idle = IdleConnections(opened)
+
+    histogram = LatencyHistogram()
+    lag = LatencyHistogram()
+    perf_counter = time.perf_counter
+    stop = asyncio.Event()
+
+    async def task(deadline):
+        while True:
+            start = perf_counter()
+            if start >= deadline:
+                return
+            conn = await idle.acquire()
+            try:
+                await workload(conn, driver_name)
+            finally:
+                idle.release(conn)
+            histogram.record(perf_counter() - start)
+
+    monitor = asyncio.create_task(monitor_loop_lag(lag, lag_interval, stop))
+    try:
+        start = perf_counter()
+        await asyncio.gather(*[task(start + duration) for _ in range(tasks)])
+        elapsed = perf_counter() - start
+    finally:
+        stop.set()
+        await monitor
+        await close()
+    return histogram.count / elapsed, histogram, lag
+
+
+def to_benchmark_entry(driver_name, workload_name, event_loop, tasks, connections, threads, throughput, latency, lag):
+    """pytest-benchmark compatible entry; 1 / mean is the throughput."""
+    name = f"test_async_concurrency[{driver_name}-{workload_name}-{event_loop}-{tasks}tasks-{connections}conns]"
+    return {
+        'name': name,
+        'fullname': f"run_async_concurrency.py::{name}",
+        'params': {'driver': driver_name, 'workload': workload_name, 'tasks': tasks, 'connections': connections,
+                   'executor': 'native' if driver_name in ASYNC_DRIVERS else 'thread_pool', 'threads': threads,
+                   'event_loop': event_loop, 'tls': TLS_MODE},
+        'extra_info': {'throughput': throughput, 'latency': latency, 'loop_lag': lag},
+        'stats': {
+            'min': 1.0 / throughput,
+            'max': 1.0 / throughput,
+            'mean': 1.0 / throughput,
+            'median': 1.0 / throughput,
+            'stddev': 0,
+            'rounds': 1,
+            'iterations': latency['count'],
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Async concurrency sweep over tasks and connections')
+    parser.add_argument('--driver', required=True, choices=ASYNC_DRIVERS + SYNC_DRIVERS,
+                        help='Driver to benchmark; sync drivers run through a thread pool')
+    parser.add_argument('--workload', default='select_1', choices=list(ASYNC_WORKLOADS),
+                        help='Workload (default: %(default)s)')
+    parser.add_argument('--threads', type=int,
+                        help='Thread pool size for sync drivers (default: one per connection)')
+    parser.add_argument('--event-loop', default=DEFAULT_EVENT_LOOP, choices=EVENT_LOOPS,
+                        help='Event loop implementation (default: %(default)s)')
+    parser.add_argument('--tasks', default='1,10,100,1000,10000',
+                        help='Comma-separated concurrent task counts (default: %(default)s)')
+    parser.add_argument('--connections', default='1,4,16,64,256',
+                        help='Comma-separated connection counts (default: %(default)s)')
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help='Seconds per point (default: %(default)s)')
+    parser.add_argument('--lag-interval', type=float, default=10.0,
+                        help='Event loop lag sampling interval in ms (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    if args.driver == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    elif args.driver == 'mariadb_c':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    driver = get_driver_module(args.driver)
+    try:
+        install_event_loop(args.event_loop)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    native = args.driver in ASYNC_DRIVERS
+    tables = workload_tables([args.workload])
+    if tables and native:
+        asyncio.run(create_tables_native(args.driver, tables))
+    elif tables:
+        connection = driver.connect(**connect_config(args.driver))
+        create_tables(connection, tables)
+        connection.close()
+    task_counts = [int(n) for n in args.tasks.split(',') if n.strip()]
+    connection_counts = [int(n) for n in args.connections.split(',') if n.strip()]
+
+    if native:
+        mode = 'native'
+    elif args.threads:
+        mode = f"run_in_executor, {args.threads} threads"
+    else:
+        mode = 'run_in_executor, one thread per connection'
+    print(f"\n{args.workload} - {args.driver} (async concurrency, {mode}, {args.event_loop} loop, "
+          f"{args.duration:g}s per point)")
+    print("-" * 110)
+    print(f"{'Tasks':<8} {'Conns':<7} {'Ops/s':<12} {'p50 (ms)':<10} {'p99 (ms)':<10} {'p99.9 (ms)':<11} "
+          f"{'Max (ms)':<10} {'Lag p50 (ms)':<13} {'Lag p99 (ms)':<13} {'Lag max (ms)':<12}")
+
+    benchmarks = []
+    for tasks in task_counts:
+        for connections in connection_counts:
+            if connections > tasks:
+                continue
+            threads = None if native else args.threads or connections
+            try:
+                throughput, histogram, lag = asyncio.run(run_point(driver, args.driver, args.workload, tasks,
+                                                                   connections, threads, args.duration,
+                                                                   args.lag_interval / 1000))
+            except Exception as e:
+                print(f"{tasks:<8} {connections:<7} failed: {e!r}")
+                continue
+            latency = histogram.summary()
+            loop_lag = lag.summary()
+            print(f"{tasks:<8} {connections:<7} {throughput:<12.0f} {format_ms(latency, 'p50', 10)} "
+                  f"{format_ms(latency, 'p99', 10)} {format_ms(latency, 'p99.9', 11)} {latency['max'] * 1000:<10.3f} "
+                  f"{format_ms(loop_lag, 'p50', 13)} {format_ms(loop_lag, 'p99', 13)} {loop_lag['max'] * 1000:<12.3f}")
+            benchmarks.append(to_benchmark_entry(args.driver, args.workload, args.event_loop, tasks, connections,
+                                                 threads, throughput, latency, loop_lag))
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
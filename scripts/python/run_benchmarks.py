@@ -23,6 +23,27 @@ Usage:
     
     # Generate comparison report
     python run_benchmarks.py --compare
+    
+    # Measure client-side cost only, against the local fake server
+    python run_benchmarks.py --driver pymysql --server fake
+    
+    # Multi-threaded scaling (opt-in), then scaling efficiency report
+    python run_benchmarks.py --driver mariadb_c --benchmark threads --json benchmark_mariadb_c.json
+    python run_benchmarks.py --scaling
+    
+    # Result set size sweep (opt-in), then per-query / per-row cost fit
+    python run_benchmarks.py --driver pymysql --benchmark result_size --json benchmark_pymysql.json
+    python run_benchmarks.py --result-size
+    
+    # Record server responses once, then replay them with zero server work
+    python run_benchmarks.py --driver mariadb --benchmark select_1000_rows --server record
+    python run_benchmarks.py --driver mariadb --benchmark select_1000_rows --server replay
+    
+    # Async drivers on another event loop (see event_loops.py)
+    python run_benchmarks.py --driver asyncmy --event-loop uvloop --json bench_results_python_asyncmy_uvloop_results.json
+    
+    # Over TLS 1.3, against the fake server with a generated CA (see tls.py)
+    python run_benchmarks.py --driver pymysql --server fake --tls 1.3 --json bench_results_python_pymysql_tls13_results.json
 """
 
 import sys
@@ -30,8 +51,13 @@ import os
 import argparse
 import subprocess
 import json
+import tempfile
 from pathlib import Path
 
+from event_loops import DEFAULT_EVENT_LOOP, EVENT_LOOPS, event_loop_policy
+from latency import format_ms
+from tls import TLS_MODES
+
 
 BENCHMARKS = [
     'test_bench_do_1.py',
@@ -46,16 +72,40 @@ BENCHMARKS = [
 ASYNC_BENCHMARKS = [
     'test_bench_do_1_async.py',
     'test_bench_select_1_async.py',
+    'test_bench_select_1_pool_async.py',
     'test_bench_select_1000_rows_async.py',
     'test_bench_select_100_cols_async.py',
     'test_bench_do_1000_params_async.py',
     'test_bench_insert_batch_async.py',
 ]
 
+# Opt-in benchmarks: not part of the default run, select them with --benchmark
+EXTRA_BENCHMARKS = [
+    'test_bench_threads.py',
+    'test_bench_pool.py',
+    'test_bench_result_size.py',
+    'test_bench_executemany.py',
+    'test_bench_types.py',
+    'test_bench_row_factory.py',
+    'test_bench_stmt_cache.py',
+    'test_bench_pipeline.py',
+    'test_bench_connect.py',
+]
+
 DRIVERS = ['mariadb', 'mariadb_c', 'async-mariadb', 'pymysql', 'mysql_connector', 'mysql_connector_async', 'asyncmy']
 
+# live: TEST_DB_* server, fake: local protocol stand-in (fake_server.py),
+# record/replay: capture responses of the live server and serve them back (packet_capture.py)
+SERVERS = ['live', 'fake', 'record', 'replay']
+
+
+def default_capture_file(benchmark=None, driver=None):
+    """Capture file used by --server record/replay when --capture is not given."""
+    return f"capture_{driver or 'all'}_{benchmark or 'all'}.mdbcap"
+
 
-def run_pytest_benchmark(benchmark_file=None, driver=None, output_json=None):
+def run_pytest_benchmark(benchmark_file=None, driver=None, output_json=None, server='live',
+                         capture_file=None, memory=False, event_loop=DEFAULT_EVENT_LOOP, tls='off'):
     """Run pytest-benchmark with specified parameters."""
     
     # Use the current Python interpreter to invoke pytest in a cross-platform
@@ -100,14 +150,55 @@ def run_pytest_benchmark(benchmark_file=None, driver=None, output_json=None):
         env['MARIADB_PYTHON_CONNECTOR'] = 'python'
     elif driver == 'mariadb_c':
         env['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    if memory:
+        env['TEST_DB_MEMORY'] = '1'
+    env['TEST_DB_EVENT_LOOP'] = event_loop
+    env['TEST_DB_TLS'] = tls
+    
+    server_process = None
+    cert_dir = None
+    if server == 'fake':
+        from fake_server import start_fake_server_process
+        tls_files = {}
+        if tls != 'off':
+            # A fresh self-signed CA for the run, which the drivers then verify the server against
+            from tls import generate
+            cert_dir = tempfile.TemporaryDirectory()
+            ca, cert, key = generate(cert_dir.name)
+            tls_files = {'tls_cert': cert, 'tls_key': key}
+            env['TEST_DB_TLS_CA'] = ca
+        server_process, port = start_fake_server_process(**tls_files)
+        env['TEST_DB_HOST'] = '127.0.0.1'
+        env['TEST_DB_PORT'] = str(port)
+    elif server in ['record', 'replay']:
+        from packet_capture import start_capture_process
+        upstream = f"{env.get('TEST_DB_HOST', '127.0.0.1')}:{env.get('TEST_DB_PORT', '3306')}"
+        server_process, port = start_capture_process(server, os.path.abspath(capture_file), upstream=upstream)
+        env['TEST_DB_HOST'] = '127.0.0.1'
+        env['TEST_DB_PORT'] = str(port)
     
     print(f"Running: {' '.join(cmd)}")
     print(f"Working directory: {benchmarks_dir}")
     if driver in ['mariadb', 'mariadb_c']:
         print(f"MARIADB_PYTHON_CONNECTOR={env.get('MARIADB_PYTHON_CONNECTOR')}")
+    if event_loop != DEFAULT_EVENT_LOOP:
+        print(f"Event loop: {event_loop}")
+    if tls != 'off':
+        print(f"TLS: {tls}" + (f" (CA {env['TEST_DB_TLS_CA']})" if env.get('TEST_DB_TLS_CA') else ""))
+    if server_process:
+        print(f"Using {server} server on 127.0.0.1:{env['TEST_DB_PORT']}")
+        if server in ['record', 'replay']:
+            print(f"Capture file: {capture_file}")
     print("-" * 80)
     
-    result = subprocess.run(cmd, cwd=benchmarks_dir, env=env)
+    try:
+        result = subprocess.run(cmd, cwd=benchmarks_dir, env=env)
+    finally:
+        if server_process:
+            server_process.terminate()
+            server_process.wait()
+        if cert_dir:
+            cert_dir.cleanup()
     return result.returncode
 
 
@@ -154,7 +245,7 @@ def generate_comparison_report(json_files):
             else:
                 driver = 'unknown'
             
-            benchmark_groups[base_name][driver] = bench['stats']
+            benchmark_groups[base_name][driver] = bench
     
     # Print results grouped by benchmark
     for bench_name in sorted(benchmark_groups.keys()):
@@ -170,17 +261,23 @@ def generate_comparison_report(json_files):
         fastest_driver = None
         driver_results = {}
         
-        for driver, stats in drivers_data.items():
+        for driver, bench in drivers_data.items():
+            stats = bench['stats']
             mean_ms = stats['mean'] * 1000
             ops = 1000.0 / mean_ms
-            driver_results[driver] = {'mean_ms': mean_ms, 'ops': ops, 'stddev': stats['stddev'] * 1000}
+            driver_results[driver] = {'mean_ms': mean_ms, 'ops': ops, 'stddev': stats['stddev'] * 1000,
+                                      'latency': (bench.get('extra_info') or {}).get('latency')}
             
             if ops > fastest_ops:
                 fastest_ops = ops
                 fastest_driver = driver
         
         # Print header with wider driver column to accommodate "mysql_connector (Python)"
-        print(f"{'Driver':<25} {'Mean (ms)':<15} {'OPS':<15} {'vs Fastest':<20}")
+        has_latency = any(data['latency'] for data in driver_results.values())
+        header = f"{'Driver':<25} {'Mean (ms)':<15} {'OPS':<15} {'vs Fastest':<20}"
+        if has_latency:
+            header += f" {'p50 (ms)':<10} {'p99 (ms)':<10} {'p99.9 (ms)':<11} {'Max (ms)':<10}"
+        print(header)
         print("-" * 120)
         
         # Print results sorted by OPS (descending)
@@ -196,11 +293,114 @@ def generate_comparison_report(json_files):
                 comparison = f"{slowdown:.2f}x slower"
             
             # Driver name is already formatted with implementation type from pytest
-            print(f"{driver:<25} {mean_ms:<15.3f} {ops:<15.2f} {comparison:<20}")
+            line = f"{driver:<25} {mean_ms:<15.3f} {ops:<15.2f} {comparison:<20}"
+            latency = data['latency']
+            if latency:
+                line += (f" {format_ms(latency, 'p50', 10)} {format_ms(latency, 'p99', 10)} "
+                         f"{format_ms(latency, 'p99.9', 11)} {latency['max'] * 1000:<10.3f}")
+            print(line)
     
     print("\n" + "=" * 120)
 
 
+def load_benchmarks(json_files):
+    """Load the benchmark entries of all readable JSON result files."""
+    benchmarks = []
+    for json_file in json_files:
+        if not os.path.exists(json_file):
+            print(f"Warning: {json_file} not found")
+            continue
+        with open(json_file, 'r') as f:
+            benchmarks.extend(json.load(f).get('benchmarks', []))
+    return benchmarks
+
+
+def generate_scaling_report(json_files):
+    """Print aggregate ops/s and scaling efficiency for thread, process and greenlet count sweeps."""
+    
+    groups = {}
+    for bench in load_benchmarks(json_files):
+        params = bench.get('params') or {}
+        dimension = next((d for d in ('processes', 'greenlets', 'threads') if d in params), None)
+        if dimension is None:
+            continue
+        key = (params.get('workload', bench['name'].split('[')[0]), params.get('driver', 'unknown'), dimension)
+        groups.setdefault(key, {})[params[dimension]] = 1.0 / bench['stats']['mean']
+    
+    if not groups:
+        print("No thread, process or greenlet scaling results found")
+        return
+    
+    print("\n" + "=" * 80)
+    print("SCALING REPORT")
+    print("=" * 80)
+    
+    for (workload, driver, dimension) in sorted(groups):
+        by_count = groups[(workload, driver, dimension)]
+        base = by_count.get(1)
+        print(f"\n{workload} - {driver} ({dimension})")
+        print("-" * 80)
+        print(f"{dimension.capitalize():<10} {'OPS':<15} {'Speedup':<12} {'Efficiency':<12}")
+        for count in sorted(by_count):
+            ops = by_count[count]
+            if base:
+                speedup = ops / base
+                print(f"{count:<10} {ops:<15.2f} {speedup:<12.2f} {speedup / count:<12.0%}")
+            else:
+                print(f"{count:<10} {ops:<15.2f} {'-':<12} {'-':<12}")
+    
+    print("\n" + "=" * 80)
+
+
+def fit_linear(points):
+    """Least-squares fit of y = a + b * x over (x, y) points; returns (a, b)."""
+    n = len(points)
+    mean_x = sum(x for x, _ in points) / n
+    mean_y = sum(y for _, y in points) / n
+    var_x = sum((x - mean_x) ** 2 for x, _ in points)
+    if var_x == 0:
+        return mean_y, 0.0
+    b = sum((x - mean_x) * (y - mean_y) for x, y in points) / var_x
+    return mean_y - b * mean_x, b
+
+
+def generate_result_size_report(json_files):
+    """Print rows/s and MB/s per result size and the fitted per-query and per-row cost."""
+    
+    groups = {}
+    for bench in load_benchmarks(json_files):
+        params = bench.get('params') or {}
+        if 'rows' not in params or 'width' not in params:
+            continue
+        key = (params.get('driver', 'unknown'), params.get('protocol', 'text'), params['width'])
+        groups.setdefault(key, {})[params['rows']] = bench['stats']['mean']
+    
+    if not groups:
+        print("No result size results found")
+        return
+    
+    print("\n" + "=" * 80)
+    print("RESULT SIZE REPORT")
+    print("=" * 80)
+    
+    for (driver, protocol, width) in sorted(groups):
+        by_rows = groups[(driver, protocol, width)]
+        print(f"\n{driver} - {protocol}, {width} bytes per row")
+        print("-" * 80)
+        print(f"{'Rows':<10} {'Time (ms)':<12} {'Rows/s':<15} {'MB/s':<12}")
+        for rows in sorted(by_rows):
+            mean = by_rows[rows]
+            print(f"{rows:<10} {mean * 1000:<12.3f} {rows / mean:<15.0f} {rows * width / mean / 1e6:<12.2f}")
+        if len(by_rows) > 1:
+            # Weight every size equally: fit time / rows against 1 / rows
+            per_row, per_query = fit_linear([(1.0 / rows, mean / rows) for rows, mean in by_rows.items()])
+            crossover = per_query / per_row if per_row > 0 else float('inf')
+            print(f"Per query: {per_query * 1e6:.1f} us, per row: {per_row * 1e9:.1f} ns "
+                  f"(per-row cost dominates above {crossover:.0f} rows)")
+    
+    print("\n" + "=" * 80)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description='Run benchmarks comparing mariadb, mariadb_c, pymysql, and mysql-connector-python'
@@ -208,7 +408,7 @@ def main():
     parser.add_argument(
         '--benchmark',
         help='Run specific benchmark (e.g., select_1, do_1)',
-        choices=[b.replace('test_bench_', '').replace('.py', '') for b in BENCHMARKS]
+        choices=[b.replace('test_bench_', '').replace('.py', '') for b in BENCHMARKS + EXTRA_BENCHMARKS]
     )
     parser.add_argument(
         '--driver',
@@ -219,11 +419,54 @@ def main():
         '--json',
         help='Save results to JSON file'
     )
+    parser.add_argument(
+        '--server',
+        default='live',
+        choices=SERVERS,
+        help='Server to benchmark against: live (TEST_DB_* settings), fake '
+             '(local protocol stand-in, measures client-side cost only), record '
+             '(proxy to the live server, saving its responses) or replay (serve '
+             'recorded responses)'
+    )
+    parser.add_argument(
+        '--capture',
+        help='Capture file for --server record/replay '
+             '(default: capture_<driver>_<benchmark>.mdbcap)'
+    )
+    parser.add_argument(
+        '--memory',
+        action='store_true',
+        help='Also record tracemalloc peak, retained blocks per operation and RSS delta '
+             '(untimed extra rounds, see memory.py)'
+    )
+    parser.add_argument(
+        '--event-loop',
+        default=DEFAULT_EVENT_LOOP,
+        choices=EVENT_LOOPS,
+        help='Event loop the benchmarks run on (default: %(default)s; see event_loops.py)'
+    )
+    parser.add_argument(
+        '--tls',
+        default='off',
+        choices=TLS_MODES,
+        help='TLS of the benchmark connections: off, on (any version), 1.2 or 1.3 '
+             '(default: %(default)s; see tls.py)'
+    )
     parser.add_argument(
         '--compare',
         action='store_true',
         help='Generate comparison report from existing JSON files'
     )
+    parser.add_argument(
+        '--scaling',
+        action='store_true',
+        help='Generate multi-threaded scaling report from existing JSON files'
+    )
+    parser.add_argument(
+        '--result-size',
+        action='store_true',
+        help='Generate result set size report (rows/s, MB/s, per-query and per-row cost) from existing JSON files'
+    )
     parser.add_argument(
         '--compare-files',
         nargs='+',
@@ -232,18 +475,34 @@ def main():
     
     args = parser.parse_args()
     
-    if args.compare:
+    if args.compare or args.scaling or args.result_size:
+        if args.scaling:
+            report = generate_scaling_report
+        elif args.result_size:
+            report = generate_result_size_report
+        else:
+            report = generate_comparison_report
         if args.compare_files:
-            generate_comparison_report(args.compare_files)
+            report(args.compare_files)
         else:
             # Look for JSON files in current directory
             json_files = list(Path('.').glob('benchmark_*.json'))
             if json_files:
-                generate_comparison_report([str(f) for f in json_files])
+                report([str(f) for f in json_files])
             else:
                 print("No benchmark_*.json files found in current directory")
         return 0
     
+    try:
+        event_loop_policy(args.event_loop)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return 1
+    if args.tls != 'off' and args.server in ['record', 'replay']:
+        # The capture proxy parses packets, which TLS hides from it
+        print("Error: --tls can't be used with --server record/replay")
+        return 1
+    
     # Determine benchmark file
     benchmark_file = None
     if args.benchmark:
@@ -253,7 +512,12 @@ def main():
     return run_pytest_benchmark(
         benchmark_file=benchmark_file,
         driver=args.driver,
-        output_json=args.json
+        output_json=args.json,
+        server=args.server,
+        capture_file=args.capture or default_capture_file(args.benchmark, args.driver),
+        memory=args.memory,
+        event_loop=args.event_loop,
+        tls=args.tls
     )
 
 
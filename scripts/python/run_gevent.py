@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+gevent benchmark runner.
+
+Runs sync workloads from workloads.py on N greenlets in a process where
+gevent's monkey patching is applied before any driver is imported, so socket
+I/O in pure-Python drivers yields to the hub and the greenlets really run
+concurrently (test_bench_select_1_pool.py runs unpatched, where greenlets
+serialise on blocking I/O).
+
+Each greenlet uses its own connection, or with --pool-size, acquires one from
+a DBUtils PooledDB shared by all greenlets for every operation. The tables the
+workloads use are (re)created first.
+
+Supported drivers are the ones whose I/O gevent can patch: pymysql, the
+pure-Python mariadb implementation and mysql_connector with use_pure=True.
+
+Usage:
+    python run_gevent.py --driver pymysql
+    python run_gevent.py --driver mariadb --workload select_1 --greenlets 1,64,500 --pool-size 64
+    python run_gevent.py --driver mariadb --json ../../bench_results_python_mariadb_gevent_results.json
+"""
+
+from gevent import monkey
+monkey.patch_all()
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+
+import gevent
+from gevent.pool import Pool as GreenletPool
+
+from latency import format_ms, latency_summary
+from workloads import WORKLOADS, workload_tables
+
+
+GEVENT_DRIVERS = ['mariadb', 'pymysql', 'mysql_connector']
+DEFAULT_GREENLETS = [1, 8, 64, 256]
+
+
+def get_driver(driver_name):
+    """Import a driver with gevent-compatible (pure Python) I/O."""
+    if driver_name == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    from conftest import connect_config, get_driver_module
+    driver = get_driver_module(driver_name)
+    config = connect_config(driver_name)
+    if driver_name == 'mysql_connector':
+        # The C extension does blocking I/O gevent can't patch
+        config['use_pure'] = True
+    return driver, config
+
+
+class OwnConnections:
+    """One connection per greenlet."""
+
+    def __init__(self, driver, config, greenlets):
+        self.connections = [driver.connect(**config) for _ in range(greenlets)]
+
+    def runner(self, index, workload, driver_name, operations, latencies):
+        connection = self.connections[index]
+        perf_counter = time.perf_counter
+        for _ in range(operations):
+            start = perf_counter()
+            workload(connection, driver_name)
+            latencies.append(perf_counter() - start)
+
+    def close(self):
+        for conn in self.connections:
+            try:
+                conn.close()
+            except:
+                pass
+
+
+class SharedPool:
+    """A DBUtils PooledDB shared by all greenlets, one acquire per operation."""
+
+    def __init__(self, driver, config, pool_size):
+        from dbutils.pooled_db import PooledDB
+        self.pool = PooledDB(creator=driver, maxconnections=pool_size, mincached=pool_size,
+                             maxcached=pool_size, blocking=True, **config)
+
+    def runner(self, index, workload, driver_name, operations, latencies):
+        perf_counter = time.perf_counter
+        for _ in range(operations):
+            start = perf_counter()
+            connection = self.pool.connection()
+            try:
+                workload(connection, driver_name)
+            finally:
+                connection.close()
+            latencies.append(perf_counter() - start)
+
+    def close(self):
+        self.pool.close()
+
+
+def run_greenlets(connections, greenlets, workload, driver_name, operations, rounds, warmup_rounds):
+    """
+    Run `greenlets` greenlets each running `operations` operations per round.
+    Returns the per-round wall times and the per-operation latencies of the measured rounds.
+    """
+    pool = GreenletPool(greenlets)
+    times = []
+    latencies = []
+    for i in range(warmup_rounds + rounds):
+        if i == warmup_rounds:
+            latencies.clear()
+        start = time.perf_counter()
+        jobs = [pool.spawn(connections.runner, index, workload, driver_name, operations, latencies)
+                for index in range(greenlets)]
+        gevent.joinall(jobs, raise_error=True)
+        elapsed = time.perf_counter() - start
+        if i >= warmup_rounds:
+            times.append(elapsed)
+    return times, latencies
+
+
+def main():
+    parser = argparse.ArgumentParser(description='gevent (monkey patched) benchmark runner')
+    parser.add_argument('--driver', required=True, choices=GEVENT_DRIVERS, help='Driver to benchmark')
+    parser.add_argument('--workload', action='append', choices=list(WORKLOADS),
+                        help='Workload to run, repeatable (default: all)')
+    parser.add_argument('--greenlets', default=','.join(str(g) for g in DEFAULT_GREENLETS),
+                        help='Comma-separated greenlet counts (default: %(default)s)')
+    parser.add_argument('--pool-size', type=int,
+                        help='Share a DBUtils pool of this size instead of one connection per greenlet')
+    parser.add_argument('--operations', type=int, default=1000,
+                        help='Operations per round, split across greenlets (default: %(default)s)')
+    parser.add_argument('--rounds', type=int, default=20, help='Measured rounds (default: %(default)s)')
+    parser.add_argument('--warmup-rounds', type=int, default=2, help='Warmup rounds (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    driver, config = get_driver(args.driver)
+    from conftest import TLS_MODE, create_tables
+
+    workload_names = args.workload or list(WORKLOADS)
+    tables = workload_tables(workload_names)
+    if tables:
+        connection = driver.connect(**config)
+        create_tables(connection, tables)
+        connection.close()
+
+    greenlet_counts = [int(g) for g in args.greenlets.split(',') if g.strip()]
+    benchmarks = []
+    for workload_name in workload_names:
+        workload = WORKLOADS[workload_name][0]
+        print(f"\n{workload_name} - {args.driver} (gevent"
+              + (f", pool of {args.pool_size})" if args.pool_size else ")"))
+        print("-" * 80)
+        print(f"{'Greenlets':<10} {'OPS':<15} {'p50 (ms)':<10} {'p99 (ms)':<10} {'p99.9 (ms)':<11} {'Max (ms)':<10}")
+        for greenlets in greenlet_counts:
+            per_greenlet = max(1, args.operations // greenlets)
+            total = per_greenlet * greenlets
+            if args.pool_size:
+                connections = SharedPool(driver, config, args.pool_size)
+            else:
+                connections = OwnConnections(driver, config, greenlets)
+            try:
+                times, latencies = run_greenlets(connections, greenlets, workload, args.driver, per_greenlet,
+                                      args.rounds, args.warmup_rounds)
+            finally:
+                connections.close()
+            median = statistics.median(times)
+            latency = latency_summary(latencies)
+            print(f"{greenlets:<10} {total / median:<15.2f} {format_ms(latency, 'p50', 10)} "
+                  f"{format_ms(latency, 'p99', 10)} {format_ms(latency, 'p99.9', 11)} {latency['max'] * 1000:<10.3f}")
+
+            params = {'driver': args.driver, 'workload': workload_name, 'greenlets': greenlets,
+                      'operations': total, 'tls': TLS_MODE}
+            name = f"test_gevent[{args.driver}-{greenlets}greenlets-{workload_name}]"
+            if args.pool_size:
+                params['pool_size'] = args.pool_size
+                name = f"test_gevent[{args.driver}-{greenlets}greenlets-{args.pool_size}pool-{workload_name}]"
+            benchmarks.append({
+                'name': name,
+                'fullname': f"run_gevent.py::{name}",
+                'params': params,
+                'extra_info': {'latency': latency},
+                'stats': {
+                    'min': min(times) / total,
+                    'max': max(times) / total,
+                    'mean': statistics.mean(times) / total,
+                    'median': median / total,
+                    'stddev': statistics.stdev(times) / total if len(times) > 1 else 0,
+                    'rounds': len(times),
+                    'iterations': total,
+                },
+            })
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+                'gevent_version': gevent.__version__,
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Generator-fed executemany ingest benchmark.
+
+Inserts 1M (or more) rows into perfTestTextBatch from a generator, the way an
+ETL job reading a large file would, and measures rows/s and peak RSS growth.
+Every (driver, mode, rows) point runs in a fresh process.
+
+Modes:
+- list:       the rows materialised in a list first (reference)
+- generator:  the whole generator passed to one executemany()
+- chunked:    executemany() per --chunk-size rows taken from the generator
+
+A driver materialises the input when the generator mode's peak RSS is closer
+to the list mode's than to the chunked mode's. Drivers that reject a
+generator are reported as unsupported for that mode.
+
+Usage:
+    python run_ingest.py --driver mariadb_c
+    python run_ingest.py --driver pymysql --rows 1000000,10000000 --chunk-size 50000
+    python run_ingest.py --driver asyncmy --json ../../bench_results_python_asyncmy_ingest_results.json
+
+perfTestTextBatch is (re)created before the first point. A point whose process
+dies (for example killed for running out of memory) is reported as failed.
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import sys
+import time
+
+from memory import peak_rss
+
+
+SYNC_DRIVERS = ['mariadb', 'mariadb_c', 'pymysql', 'mysql_connector']
+ASYNC_DRIVERS = ['async-mariadb', 'mysql_connector_async', 'asyncmy']
+MODES = ['list', 'generator', 'chunked']
+TEXT = 'abcdefghij' * 10
+
+
+def generate_rows(count):
+    for _ in range(count):
+        yield (TEXT,)
+
+
+def chunks(rows, size):
+    while True:
+        chunk = list(itertools.islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def insert_sql(driver_name):
+    placeholder = '?' if driver_name in ['mariadb', 'mariadb_c', 'async-mariadb'] else '%s'
+    return f"INSERT INTO perfTestTextBatch(t0) VALUES ({placeholder})"
+
+
+def create_table(driver_name):
+    """(Re)create perfTestTextBatch with `driver_name`."""
+    from conftest import async_connect, connect_config, create_tables, create_tables_async, get_driver_module
+    driver = get_driver_module(driver_name)
+    if driver_name in ASYNC_DRIVERS:
+        async def create():
+            connection = await async_connect(driver_name)
+            await create_tables_async(connection, driver_name, ['perfTestTextBatch'])
+            await connection.close()
+        asyncio.run(create())
+    else:
+        connection = driver.connect(**connect_config(driver_name))
+        create_tables(connection, ['perfTestTextBatch'])
+        connection.close()
+
+
+def measure_sync(driver_name, mode, rows, chunk_size):
+    from conftest import connect_config, get_driver_module
+    driver = get_driver_module(driver_name)
+    connection = driver.connect(**connect_config(driver_name))
+    cursor = connection.cursor()
+    sql = insert_sql(driver_name)
+    rss_before = peak_rss()
+    start = time.perf_counter()
+    if mode == 'list':
+        cursor.executemany(sql, list(generate_rows(rows)))
+    elif mode == 'generator':
+        cursor.executemany(sql, generate_rows(rows))
+    else:
+        for chunk in chunks(generate_rows(rows), chunk_size):
+            cursor.executemany(sql, chunk)
+    connection.commit()
+    elapsed = time.perf_counter() - start
+    rss_delta = peak_rss() - rss_before
+    cursor.close()
+    connection.close()
+    return elapsed, rss_delta
+
+
+async def measure_async(driver_name, mode, rows, chunk_size):
+    from conftest import async_connect, get_async_cursor, get_driver_module
+    get_driver_module(driver_name)
+    connection = await async_connect(driver_name)
+    sql = insert_sql(driver_name)
+    rss_before = peak_rss()
+    start = time.perf_counter()
+    async with get_async_cursor(connection, driver_name) as cursor:
+        if mode == 'list':
+            await cursor.executemany(sql, list(generate_rows(rows)))
+        elif mode == 'generator':
+            await cursor.executemany(sql, generate_rows(rows))
+        else:
+            for chunk in chunks(generate_rows(rows), chunk_size):
+                await cursor.executemany(sql, chunk)
+    await connection.commit()
+    elapsed = time.perf_counter() - start
+    rss_delta = peak_rss() - rss_before
+    await connection.close()
+    return elapsed, rss_delta
+
+
+def worker(driver_name, mode, rows, chunk_size, results):
+    """Child process body: one (driver, mode, rows) point."""
+    if driver_name == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    elif driver_name == 'mariadb_c':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    try:
+        if driver_name in ASYNC_DRIVERS:
+            elapsed, rss_delta = asyncio.run(measure_async(driver_name, mode, rows, chunk_size))
+        else:
+            elapsed, rss_delta = measure_sync(driver_name, mode, rows, chunk_size)
+    except Exception as e:
+        results.put((None, None, repr(e)))
+        return
+    results.put((elapsed, rss_delta, None))
+
+
+def run_point(driver_name, mode, rows, chunk_size):
+    """
+    Returns {'seconds', 'rows_per_sec', 'peak_rss_delta'}, {'error'} when the
+    driver rejected the input, or {'error', 'exitcode'} when the process died.
+    """
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=worker, args=(driver_name, mode, rows, chunk_size, results))
+    process.start()
+    exited = False
+    while True:
+        try:
+            elapsed, rss_delta, error = results.get(timeout=1)
+            break
+        except queue.Empty:
+            # a process that died never puts its result; give it one more
+            # poll, as its last put may still be on the way
+            if exited:
+                process.join()
+                return {'error': f"exited with code {process.exitcode} without a result",
+                        'exitcode': process.exitcode}
+            exited = not process.is_alive()
+    process.join()
+    if error:
+        return {'error': error}
+    return {'seconds': elapsed, 'rows_per_sec': rows / elapsed, 'peak_rss_delta': rss_delta}
+
+
+def materialises(points):
+    """True/False when list, generator and chunked all ran, else None."""
+    if any(mode not in points or 'error' in points[mode] for mode in MODES):
+        return None
+    chunked = points['chunked']['peak_rss_delta']
+    materialised = points['list']['peak_rss_delta'] - chunked
+    if materialised <= 0:
+        return None
+    return points['generator']['peak_rss_delta'] - chunked > materialised / 2
+
+
+def to_benchmark_entry(driver_name, mode, rows, chunk_size, stats, materialised):
+    """pytest-benchmark compatible entry; 1 / mean is rows/s."""
+    from conftest import TLS_MODE
+    name = f"test_ingest[{driver_name}-{mode}-{rows}rows]"
+    extra_info = {'rows_per_sec': stats['rows_per_sec'], 'peak_rss_delta': stats['peak_rss_delta']}
+    if mode == 'generator' and materialised is not None:
+        extra_info['materialises_input'] = materialised
+    per_row = stats['seconds'] / rows
+    return {
+        'name': name,
+        'fullname': f"run_ingest.py::{name}",
+        'params': {'driver': driver_name, 'mode': mode, 'rows': rows,
+                   'chunk_size': chunk_size if mode == 'chunked' else None, 'tls': TLS_MODE},
+        'extra_info': extra_info,
+        'stats': {
+            'min': per_row,
+            'max': per_row,
+            'mean': per_row,
+            'median': per_row,
+            'stddev': 0,
+            'rounds': 1,
+            'iterations': rows,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generator-fed executemany ingest benchmark')
+    parser.add_argument('--driver', required=True, choices=SYNC_DRIVERS + ASYNC_DRIVERS,
+                        help='Driver to benchmark')
+    parser.add_argument('--mode', action='append', choices=MODES,
+                        help='Input mode, repeatable (default: all)')
+    parser.add_argument('--rows', default='1000000',
+                        help='Comma-separated row counts (default: %(default)s)')
+    parser.add_argument('--chunk-size', type=int, default=10000,
+                        help='Rows per executemany() in chunked mode (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    if args.driver == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    elif args.driver == 'mariadb_c':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    create_table(args.driver)
+
+    modes = args.mode or MODES
+    benchmarks = []
+    for rows in [int(r) for r in args.rows.split(',') if r.strip()]:
+        print(f"\n{rows} rows into perfTestTextBatch - {args.driver} (chunks of {args.chunk_size})")
+        print("-" * 80)
+        print(f"{'Mode':<12} {'Rows/s':<14} {'Total (s)':<11} {'Peak RSS (MB)':<15}")
+        points = {}
+        for mode in modes:
+            stats = points[mode] = run_point(args.driver, mode, rows, args.chunk_size)
+            if 'exitcode' in stats:
+                print(f"{mode:<12} failed: {stats['error']}")
+            elif 'error' in stats:
+                print(f"{mode:<12} unsupported: {stats['error']}")
+            else:
+                print(f"{mode:<12} {stats['rows_per_sec']:<14.0f} {stats['seconds']:<11.3f} "
+                      f"{stats['peak_rss_delta'] / 1e6:<15.1f}")
+
+        materialised = materialises(points)
+        if materialised is not None:
+            print(f"Generator input {'is materialised' if materialised else 'is consumed incrementally'}")
+        for mode in modes:
+            if 'error' not in points[mode]:
+                benchmarks.append(to_benchmark_entry(args.driver, mode, rows, args.chunk_size,
+                                                     points[mode], materialised))
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
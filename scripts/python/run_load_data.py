@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+LOAD DATA LOCAL INFILE versus executemany bulk-load benchmark.
+
+Generates deterministic CSV files (kept in --data-dir for later runs) and
+loads them with the driver's local infile support, then inserts the same rows
+with executemany() in --chunk-size batches (bulk or multi-value rewrite,
+whichever the driver does best, see test_bench_executemany.py). Reports rows/s
+and client CPU time (process_time of this process only) for both.
+
+Datasets:
+- text: perfTestTextBatch(t0), one 100 character string
+- wide: perfTestMixedBatch(i0, d0, n0, t0, dt0), BIGINT, DOUBLE, DECIMAL,
+        VARCHAR and DATETIME
+
+Local infile is enabled with local_infile=True (mariadb, pymysql, asyncmy) or
+allow_local_infile=True (mysql_connector). The server needs local_infile=ON.
+
+Usage:
+    python run_load_data.py --driver mariadb_c
+    python run_load_data.py --driver pymysql --rows 1000,100000,10000000 --dataset wide
+    python run_load_data.py --driver mysql_connector --json ../../bench_results_python_mysql_connector_load_data_results.json
+
+The dataset tables are (re)created before the first load.
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from decimal import Decimal
+
+
+SYNC_DRIVERS = ['mariadb', 'mariadb_c', 'pymysql', 'mysql_connector']
+ASYNC_DRIVERS = ['async-mariadb', 'mysql_connector_async', 'asyncmy']
+METHODS = ['load_data', 'executemany']
+
+DATASETS = {
+    'text': ('perfTestTextBatch', ['t0'],
+             lambda i: ('abcdefghij' * 10,)),
+    'wide': ('perfTestMixedBatch', ['i0', 'd0', 'n0', 't0', 'dt0'],
+             lambda i: (i, i * 0.5, Decimal('1234.56'), 'abcdefghij' * 3,
+                        datetime.datetime(2025, 1, 1, 12, 0, i % 60))),
+}
+
+
+def local_infile_option(driver_name):
+    if driver_name in ['mysql_connector', 'mysql_connector_async']:
+        return {'allow_local_infile': True}
+    return {'local_infile': True}
+
+
+def csv_file(data_dir, dataset, rows):
+    """Path of the dataset's CSV with `rows` lines, written on first use."""
+    path = os.path.join(data_dir, f"load_data_{dataset}_{rows}.csv")
+    if not os.path.exists(path):
+        make_row = DATASETS[dataset][2]
+        with open(path + '.tmp', 'w', encoding='utf-8', newline='\n') as f:
+            for i in range(rows):
+                f.write(','.join(str(value) for value in make_row(i)) + '\n')
+        os.replace(path + '.tmp', path)
+    return path
+
+
+def load_sql(dataset, path):
+    table, columns, _ = DATASETS[dataset]
+    return (f"LOAD DATA LOCAL INFILE '{path.replace(os.sep, '/')}' INTO TABLE {table} "
+            f"FIELDS TERMINATED BY ',' LINES TERMINATED BY '\\n' ({', '.join(columns)})")
+
+
+def insert_sql(dataset, driver_name):
+    table, columns, _ = DATASETS[dataset]
+    placeholder = '?' if driver_name in ['mariadb', 'mariadb_c', 'async-mariadb'] else '%s'
+    return f"INSERT INTO {table}({', '.join(columns)}) VALUES ({', '.join([placeholder] * len(columns))})"
+
+
+def row_chunks(dataset, rows, chunk_size):
+    make_row = DATASETS[dataset][2]
+    for start in range(0, rows, chunk_size):
+        yield [make_row(i) for i in range(start, min(rows, start + chunk_size))]
+
+
+def measure_sync(connection, driver_name, method, dataset, rows, path, chunk_size):
+    """Returns (wall seconds, client CPU seconds) of one load."""
+    cursor = connection.cursor()
+    chunks = None if method == 'load_data' else list(row_chunks(dataset, rows, chunk_size))
+    wall, cpu = time.perf_counter(), time.process_time()
+    if method == 'load_data':
+        cursor.execute(load_sql(dataset, path))
+    else:
+        sql = insert_sql(dataset, driver_name)
+        for chunk in chunks:
+            cursor.executemany(sql, chunk)
+    connection.commit()
+    result = time.perf_counter() - wall, time.process_time() - cpu
+    cursor.close()
+    return result
+
+
+async def measure_async(connection, driver_name, method, dataset, rows, path, chunk_size):
+    """Async counterpart of measure_sync."""
+    from conftest import get_async_cursor
+    chunks = None if method == 'load_data' else list(row_chunks(dataset, rows, chunk_size))
+    async with get_async_cursor(connection, driver_name) as cursor:
+        wall, cpu = time.perf_counter(), time.process_time()
+        if method == 'load_data':
+            await cursor.execute(load_sql(dataset, path))
+        else:
+            sql = insert_sql(dataset, driver_name)
+            for chunk in chunks:
+                await cursor.executemany(sql, chunk)
+        await connection.commit()
+        return time.perf_counter() - wall, time.process_time() - cpu
+
+
+def run(args, points):
+    """Yield (dataset, rows, method, stats) for every point, stats holding an error if it failed."""
+    from conftest import async_connect, connect_config, create_tables, create_tables_async, get_driver_module
+    driver = get_driver_module(args.driver)
+    options = local_infile_option(args.driver)
+    is_async = args.driver in ASYNC_DRIVERS
+    loop = asyncio.new_event_loop() if is_async else None
+    try:
+        if is_async:
+            connection = loop.run_until_complete(async_connect(args.driver, **options))
+        else:
+            connection = driver.connect(**connect_config(args.driver, **options))
+        tables = list(dict.fromkeys(DATASETS[dataset][0] for dataset, _, _ in points))
+        if is_async:
+            loop.run_until_complete(create_tables_async(connection, args.driver, tables))
+        else:
+            create_tables(connection, tables)
+        for dataset, rows, method in points:
+            path = csv_file(args.data_dir, dataset, rows)
+            try:
+                if is_async:
+                    wall, cpu = loop.run_until_complete(measure_async(connection, args.driver, method, dataset,
+                                                                      rows, path, args.chunk_size))
+                else:
+                    wall, cpu = measure_sync(connection, args.driver, method, dataset, rows, path, args.chunk_size)
+            except Exception as e:
+                yield dataset, rows, method, {'error': repr(e)}
+                continue
+            yield dataset, rows, method, {'seconds': wall, 'cpu_seconds': cpu, 'rows_per_sec': rows / wall}
+        if is_async:
+            loop.run_until_complete(connection.close())
+        else:
+            connection.close()
+    finally:
+        if loop:
+            loop.close()
+
+
+def to_benchmark_entry(driver_name, dataset, rows, method, chunk_size, stats):
+    """pytest-benchmark compatible entry; 1 / mean is rows/s."""
+    from conftest import TLS_MODE
+    name = f"test_load_data[{driver_name}-{dataset}-{method}-{rows}rows]"
+    per_row = stats['seconds'] / rows
+    return {
+        'name': name,
+        'fullname': f"run_load_data.py::{name}",
+        'params': {'driver': driver_name, 'dataset': dataset, 'method': method, 'rows': rows,
+                   'chunk_size': chunk_size if method == 'executemany' else None, 'tls': TLS_MODE},
+        'extra_info': {'rows_per_sec': stats['rows_per_sec'], 'cpu_seconds': stats['cpu_seconds'],
+                       'cpu_per_row': stats['cpu_seconds'] / rows},
+        'stats': {
+            'min': per_row,
+            'max': per_row,
+            'mean': per_row,
+            'median': per_row,
+            'stddev': 0,
+            'rounds': 1,
+            'iterations': rows,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='LOAD DATA LOCAL INFILE versus executemany bulk-load benchmark')
+    parser.add_argument('--driver', required=True, choices=SYNC_DRIVERS + ASYNC_DRIVERS,
+                        help='Driver to benchmark')
+    parser.add_argument('--dataset', action='append', choices=list(DATASETS),
+                        help='Dataset, repeatable (default: all)')
+    parser.add_argument('--rows', default='1000,100000,1000000',
+                        help='Comma-separated row counts, up to 10M (default: %(default)s)')
+    parser.add_argument('--chunk-size', type=int, default=10000,
+                        help='Rows per executemany() (default: %(default)s)')
+    parser.add_argument('--data-dir', default=os.path.join(tempfile.gettempdir(), 'mariadb_bench_load_data'),
+                        help='Directory for the generated CSV files (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    if args.driver == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    elif args.driver == 'mariadb_c':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    os.makedirs(args.data_dir, exist_ok=True)
+
+    row_counts = [int(r) for r in args.rows.split(',') if r.strip()]
+    points = [(dataset, rows, method) for dataset in args.dataset or list(DATASETS)
+              for rows in row_counts for method in METHODS]
+
+    print(f"\nLOAD DATA LOCAL INFILE vs executemany - {args.driver} (executemany chunks of {args.chunk_size})")
+    print("-" * 90)
+    print(f"{'Dataset':<8} {'Rows':<10} {'Method':<12} {'Rows/s':<14} {'Total (s)':<11} "
+          f"{'CPU (s)':<10} {'CPU/row (us)':<12}")
+
+    benchmarks = []
+    for dataset, rows, method, stats in run(args, points):
+        if 'error' in stats:
+            print(f"{dataset:<8} {rows:<10} {method:<12} failed: {stats['error']}")
+            continue
+        print(f"{dataset:<8} {rows:<10} {method:<12} {stats['rows_per_sec']:<14.0f} {stats['seconds']:<11.3f} "
+              f"{stats['cpu_seconds']:<10.3f} {stats['cpu_seconds'] / rows * 1e6:<12.2f}")
+        benchmarks.append(to_benchmark_entry(args.driver, dataset, rows, method, args.chunk_size, stats))
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
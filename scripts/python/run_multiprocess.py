@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Multi-process client load generator.
+
+Starts N worker processes, each pinned to its own core and holding its own
+connection, runs a workload from workloads.py in all of them for a fixed
+duration, and merges their samples into one throughput and latency result.
+The tables the workloads use are (re)created first.
+Sweeping the process count shows where the client stops being the bottleneck
+and the server starts.
+
+Usage:
+    # Sweep 1, 2, 4 ... up to the number of cores
+    python run_multiprocess.py --driver mariadb_c --workload select_1
+
+    # Explicit process counts, all workloads, save results
+    python run_multiprocess.py --driver pymysql --processes 1,2,4,8 --json benchmark_pymysql_mp.json
+    python run_benchmarks.py --scaling --compare-files benchmark_pymysql_mp.json
+"""
+
+import argparse
+import array
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import sys
+import time
+
+from latency import LatencyHistogram, format_ms
+from workloads import WORKLOADS, workload_tables
+
+
+SYNC_DRIVERS = ['mariadb', 'mariadb_c', 'pymysql', 'mysql_connector']
+# seconds on top of --duration a worker has to connect, warm up and report
+WORKER_TIMEOUT = 120
+
+
+def pin_to_core(core):
+    """Pin the current process to one CPU core, where the platform allows it."""
+    try:
+        if hasattr(os, 'sched_setaffinity'):
+            cores = sorted(os.sched_getaffinity(0))
+            os.sched_setaffinity(0, {cores[core % len(cores)]})
+            return True
+        import psutil
+        process = psutil.Process()
+        cores = process.cpu_affinity()
+        process.cpu_affinity([cores[core % len(cores)]])
+        return True
+    except (ImportError, AttributeError, OSError):
+        return False
+
+
+def available_cores():
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def worker(index, driver_name, workload_name, duration, warmup, barrier, results):
+    """Worker process body: connect, warm up, wait for all workers, then run for `duration` seconds."""
+    pin_to_core(index)
+    if driver_name == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    elif driver_name == 'mariadb_c':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    from conftest import connect_config, get_driver_module
+
+    workload = WORKLOADS[workload_name][0]
+    try:
+        driver = get_driver_module(driver_name)
+        connection = driver.connect(**connect_config(driver_name))
+        for _ in range(warmup):
+            workload(connection, driver_name)
+
+        barrier.wait()
+        latencies = array.array('d')
+        perf_counter = time.perf_counter
+        start = perf_counter()
+        deadline = start + duration
+        now = start
+        while now < deadline:
+            op_start = now
+            workload(connection, driver_name)
+            now = perf_counter()
+            latencies.append(now - op_start)
+        elapsed = now - start
+        connection.close()
+    except Exception as e:
+        barrier.abort()
+        results.put((index, None, None, repr(e)))
+        return
+    results.put((index, elapsed, LatencyHistogram(latencies).to_dict(), None))
+
+
+def create_workload_tables(driver_name, workload_names):
+    """(Re)create the tables the workloads use, from this process."""
+    from conftest import connect_config, create_tables, get_driver_module
+    tables = workload_tables(workload_names)
+    if tables:
+        connection = get_driver_module(driver_name).connect(**connect_config(driver_name))
+        create_tables(connection, tables)
+        connection.close()
+
+
+def run_processes(driver_name, workload_name, processes, duration, warmup):
+    """Run one (driver, workload, process count) point and return merged statistics."""
+    context = multiprocessing.get_context('spawn')
+    barrier = context.Barrier(processes)
+    results = context.Queue()
+    workers = [context.Process(target=worker,
+                               args=(i, driver_name, workload_name, duration, warmup, barrier, results))
+               for i in range(processes)]
+    for p in workers:
+        p.start()
+
+    total_ops_per_sec = 0.0
+    latencies = LatencyHistogram()
+    errors = []
+    pending = set(range(processes))
+    # startup, warmup and the run itself have this long, then the remaining workers are given up on
+    deadline = time.monotonic() + duration + WORKER_TIMEOUT
+    gone = set()
+    while pending:
+        try:
+            index, elapsed, histogram, error = results.get(timeout=1)
+        except queue.Empty:
+            # a worker that died (or hangs) never puts its result; give a dead one
+            # one more poll, as its last put may still be on the way
+            dead = {i for i in pending if not workers[i].is_alive()}
+            for i in dead & gone:
+                errors.append(f"worker {i}: exited with code {workers[i].exitcode} without a result")
+                pending.discard(i)
+            gone = dead
+            if pending and time.monotonic() > deadline:
+                for i in sorted(pending):
+                    errors.append(f"worker {i}: no result after {duration + WORKER_TIMEOUT:g}s")
+                    workers[i].terminate()
+                pending.clear()
+            continue
+        pending.discard(index)
+        if error:
+            errors.append(f"worker {index}: {error}")
+            continue
+        worker_latencies = LatencyHistogram.from_dict(histogram)
+        total_ops_per_sec += worker_latencies.count / elapsed
+        latencies.merge(worker_latencies)
+    for p in workers:
+        p.join()
+    if errors:
+        raise RuntimeError("; ".join(sorted(errors)))
+
+    return {
+        'ops_per_sec': total_ops_per_sec,
+        'operations': latencies.count,
+        'latency': latencies.summary(),
+    }
+
+
+def to_benchmark_entry(driver_name, workload_name, processes, stats):
+    """Convert merged statistics to a pytest-benchmark compatible entry (1 / mean = aggregate ops/s)."""
+    from conftest import TLS_MODE
+    per_op = 1.0 / stats['ops_per_sec']
+    name = f"test_processes[{driver_name}-{processes}procs-{workload_name}]"
+    return {
+        'name': name,
+        'fullname': f"run_multiprocess.py::{name}",
+        'params': {'driver': driver_name, 'workload': workload_name, 'processes': processes, 'tls': TLS_MODE},
+        'extra_info': {'latency': stats['latency'], 'operations': stats['operations']},
+        'stats': {
+            'min': per_op,
+            'max': per_op,
+            'mean': per_op,
+            'median': per_op,
+            'stddev': 0,
+            'rounds': 1,
+            'iterations': stats['operations'],
+        },
+    }
+
+
+def main():
+    cores = available_cores()
+    default_processes = sorted({1 << i for i in range(cores.bit_length()) if 1 << i <= cores} | {cores})
+
+    parser = argparse.ArgumentParser(description='Multi-process client load generator')
+    parser.add_argument('--driver', required=True, choices=SYNC_DRIVERS, help='Driver to benchmark')
+    parser.add_argument('--workload', action='append', choices=list(WORKLOADS),
+                        help='Workload to run, repeatable (default: all)')
+    parser.add_argument('--processes', default=','.join(str(p) for p in default_processes),
+                        help='Comma-separated process counts (default: %(default)s)')
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help='Measured seconds per point (default: %(default)s)')
+    parser.add_argument('--warmup', type=int, default=1000,
+                        help='Warmup operations per worker (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    if args.driver == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    elif args.driver == 'mariadb_c':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    workload_names = args.workload or list(WORKLOADS)
+    create_workload_tables(args.driver, workload_names)
+
+    process_counts = [int(p) for p in args.processes.split(',') if p.strip()]
+    benchmarks = []
+    for workload_name in workload_names:
+        print(f"\n{workload_name} - {args.driver} ({cores} cores available)")
+        print("-" * 80)
+        print(f"{'Processes':<10} {'OPS':<15} {'Efficiency':<12} {'p50 (ms)':<10} {'p99 (ms)':<10} "
+              f"{'p99.9 (ms)':<11} {'Max (ms)':<10}")
+        single = None
+        for processes in process_counts:
+            stats = run_processes(args.driver, workload_name, processes, args.duration, args.warmup)
+            if processes == 1:
+                single = stats['ops_per_sec']
+            efficiency = f"{stats['ops_per_sec'] / (single * processes):.0%}" if single else "-"
+            latency = stats['latency']
+            print(f"{processes:<10} {stats['ops_per_sec']:<15.2f} {efficiency:<12} "
+                  f"{format_ms(latency, 'p50', 10)} {format_ms(latency, 'p99', 10)} "
+                  f"{format_ms(latency, 'p99.9', 11)} {latency['max'] * 1000:<10.3f}")
+            benchmarks.append(to_benchmark_entry(args.driver, workload_name, processes, stats))
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+                'cpu_count': cores,
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
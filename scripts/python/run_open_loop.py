@@ -0,0 +1,339 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Open-loop constant-rate load runner.
+
+The test_bench_*.py benchmarks are closed-loop: the next call starts when the
+previous one returns, so a driver stall delays the requests behind it without
+showing up in their latency (coordinated omission). This runner schedules
+operations at a fixed target rate instead, operation i being due at
+start + i / rate, and measures each latency from that intended start time, so
+queueing behind a stall is counted. Sweeping the rate gives a latency vs
+throughput curve per driver; the saturation point is the first rate whose
+achieved throughput falls short of the target.
+
+Executors:
+- sync:    --connections threads, each with its own connection (or a pool)
+- asyncio: one task per operation, sharing --connections connections (or a pool)
+- gevent:  the sync executor on greenlets, in a subprocess monkey patched
+           before any driver import
+
+Workloads: do_1, select_1, and select_1_pool (SELECT 1 acquiring a pooled
+connection for every operation).
+
+Usage:
+    python run_open_loop.py --driver mariadb_c --workload select_1 --rates 1000,5000,10000,20000
+    python run_open_loop.py --driver async-mariadb --executor asyncio --workload select_1_pool
+    python run_open_loop.py --driver pymysql --executor gevent --json ../../bench_results_python_pymysql_open_loop_results.json
+"""
+
+import os
+
+if os.environ.get('OPEN_LOOP_GEVENT') == '1':
+    from gevent import monkey
+    monkey.patch_all()
+
+import argparse
+import asyncio
+import itertools
+import json
+import platform
+import subprocess
+import sys
+import threading
+import time
+
+from conftest import DB_CONFIG, TLS_MODE, async_connect, get_driver_module, tls_options
+from latency import LatencyHistogram, format_ms
+from pools import AsyncMariaDBPool, AsyncmyPool, DBUtilsPool, MariaDBPool
+from workloads import ASYNC_WORKLOADS, WORKLOADS
+
+
+EXECUTORS = {
+    'sync': ['mariadb', 'mariadb_c', 'pymysql', 'mysql_connector'],
+    'asyncio': ['async-mariadb', 'mysql_connector_async', 'asyncmy'],
+    'gevent': ['mariadb', 'pymysql', 'mysql_connector'],
+}
+OPEN_LOOP_WORKLOADS = ['do_1', 'select_1', 'select_1_pool']
+# Async drivers with a pool for select_1_pool (pools.py)
+ASYNC_POOL_DRIVERS = ['async-mariadb', 'asyncmy']
+DEFAULT_RATES = [500, 1000, 2000, 5000, 10000, 20000]
+
+
+def sync_setup(driver_name, executor):
+    """Import the driver (pure Python I/O under gevent) and return (driver, connection settings)."""
+    if driver_name == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    elif driver_name == 'mariadb_c':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    driver = get_driver_module(driver_name)
+    config = tls_options(driver_name)
+    if executor == 'gevent' and driver_name == 'mysql_connector':
+        # The C extension does blocking I/O gevent can't patch
+        config['use_pure'] = True
+    return driver, config
+
+
+def sync_operation(driver, driver_name, config, workload_name, connections, pool_size):
+    """Return (per-worker operation factory, close) for the sync and gevent executors."""
+    if workload_name == 'select_1_pool':
+        if driver_name in ['mariadb', 'mariadb_c']:
+            pool = MariaDBPool(driver, pool_size, **config)
+        else:
+            pool = DBUtilsPool(driver, pool_size, **config)
+        select_1 = WORKLOADS['select_1'][0]
+
+        def pooled(index):
+            def operation():
+                handle = pool.acquire()
+                try:
+                    select_1(pool.connection(handle), driver_name)
+                finally:
+                    pool.release(handle)
+            return operation
+        return pooled, pool.close
+
+    workload = WORKLOADS[workload_name][0]
+    opened = [driver.connect(**dict(DB_CONFIG, **config)) for _ in range(connections)]
+
+    def own(index):
+        connection = opened[index]
+        return lambda: workload(connection, driver_name)
+
+    def close():
+        for conn in opened:
+            try:
+                conn.close()
+            except:
+                pass
+    return own, close
+
+
+def run_sync(operation_factory, workers, rate, duration):
+    """
+    Issue operations at `rate` per second for `duration` seconds from `workers`
+    threads. A worker that falls behind starts the next due operation at once,
+    and latency is taken from the operation's intended start time.
+    """
+    interval = 1.0 / rate
+    total = int(rate * duration)
+    counter = itertools.count()
+    histogram = LatencyHistogram()
+    lock = threading.Lock()
+    start = time.perf_counter() + 0.05
+    finished = []
+
+    def worker(index):
+        operation = operation_factory(index)
+        perf_counter = time.perf_counter
+        latencies = []
+        while True:
+            i = next(counter)
+            if i >= total:
+                break
+            intended = start + i * interval
+            delay = intended - perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            operation()
+            latencies.append(perf_counter() - intended)
+        with lock:
+            for latency in latencies:
+                histogram.record(latency)
+            finished.append(perf_counter())
+
+    threads = [threading.Thread(target=worker, args=(i,), daemon=True) for i in range(workers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return histogram, histogram.count / (max(finished) - start)
+
+
+async def run_asyncio(driver, driver_name, workload_name, connections, pool_size, rate, duration):
+    """
+    Start one task per operation at its intended time, each borrowing a
+    connection (or a pooled one); latency is taken from the intended start time.
+    """
+    if workload_name == 'select_1_pool':
+        if driver_name == 'async-mariadb':
+            pool = AsyncMariaDBPool(driver, pool_size, **tls_options(driver_name))
+        elif driver_name == 'asyncmy':
+            pool = AsyncmyPool(driver, pool_size, **tls_options(driver_name))
+        else:
+            raise ValueError(f"no async pool for {driver_name}")
+        await pool.open()
+        workload = ASYNC_WORKLOADS['select_1'][0]
+
+        async def operation():
+            handle = await pool.acquire()
+            try:
+                await workload(pool.connection(handle), driver_name)
+            finally:
+                await pool.release(handle)
+
+        close = pool.close
+    else:
+        idle = asyncio.Queue()
+        opened = [await async_connect(driver_name) for _ in range(connections)]
+        for conn in opened:
+            idle.put_nowait(conn)
+        workload = ASYNC_WORKLOADS[workload_name][0]
+
+        async def operation():
+            conn = await idle.get()
+            try:
+                await workload(conn, driver_name)
+            finally:
+                idle.put_nowait(conn)
+
+        async def close():
+            for conn in opened:
+                try:
+                    await conn.close()
+                except:
+                    pass
+
+    histogram = LatencyHistogram()
+    finished = []
+    perf_counter = time.perf_counter
+
+    async def timed(intended):
+        await operation()
+        now = perf_counter()
+        histogram.record(now - intended)
+        finished.append(now)
+
+    interval = 1.0 / rate
+    start = perf_counter() + 0.05
+    tasks = []
+    try:
+        for i in range(int(rate * duration)):
+            intended = start + i * interval
+            delay = intended - perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            tasks.append(asyncio.create_task(timed(intended)))
+        await asyncio.gather(*tasks)
+    finally:
+        await close()
+    return histogram, histogram.count / (max(finished) - start)
+
+
+def run_rate(args, driver, config, rate):
+    if args.executor == 'asyncio':
+        return asyncio.run(run_asyncio(driver, args.driver, args.workload, args.connections,
+                                       args.pool_size, rate, args.duration))
+    operation_factory, close = sync_operation(driver, args.driver, config, args.workload,
+                                              args.connections, args.pool_size)
+    try:
+        return run_sync(operation_factory, args.connections, rate, args.duration)
+    finally:
+        close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Open-loop constant-rate load runner')
+    parser.add_argument('--driver', required=True,
+                        choices=sorted({d for drivers in EXECUTORS.values() for d in drivers}),
+                        help='Driver to benchmark')
+    parser.add_argument('--executor', default='sync', choices=list(EXECUTORS),
+                        help='Executor (default: %(default)s)')
+    parser.add_argument('--workload', default='select_1', choices=OPEN_LOOP_WORKLOADS,
+                        help='Workload (default: %(default)s)')
+    parser.add_argument('--rates', default=','.join(str(r) for r in DEFAULT_RATES),
+                        help='Comma-separated target rates in operations/s (default: %(default)s)')
+    parser.add_argument('--duration', type=float, default=5.0,
+                        help='Seconds per rate (default: %(default)s)')
+    parser.add_argument('--connections', type=int, default=16,
+                        help='Connections (and sync/gevent workers) (default: %(default)s)')
+    parser.add_argument('--pool-size', type=int, default=8,
+                        help='Pool size for select_1_pool (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    if args.driver not in EXECUTORS[args.executor]:
+        parser.error(f"--driver {args.driver} isn't supported by the {args.executor} executor "
+                     f"(use one of {', '.join(EXECUTORS[args.executor])})")
+    if args.executor == 'asyncio' and args.workload == 'select_1_pool' and args.driver not in ASYNC_POOL_DRIVERS:
+        parser.error(f"--workload select_1_pool has no async pool for --driver {args.driver} "
+                     f"(use one of {', '.join(ASYNC_POOL_DRIVERS)})")
+
+    if args.executor == 'gevent' and os.environ.get('OPEN_LOOP_GEVENT') != '1':
+        # Re-run in a fresh process, patched before the driver is imported
+        env = dict(os.environ, OPEN_LOOP_GEVENT='1')
+        return subprocess.call([sys.executable, os.path.abspath(__file__)] + sys.argv[1:], env=env)
+
+    if args.executor == 'asyncio':
+        driver, config = get_driver_module(args.driver), {}
+    else:
+        driver, config = sync_setup(args.driver, args.executor)
+
+    rates = [int(r) for r in args.rates.split(',') if r.strip()]
+    print(f"\n{args.workload} - {args.driver} ({args.executor}, open loop, {args.connections} connections)")
+    print("-" * 100)
+    print(f"{'Target/s':<10} {'Achieved/s':<12} {'p50 (ms)':<10} {'p90 (ms)':<10} {'p99 (ms)':<10} "
+          f"{'p99.9 (ms)':<11} {'Max (ms)':<10}")
+
+    benchmarks = []
+    saturation = None
+    for rate in rates:
+        histogram, achieved = run_rate(args, driver, config, rate)
+        latency = histogram.summary()
+        saturated = achieved < 0.95 * rate
+        if saturated and saturation is None:
+            saturation = rate
+        print(f"{rate:<10} {achieved:<12.0f} {format_ms(latency, 'p50', 10)} {format_ms(latency, 'p90', 10)} "
+              f"{format_ms(latency, 'p99', 10)} {format_ms(latency, 'p99.9', 11)} {latency['max'] * 1000:<10.3f}"
+              + ("  saturated" if saturated else ""))
+
+        name = f"test_open_loop[{args.driver}-{args.executor}-{rate}rps-{args.workload}]"
+        benchmarks.append({
+            'name': name,
+            'fullname': f"run_open_loop.py::{name}",
+            'params': {'driver': args.driver, 'executor': args.executor, 'workload': args.workload,
+                       'target_rate': rate, 'connections': args.connections, 'tls': TLS_MODE},
+            'extra_info': {'latency': latency, 'achieved_rate': achieved, 'saturated': saturated},
+            # 1 / mean is the achieved rate
+            'stats': {
+                'min': 1.0 / achieved,
+                'max': 1.0 / achieved,
+                'mean': 1.0 / achieved,
+                'median': 1.0 / achieved,
+                'stddev': 0,
+                'rounds': 1,
+                'iterations': histogram.count,
+            },
+        })
+
+    if saturation:
+        print(f"\nSaturated at {saturation}/s (achieved rate below 95% of target)")
+    else:
+        print("\nNot saturated at the highest target rate")
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
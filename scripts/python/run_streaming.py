@@ -0,0 +1,294 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Large result streaming benchmark.
+
+Reads SELECT seq, REPEAT('a', width) FROM seq_1_to_N (1M rows by default)
+with each fetch mode and reports rows/s, time to first row and peak RSS
+growth. Every (driver, mode) point runs in a fresh process, so the peak RSS is
+that of the fetch alone and not of whatever an earlier mode left behind.
+
+Modes:
+- fetchall:          buffered cursor, fetchall()
+- fetchmany:         buffered cursor, fetchmany(size) for each --fetch-sizes
+- iterate:           buffered cursor, row by row
+- stream:            unbuffered cursor, row by row
+- stream_fetchmany:  unbuffered cursor, fetchmany(size) for each --fetch-sizes
+
+Unbuffered cursors: mariadb / mariadb_c / async-mariadb cursor(buffered=False),
+pymysql SSCursor, mysql_connector(_async) cursor(buffered=False), asyncmy
+SSCursor. A streaming mode whose peak RSS grows more than --bound-mb is
+reported as not bounded: the driver buffered the result after all. A point
+whose process dies (for example killed for running out of memory) is reported
+as failed.
+
+Usage:
+    python run_streaming.py --driver mariadb_c
+    python run_streaming.py --driver pymysql --rows 5000000 --mode stream --mode fetchall
+    python run_streaming.py --driver asyncmy --json ../../bench_results_python_asyncmy_streaming_results.json
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import os
+import platform
+import queue
+import sys
+import time
+
+from memory import peak_rss
+
+
+SYNC_DRIVERS = ['mariadb', 'mariadb_c', 'pymysql', 'mysql_connector']
+ASYNC_DRIVERS = ['async-mariadb', 'mysql_connector_async', 'asyncmy']
+MODES = ['fetchall', 'fetchmany', 'iterate', 'stream', 'stream_fetchmany']
+STREAMING_MODES = ['stream', 'stream_fetchmany']
+
+
+def sync_cursor(driver, driver_name, connection, streaming):
+    if driver_name == 'pymysql':
+        return connection.cursor(driver.cursors.SSCursor if streaming else driver.cursors.Cursor)
+    return connection.cursor(buffered=not streaming)
+
+
+async def async_cursor(driver_name, connection, streaming):
+    if driver_name == 'mysql_connector_async':
+        return await connection.cursor(buffered=not streaming)
+    if driver_name == 'asyncmy':
+        from asyncmy.cursors import Cursor, SSCursor
+        return connection.cursor(SSCursor if streaming else Cursor)
+    return connection.cursor(buffered=not streaming)
+
+
+def fetch_sync(cursor, mode, fetch_size):
+    """Read the whole result; returns (rows, time of the first row)."""
+    first = None
+    count = 0
+    if mode == 'fetchall':
+        count = len(cursor.fetchall())
+        first = time.perf_counter()
+    elif mode in ['fetchmany', 'stream_fetchmany']:
+        while True:
+            batch = cursor.fetchmany(fetch_size)
+            if not batch:
+                break
+            if first is None:
+                first = time.perf_counter()
+            count += len(batch)
+    else:
+        for _ in cursor:
+            if first is None:
+                first = time.perf_counter()
+            count += 1
+    return count, first
+
+
+async def fetch_async(cursor, mode, fetch_size):
+    """Read the whole result; returns (rows, time of the first row)."""
+    first = None
+    count = 0
+    if mode == 'fetchall':
+        count = len(await cursor.fetchall())
+        first = time.perf_counter()
+    elif mode in ['fetchmany', 'stream_fetchmany']:
+        while True:
+            batch = await cursor.fetchmany(fetch_size)
+            if not batch:
+                break
+            if first is None:
+                first = time.perf_counter()
+            count += len(batch)
+    else:
+        while await cursor.fetchone() is not None:
+            if first is None:
+                first = time.perf_counter()
+            count += 1
+    return count, first
+
+
+def measure_sync(driver_name, sql, mode, fetch_size, rounds):
+    from conftest import connect_config, get_driver_module
+    driver = get_driver_module(driver_name)
+    connection = driver.connect(**connect_config(driver_name))
+    streaming = mode in STREAMING_MODES
+    rss_before = peak_rss()
+    samples = []
+    for _ in range(rounds):
+        cursor = sync_cursor(driver, driver_name, connection, streaming)
+        start = time.perf_counter()
+        cursor.execute(sql)
+        count, first = fetch_sync(cursor, mode, fetch_size)
+        samples.append((count, first - start, time.perf_counter() - start))
+        cursor.close()
+    connection.close()
+    return samples, peak_rss() - rss_before
+
+
+async def measure_async(driver_name, sql, mode, fetch_size, rounds):
+    from conftest import async_connect, get_driver_module
+    get_driver_module(driver_name)
+    connection = await async_connect(driver_name)
+    streaming = mode in STREAMING_MODES
+    rss_before = peak_rss()
+    samples = []
+    for _ in range(rounds):
+        cursor = await async_cursor(driver_name, connection, streaming)
+        start = time.perf_counter()
+        await cursor.execute(sql)
+        count, first = await fetch_async(cursor, mode, fetch_size)
+        samples.append((count, first - start, time.perf_counter() - start))
+        await cursor.close()
+    await connection.close()
+    return samples, peak_rss() - rss_before
+
+
+def worker(driver_name, sql, mode, fetch_size, rounds, results):
+    """Child process body: one (driver, mode, fetch size) point."""
+    if driver_name == 'mariadb':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    elif driver_name == 'mariadb_c':
+        os.environ['MARIADB_PYTHON_CONNECTOR'] = 'c'
+    try:
+        if driver_name in ASYNC_DRIVERS:
+            samples, rss_delta = asyncio.run(measure_async(driver_name, sql, mode, fetch_size, rounds))
+        else:
+            samples, rss_delta = measure_sync(driver_name, sql, mode, fetch_size, rounds)
+    except Exception as e:
+        results.put((None, None, repr(e)))
+        return
+    results.put((samples, rss_delta, None))
+
+
+def run_point(driver_name, sql, mode, fetch_size, rounds):
+    """Returns the point's statistics, or {'error'} when its process died."""
+    context = multiprocessing.get_context('spawn')
+    results = context.Queue()
+    process = context.Process(target=worker, args=(driver_name, sql, mode, fetch_size, rounds, results))
+    process.start()
+    exited = False
+    while True:
+        try:
+            samples, rss_delta, error = results.get(timeout=1)
+            break
+        except queue.Empty:
+            # a process that died never puts its result; give it one more
+            # poll, as its last put may still be on the way
+            if exited:
+                process.join()
+                return {'error': f"exited with code {process.exitcode} without a result"}
+            exited = not process.is_alive()
+    process.join()
+    if error:
+        raise RuntimeError(f"{driver_name} {mode}: {error}")
+    best = min(samples, key=lambda s: s[2])
+    first_rows = sorted(s[1] for s in samples)
+    return {
+        'rows': best[0],
+        'seconds': best[2],
+        'rows_per_sec': best[0] / best[2],
+        'time_to_first_row': first_rows[len(first_rows) // 2],
+        'peak_rss_delta': rss_delta,
+    }
+
+
+def to_benchmark_entry(driver_name, mode, fetch_size, rows, width, stats, bounded):
+    """pytest-benchmark compatible entry; 1 / mean is full result sets per second."""
+    from conftest import TLS_MODE
+    label = f"{mode}-{fetch_size}" if fetch_size else mode
+    name = f"test_streaming[{driver_name}-{label}-{rows}rows]"
+    extra_info = {key: stats[key] for key in ('rows_per_sec', 'time_to_first_row', 'peak_rss_delta')}
+    if bounded is not None:
+        extra_info['bounded'] = bounded
+    return {
+        'name': name,
+        'fullname': f"run_streaming.py::{name}",
+        'params': {'driver': driver_name, 'mode': mode, 'fetch_size': fetch_size, 'rows': rows, 'width': width, 'tls': TLS_MODE},
+        'extra_info': extra_info,
+        'stats': {
+            'min': stats['seconds'],
+            'max': stats['seconds'],
+            'mean': stats['seconds'],
+            'median': stats['seconds'],
+            'stddev': 0,
+            'rounds': 1,
+            'iterations': 1,
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Large result streaming benchmark')
+    parser.add_argument('--driver', required=True, choices=SYNC_DRIVERS + ASYNC_DRIVERS,
+                        help='Driver to benchmark')
+    parser.add_argument('--mode', action='append', choices=MODES,
+                        help='Fetch mode, repeatable (default: all)')
+    parser.add_argument('--rows', type=int, default=1000000,
+                        help='Rows in the result (default: %(default)s)')
+    parser.add_argument('--width', type=int, default=32,
+                        help='String bytes per row (default: %(default)s)')
+    parser.add_argument('--fetch-sizes', default='100,1000,10000',
+                        help='Comma-separated fetchmany sizes (default: %(default)s)')
+    parser.add_argument('--rounds', type=int, default=3,
+                        help='Result sets read per point, best is reported (default: %(default)s)')
+    parser.add_argument('--bound-mb', type=float, default=32,
+                        help='Peak RSS growth allowed for streaming modes (default: %(default)s)')
+    parser.add_argument('--json', help='Save results to a pytest-benchmark compatible JSON file')
+    args = parser.parse_args()
+
+    sql = f"SELECT seq, REPEAT('a', {args.width}) FROM seq_1_to_{args.rows}"
+    fetch_sizes = [int(s) for s in args.fetch_sizes.split(',') if s.strip()]
+    print(f"\n{args.rows} rows x {args.width} bytes - {args.driver}")
+    print("-" * 90)
+    print(f"{'Mode':<24} {'Rows/s':<14} {'Total (s)':<11} {'First row (ms)':<16} {'Peak RSS (MB)':<15} {'Bounded':<8}")
+
+    benchmarks = []
+    unbounded = []
+    for mode in args.mode or MODES:
+        for fetch_size in (fetch_sizes if mode in ['fetchmany', 'stream_fetchmany'] else [None]):
+            stats = run_point(args.driver, sql, mode, fetch_size, args.rounds)
+            label = f"{mode}({fetch_size})" if fetch_size else mode
+            if 'error' in stats:
+                print(f"{label:<24} failed: {stats['error']}")
+                continue
+            bounded = None
+            if mode in STREAMING_MODES:
+                bounded = stats['peak_rss_delta'] <= args.bound_mb * 1024 * 1024
+                if not bounded:
+                    unbounded.append(f"{mode} {fetch_size}" if fetch_size else mode)
+            print(f"{label:<24} {stats['rows_per_sec']:<14.0f} {stats['seconds']:<11.3f} "
+                  f"{stats['time_to_first_row'] * 1000:<16.3f} {stats['peak_rss_delta'] / 1e6:<15.1f} "
+                  f"{'-' if bounded is None else ('yes' if bounded else 'NO'):<8}")
+            benchmarks.append(to_benchmark_entry(args.driver, mode, fetch_size, args.rows, args.width,
+                                                 stats, bounded))
+
+    if unbounded:
+        print(f"\nNot bounded (peak RSS grew over {args.bound_mb} MB): {', '.join(unbounded)}")
+
+    if args.json:
+        output = {
+            'machine_info': {
+                'node': platform.node(),
+                'processor': platform.processor(),
+                'machine': platform.machine(),
+                'python_implementation': platform.python_implementation(),
+                'python_version': platform.python_version(),
+            },
+            'commit_info': {},
+            'benchmarks': benchmarks,
+            'datetime': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'version': '1.0.0'
+        }
+        with open(args.json, 'w') as f:
+            json.dump(output, f, indent=2)
+        print(f"\nResults saved to {args.json}")
+    return 1 if unbounded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: connection establishment
+connect() + close() per driver, the cost short-lived jobs pay on every run,
+over plaintext and TLS (the TEST_DB_TLS version, any when off, verified
+against TEST_DB_TLS_CA when set) and per auth plugin:
+
+- default:                the TEST_DB_USER account
+- mysql_native_password,
+  caching_sha2_password,
+  ed25519:                a bench_* account created for the run
+
+Plugins come from TEST_DB_AUTH_PLUGINS; a plugin the server or the driver
+doesn't support is skipped with the error, as is TLS when the server doesn't
+negotiate it (params record the negotiated tls_version). For drivers doing their I/O
+through Python sockets, extra_info['phases'] splits a connect into TCP
+connect, server greeting, TLS handshake, auth exchange, session setup and
+close, medians over TEST_DB_PHASE_ROUNDS (default 20) extra untimed rounds
+(see connect_phases.py).
+
+test_pool_warmup times opening a mariadb_pool pool, which connects up to its
+min size (TEST_DB_POOL_MIN_SIZES, default 1,8,32) before returning, then
+closing it, over TEST_DB_TLS: extra_info records the warm-up and close time and the warm-up
+per connection.
+"""
+
+import os
+import statistics
+import time
+
+import pytest
+
+from conftest import (DB_CONFIG, TLS_MODE, async_connect, connect_config, get_async_cursor, tls_options,
+                      tls_version)
+from connect_phases import measure_phases
+from pools import AsyncMariaDBPool, MariaDBPool
+
+
+AUTH_PLUGINS = os.environ.get('TEST_DB_AUTH_PLUGINS',
+                              'default,mysql_native_password,caching_sha2_password,ed25519').split(',')
+TLS_MODES = ['plain', 'tls']
+# conftest TLS mode of each of TLS_MODES
+TLS_MODE_OF = {'plain': 'off', 'tls': TLS_MODE if TLS_MODE != 'off' else 'on'}
+POOL_MIN_SIZES = [int(n) for n in os.environ.get('TEST_DB_POOL_MIN_SIZES', '1,8,32').split(',')]
+PHASE_ROUNDS = int(os.environ.get('TEST_DB_PHASE_ROUNDS', '20'))
+
+AUTH_PASSWORD = 'bench-Connect-1'
+# plugin: (account, statements creating it tried in order, MariaDB syntax first)
+AUTH_USERS = {
+    'mysql_native_password': ('bench_native', [
+        "CREATE USER '{user}'@'{host}' IDENTIFIED VIA mysql_native_password USING PASSWORD('{password}')",
+        "CREATE USER '{user}'@'{host}' IDENTIFIED WITH mysql_native_password BY '{password}'",
+    ]),
+    'caching_sha2_password': ('bench_sha2', [
+        "CREATE USER '{user}'@'{host}' IDENTIFIED WITH caching_sha2_password BY '{password}'",
+    ]),
+    'ed25519': ('bench_ed25519', [
+        "CREATE USER '{user}'@'{host}' IDENTIFIED VIA ed25519 USING PASSWORD('{password}')",
+    ]),
+}
+# Also created for localhost, so an anonymous ''@'localhost' account can't shadow '%'
+AUTH_HOSTS = ['%', 'localhost']
+
+
+def create_auth_user(cursor, plugin):
+    """Create the bench account for `plugin`, returning None or the reason it can't be."""
+    user, statements = AUTH_USERS[plugin]
+    if plugin == 'ed25519':
+        try:
+            cursor.execute("INSTALL SONAME 'auth_ed25519'")
+        except Exception:
+            pass
+    error = None
+    for host in AUTH_HOSTS:
+        cursor.execute(f"DROP USER IF EXISTS '{user}'@'{host}'")
+        for sql in statements:
+            try:
+                cursor.execute(sql.format(user=user, host=host, password=AUTH_PASSWORD))
+                cursor.execute(f"GRANT ALL ON {DB_CONFIG['database']}.* TO '{user}'@'{host}'")
+                error = None
+                break
+            except Exception as e:
+                error = f"server can't create a {plugin} account: {e}"
+        if error:
+            return error
+    return None
+
+
+@pytest.fixture(scope='module')
+def auth_users():
+    """plugin: connection settings of its account, or the reason it's not available."""
+    os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    import mariadb
+
+    users = {'default': {}}
+    conn = mariadb.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    try:
+        for plugin in AUTH_PLUGINS:
+            if plugin in AUTH_USERS:
+                error = create_auth_user(cursor, plugin)
+                users[plugin] = error or {'user': AUTH_USERS[plugin][0], 'password': AUTH_PASSWORD}
+    finally:
+        cursor.close()
+        conn.close()
+
+    yield users
+
+    conn = mariadb.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    try:
+        for plugin in AUTH_PLUGINS:
+            if plugin in AUTH_USERS:
+                for host in AUTH_HOSTS:
+                    cursor.execute(f"DROP USER IF EXISTS '{AUTH_USERS[plugin][0]}'@'{host}'")
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def connect_options(auth_users, driver_name, auth, tls):
+    if auth not in auth_users:
+        pytest.skip(f"unknown auth plugin {auth}, expected one of {', '.join(AUTH_USERS)}")
+    account = auth_users[auth]
+    if isinstance(account, str):
+        pytest.skip(account)
+    return account
+
+
+def check_tls(driver_name, tls, version):
+    if tls == 'tls' and version is None:
+        pytest.skip(f"{driver_name} connected without TLS, the server has no TLS enabled")
+
+
+def connect_result(result, driver_name, auth, tls, version, phases):
+    result = dict(result)
+    result['params'] = dict(result.get('params', {}), driver=driver_name, auth=auth, tls=tls, tls_version=version)
+    extra_info = dict(result.get('extra_info', {}), connects_per_sec=1 / result['mean'])
+    if phases:
+        extra_info['phases'] = phases
+    result['extra_info'] = extra_info
+    return result
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=100, warmup_rounds=10)
+@pytest.mark.parametrize('tls', TLS_MODES)
+@pytest.mark.parametrize('auth', AUTH_PLUGINS)
+async def test_connect(async_benchmark, driver, driver_name, auth, tls, auth_users, capture_benchmark_result):
+    """Benchmark connect() + close() with the `auth` account over `tls`."""
+
+    if driver_name in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} requires async tests")
+    config = connect_config(driver_name, TLS_MODE_OF[tls], **connect_options(auth_users, driver_name, auth, tls))
+    try:
+        conn = driver.connect(**config)
+        cursor = conn.cursor()
+        cursor.execute("SHOW SESSION STATUS LIKE 'Ssl_version'")
+        version = tls_version(cursor.fetchone())
+        cursor.close()
+        conn.close()
+    except Exception as e:
+        pytest.skip(f"{driver_name} can't connect with {auth} over {tls}: {e}")
+    check_tls(driver_name, tls, version)
+
+    async def connect_close():
+        driver.connect(**config).close()
+
+    result = await async_benchmark(connect_close)
+    phases = measure_phases(lambda: driver.connect(**config), lambda conn: conn.close(), PHASE_ROUNDS)
+    return capture_benchmark_result(connect_result(result, driver_name, auth, tls, version, phases))
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=100, warmup_rounds=10)
+@pytest.mark.parametrize('tls', TLS_MODES)
+@pytest.mark.parametrize('auth', AUTH_PLUGINS)
+async def test_connect_async(async_benchmark, driver_name, auth, tls, auth_users, capture_benchmark_result):
+    """Benchmark connect() + close() with the `auth` account over `tls` (async, no phase breakdown)."""
+
+    if driver_name not in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} doesn't support async")
+    options = connect_options(auth_users, driver_name, auth, tls)
+    try:
+        conn = await async_connect(driver_name, TLS_MODE_OF[tls], **options)
+        async with get_async_cursor(conn, driver_name) as cursor:
+            await cursor.execute("SHOW SESSION STATUS LIKE 'Ssl_version'")
+            version = tls_version(await cursor.fetchone())
+        await conn.close()
+    except Exception as e:
+        pytest.skip(f"{driver_name} can't connect with {auth} over {tls}: {e}")
+    check_tls(driver_name, tls, version)
+
+    async def connect_close():
+        conn = await async_connect(driver_name, TLS_MODE_OF[tls], **options)
+        await conn.close()
+
+    result = await async_benchmark(connect_close)
+    return capture_benchmark_result(connect_result(result, driver_name, auth, tls, version, None))
+
+
+def pool_warmup_result(result, driver_name, size, warmups, closes):
+    # the lists also hold the warmup rounds
+    warmups = warmups[-result['rounds']:]
+    closes = closes[-result['rounds']:]
+    result = dict(result)
+    result['params'] = dict(result.get('params', {}), driver=driver_name, pool='mariadb_pool', min_size=size)
+    warmup = statistics.median(warmups)
+    result['extra_info'] = dict(result.get('extra_info', {}), warmup=warmup, per_connection=warmup / size,
+                                close=statistics.median(closes))
+    return result
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=20, warmup_rounds=2)
+@pytest.mark.parametrize('size', POOL_MIN_SIZES, ids=lambda n: f"min{n}")
+async def test_pool_warmup(async_benchmark, driver, driver_name, size, capture_benchmark_result):
+    """Benchmark opening a mariadb_pool pool of min size `size`, then closing it."""
+
+    if driver_name in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} requires async tests")
+    if driver_name not in ['mariadb', 'mariadb_c']:
+        pytest.skip(f"mariadb_pool doesn't support {driver_name}")
+    warmups = []
+    closes = []
+
+    async def warmup_close():
+        start = time.perf_counter()
+        pool = MariaDBPool(driver, size, **tls_options(driver_name))
+        opened = time.perf_counter()
+        pool.close()
+        warmups.append(opened - start)
+        closes.append(time.perf_counter() - opened)
+
+    try:
+        result = await async_benchmark(warmup_close)
+    except ImportError as e:
+        pytest.skip(f"mariadb_pool not installed: {e}")
+    return capture_benchmark_result(pool_warmup_result(result, driver_name, size, warmups, closes))
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=20, warmup_rounds=2)
+@pytest.mark.parametrize('size', POOL_MIN_SIZES, ids=lambda n: f"min{n}")
+async def test_pool_warmup_async(async_benchmark, driver, driver_name, size, capture_benchmark_result):
+    """Benchmark opening a mariadb_pool async pool of min size `size`, then closing it."""
+
+    if driver_name not in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} doesn't support async")
+    if driver_name != 'async-mariadb':
+        pytest.skip(f"mariadb_pool doesn't support {driver_name}")
+    warmups = []
+    closes = []
+
+    async def warmup_close():
+        start = time.perf_counter()
+        pool = AsyncMariaDBPool(driver, size, **tls_options(driver_name))
+        await pool.open()
+        opened = time.perf_counter()
+        await pool.close()
+        warmups.append(opened - start)
+        closes.append(time.perf_counter() - opened)
+
+    try:
+        result = await async_benchmark(warmup_close)
+    except ImportError as e:
+        pytest.skip(f"mariadb_pool not installed: {e}")
+    return capture_benchmark_result(pool_warmup_result(result, driver_name, size, warmups, closes))
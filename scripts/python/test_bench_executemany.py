@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: executemany batch size sweep
+INSERT through executemany, sweeping the batch size and the column set:
+- text1: one 100 character string (perfTestTextBatch)
+- int4:  four INT columns (perfTestIntBatch)
+- mixed: BIGINT, DOUBLE, DECIMAL, VARCHAR and DATETIME (perfTestMixedBatch)
+
+Besides the timed rounds, one batch goes through a counting proxy
+(packet_capture.CountingProxy) to record what the driver actually sent:
+COM_STMT_BULK_EXECUTE (bulk), a multi-value INSERT (rewrite) or one execute
+per row (per_row), with the commands and network round trips per batch.
+That batch always runs over plaintext, whatever TEST_DB_TLS is.
+
+Batch sizes come from TEST_DB_BATCH_SIZES (default 1,10,100,1000,10000,100000).
+extra_info records rows/s, strategy, round_trips and commands.
+"""
+
+import datetime
+import os
+from decimal import Decimal
+
+import pytest
+
+from conftest import DB_CONFIG, async_connect, connect_config, get_async_cursor
+from packet_capture import CountingProxy
+
+
+BATCH_SIZES = [int(n) for n in os.environ.get('TEST_DB_BATCH_SIZES', '1,10,100,1000,10000,100000').split(',')]
+
+COLUMN_SETS = {
+    'text1': ('perfTestTextBatch', ['t0'],
+              lambda i: ('abcdefghij' * 10,)),
+    'int4': ('perfTestIntBatch', ['i0', 'i1', 'i2', 'i3'],
+             lambda i: (i, i + 1, i + 2, i + 3)),
+    'mixed': ('perfTestMixedBatch', ['i0', 'd0', 'n0', 't0', 'dt0'],
+              lambda i: (i, i * 0.5, Decimal('1234.56'), 'abcdefghij' * 3,
+                         datetime.datetime(2025, 1, 1, 12, 0, i % 60))),
+}
+
+
+def insert_sql(columns, placeholder):
+    table, names, _ = COLUMN_SETS[columns]
+    return f"INSERT INTO {table}({', '.join(names)}) VALUES ({', '.join([placeholder] * len(names))})"
+
+
+def batch_rows(columns, batch_size):
+    make_row = COLUMN_SETS[columns][2]
+    return [make_row(i) for i in range(batch_size)]
+
+
+def rounds_for(batch_size):
+    """About 200K rows per benchmark, between 3 and 200 rounds."""
+    return max(3, min(200, 200_000 // batch_size))
+
+
+def execution_strategy(wire):
+    """Classify a counted executemany: bulk, rewrite (multi-value INSERT) or per_row."""
+    if wire['commands'].get('COM_STMT_BULK_EXECUTE'):
+        return 'bulk'
+    if wire['max_query_rows'] > 1:
+        return 'rewrite'
+    return 'per_row'
+
+
+def batch_result(result, driver_name, columns, batch_size, wire):
+    result = dict(result)
+    result['params'] = dict(result.get('params', {}), driver=driver_name, columns=columns, batch_size=batch_size)
+    result['extra_info'] = dict(result.get('extra_info', {}),
+                                rows_per_sec=batch_size / result['mean'],
+                                strategy=execution_strategy(wire),
+                                round_trips=wire['round_trips'],
+                                commands=wire['commands'])
+    return result
+
+
+@pytest.fixture(scope='module')
+def counting_proxy():
+    proxy = CountingProxy((DB_CONFIG['host'], DB_CONFIG['port'])).start()
+    yield proxy
+    proxy.stop()
+
+
+def count_sync(driver, driver_name, counting_proxy, sql, rows):
+    """
+    Run one executemany through the counting proxy and return what went over
+    the wire. Always over plaintext, the proxy can't parse TLS records.
+    """
+    conn = driver.connect(**connect_config(driver_name, tls='off', host='127.0.0.1', port=counting_proxy.port))
+    try:
+        cursor = conn.cursor()
+        counting_proxy.reset()
+        cursor.executemany(sql, rows)
+        wire = counting_proxy.snapshot()
+        cursor.close()
+    finally:
+        conn.close()
+    return wire
+
+
+async def count_async(driver_name, counting_proxy, sql, rows):
+    """Async counterpart of count_sync."""
+    conn = await async_connect(driver_name, tls='off', host='127.0.0.1', port=counting_proxy.port)
+    try:
+        async with get_async_cursor(conn, driver_name) as cursor:
+            counting_proxy.reset()
+            await cursor.executemany(sql, rows)
+            wire = counting_proxy.snapshot()
+    finally:
+        await conn.close()
+    return wire
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("setup_database")
+@pytest.mark.parametrize('batch_size', BATCH_SIZES, ids=lambda n: f"{n}rows")
+@pytest.mark.parametrize('columns', list(COLUMN_SETS))
+async def test_executemany(async_benchmark, connection, driver, driver_name, columns, batch_size,
+                           counting_proxy, capture_benchmark_result):
+    """Benchmark executemany of `batch_size` rows of the `columns` column set."""
+
+    sql = insert_sql(columns, '?' if driver_name in ['mariadb', 'mariadb_c'] else '%s')
+    rows = batch_rows(columns, batch_size)
+
+    async def insert_batch():
+        cursor = connection.cursor()
+        cursor.executemany(sql, rows)
+        cursor.close()
+
+    result = await async_benchmark(insert_batch, rounds=rounds_for(batch_size), warmup_rounds=2)
+    wire = count_sync(driver, driver_name, counting_proxy, sql, rows)
+    return capture_benchmark_result(batch_result(result, driver_name, columns, batch_size, wire))
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("setup_database")
+@pytest.mark.parametrize('batch_size', BATCH_SIZES, ids=lambda n: f"{n}rows")
+@pytest.mark.parametrize('columns', list(COLUMN_SETS))
+async def test_executemany_async(async_benchmark, async_connection, driver_name, columns, batch_size,
+                                 counting_proxy, capture_benchmark_result):
+    """Benchmark executemany of `batch_size` rows of the `columns` column set (async)."""
+
+    sql = insert_sql(columns, '?' if driver_name == 'async-mariadb' else '%s')
+    rows = batch_rows(columns, batch_size)
+
+    async def insert_batch():
+        async with get_async_cursor(async_connection, driver_name) as cursor:
+            await cursor.executemany(sql, rows)
+
+    result = await async_benchmark(insert_batch, rounds=rounds_for(batch_size), warmup_rounds=2)
+    wire = await count_async(driver_name, counting_proxy, sql, rows)
+    return capture_benchmark_result(batch_result(result, driver_name, columns, batch_size, wire))
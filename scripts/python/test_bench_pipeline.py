@@ -0,0 +1,169 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: pipelined prepare+execute
+SELECT * FROM test100 WHERE 1 = ? over the binary protocol, the Python
+counterpart of the C suite's SELECT 100 int cols variants:
+
+- execute_only:           statement prepared once, only executed (BINARY EXECUTE ONLY)
+- prepare_execute_close:  prepare, wait, execute, close on every call (BINARY)
+- pipeline:               prepare and execute sent together before reading
+                          either reply, then close (BINARY PIPELINE)
+
+The pure-Python mariadb / async-mariadb implementation pipelines when the
+server has the MariaDB bulk capability; prepare_execute_close and pipeline
+turn its statement cache off (cache_prep_stmts=False) and switch pipeline
+off and on. mariadb_c has no pipelining and runs the first two modes only.
+
+Connections go through a packet_capture latency proxy adding the round trip
+times in TEST_DB_RTT_MS (default 0,1,5 ms; 0 connects directly, comparable
+with the C and Java suites). For the pipeline mode, extra_info records the
+gain over prepare_execute_close at the same RTT, which the test times itself
+on a second connection.
+"""
+
+import os
+
+import pytest
+
+from conftest import DB_CONFIG, async_connect, connect_config, mean_call_time
+from packet_capture import start_capture_process
+
+
+RTTS = [float(n) for n in os.environ.get('TEST_DB_RTT_MS', '0,1,5').split(',')]
+MODES = ['execute_only', 'prepare_execute_close', 'pipeline']
+ROUNDS = 100
+WARMUP_ROUNDS = 10
+
+
+@pytest.fixture(scope='module')
+def latency_proxies():
+    """Connection host and port per RTT: a latency proxy, each started in its own process on first use."""
+    upstream = f"{DB_CONFIG['host']}:{DB_CONFIG['port']}"
+    processes = {}
+    ports = {}
+
+    def address(rtt):
+        if not rtt:
+            return {'host': DB_CONFIG['host'], 'port': DB_CONFIG['port']}
+        if rtt not in ports:
+            processes[rtt], ports[rtt] = start_capture_process('latency', upstream=upstream, rtt_ms=rtt)
+        return {'host': '127.0.0.1', 'port': ports[rtt]}
+
+    yield address
+    for process in processes.values():
+        process.terminate()
+        process.wait()
+
+
+def mode_options(driver_name, mode):
+    if driver_name not in ['mariadb', 'mariadb_c', 'async-mariadb']:
+        pytest.skip(f"{driver_name} doesn't support binary protocol")
+    if driver_name == 'mariadb_c':
+        if mode == 'pipeline':
+            pytest.skip("mariadb_c doesn't pipeline prepare and execute")
+        return {}
+    if mode == 'execute_only':
+        return {}
+    return {'cache_prep_stmts': False, 'pipeline': mode == 'pipeline'}
+
+
+def pipeline_result(result, driver_name, mode, rtt, baseline=None):
+    """`result` with its params; `baseline` is the prepare_execute_close mean for the pipeline mode."""
+    result = dict(result)
+    result['params'] = dict(result.get('params', {}), driver=driver_name, mode=mode, rtt_ms=rtt)
+    extra_info = dict(result.get('extra_info', {}))
+    if baseline:
+        extra_info['gain_vs_prepare_execute_close'] = baseline / result['mean'] - 1
+    result['extra_info'] = extra_info
+    return result
+
+
+def statement_per_call(connection):
+    """Coroutine function running the query with a new statement (prepare, execute, close) per call."""
+    async def select_100_cols():
+        cursor = connection.cursor(binary=True)
+        cursor.execute("SELECT * FROM test100 WHERE 1 = ?", (1,))
+        row = cursor.fetchone()
+        cursor.close()
+        return len(row)
+    return select_100_cols
+
+
+def statement_per_call_async(connection):
+    """statement_per_call() over an async connection."""
+    async def select_100_cols():
+        async with connection.cursor(binary=True) as cursor:
+            await cursor.execute("SELECT * FROM test100 WHERE 1 = ?", (1,))
+            return len(await cursor.fetchone())
+    return select_100_cols
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=ROUNDS, warmup_rounds=WARMUP_ROUNDS)
+@pytest.mark.usefixtures("setup_database")
+@pytest.mark.parametrize('mode', MODES)
+@pytest.mark.parametrize('rtt', RTTS, ids=lambda n: f"{n:g}ms")
+async def test_pipeline(async_benchmark, driver, driver_name, rtt, mode, latency_proxies, capture_benchmark_result):
+    """Benchmark SELECT 100 columns in `mode` behind `rtt` ms of added round trip time."""
+
+    if driver_name in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} requires async tests")
+
+    def connect(mode):
+        return driver.connect(**connect_config(driver_name, **latency_proxies(rtt), **mode_options(driver_name, mode)))
+
+    connection = connect(mode)
+    cursor = connection.cursor(binary=True)
+
+    async def execute_only():
+        cursor.execute("SELECT * FROM test100 WHERE 1 = ?", (1,))
+        return len(cursor.fetchone())
+
+    try:
+        result = await async_benchmark(execute_only if mode == 'execute_only' else statement_per_call(connection))
+    finally:
+        cursor.close()
+        connection.close()
+    baseline = None
+    if mode == 'pipeline':
+        connection = connect('prepare_execute_close')
+        try:
+            baseline = await mean_call_time(statement_per_call(connection), ROUNDS, WARMUP_ROUNDS)
+        finally:
+            connection.close()
+    return capture_benchmark_result(pipeline_result(result, driver_name, mode, rtt, baseline))
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=ROUNDS, warmup_rounds=WARMUP_ROUNDS)
+@pytest.mark.usefixtures("setup_database")
+@pytest.mark.parametrize('mode', MODES)
+@pytest.mark.parametrize('rtt', RTTS, ids=lambda n: f"{n:g}ms")
+async def test_pipeline_async(async_benchmark, driver, driver_name, rtt, mode, latency_proxies,
+                              capture_benchmark_result):
+    """Benchmark SELECT 100 columns in `mode` behind `rtt` ms of added round trip time (async)."""
+
+    if driver_name != 'async-mariadb':
+        pytest.skip(f"{driver_name} doesn't support async binary protocol")
+
+    async def connect(mode):
+        return await async_connect(driver_name, **latency_proxies(rtt), **mode_options(driver_name, mode))
+
+    connection = await connect(mode)
+    try:
+        result = await async_benchmark(statement_per_call_async(connection))
+    finally:
+        await connection.close()
+    baseline = None
+    if mode == 'pipeline':
+        connection = await connect('prepare_execute_close')
+        try:
+            baseline = await mean_call_time(statement_per_call_async(connection), ROUNDS, WARMUP_ROUNDS)
+        finally:
+            await connection.close()
+    return capture_benchmark_result(pipeline_result(result, driver_name, mode, rtt, baseline))
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: connection pools
+SELECT 1 through a pool, sweeping pool size and the number of concurrent
+clients (threads for sync drivers, tasks for async drivers). Each client
+acquires a connection, runs SELECT 1 and releases it.
+
+Pools: mariadb_pool ConnectionPool / AsyncConnectionPool, DBUtils PooledDB
+and asyncmy's pool (see pools.py). Results are per operation, so 1 / mean
+is aggregate ops/s; acquire latency percentiles and histogram are stored in
+extra_info.
+
+Pool sizes and client counts come from TEST_DB_POOL_SIZES (default 4,16,64)
+and TEST_DB_POOL_CLIENTS (default 16,64,256).
+"""
+
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import get_async_cursor, per_operation
+from latency import latency_summary
+from pools import ASYNC_POOLS, SYNC_POOLS, get_async_pool, get_sync_pool
+
+
+POOL_SIZES = [int(n) for n in os.environ.get('TEST_DB_POOL_SIZES', '4,16,64').split(',')]
+CLIENT_COUNTS = [int(n) for n in os.environ.get('TEST_DB_POOL_CLIENTS', '16,64,256').split(',')]
+OPERATIONS = 1024
+
+
+def select_1(pool, operations, acquire_times):
+    """One sync client: acquire, SELECT 1, release, `operations` times."""
+    perf_counter = time.perf_counter
+    for _ in range(operations):
+        start = perf_counter()
+        handle = pool.acquire()
+        acquire_times.append(perf_counter() - start)
+        try:
+            cursor = pool.connection(handle).cursor()
+            cursor.execute("SELECT 1")
+            cursor.fetchone()
+            cursor.close()
+        finally:
+            pool.release(handle)
+
+
+async def select_1_async(pool, driver_name, operations, acquire_times):
+    """One async client: acquire, SELECT 1, release, `operations` times."""
+    perf_counter = time.perf_counter
+    for _ in range(operations):
+        start = perf_counter()
+        handle = await pool.acquire()
+        acquire_times.append(perf_counter() - start)
+        try:
+            async with get_async_cursor(pool.connection(handle), driver_name) as cursor:
+                await cursor.execute("SELECT 1")
+                await cursor.fetchone()
+        finally:
+            await pool.release(handle)
+
+
+def pool_result(result, driver_name, implementation, pool_size, clients, operations, acquire_times):
+    scaled = per_operation(result, operations, driver=driver_name, pool=implementation,
+                           pool_size=pool_size, clients=clients)
+    scaled['extra_info'] = dict(scaled.get('extra_info', {}), acquire_latency=latency_summary(acquire_times))
+    return scaled
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=20, warmup_rounds=2)
+@pytest.mark.parametrize('clients', CLIENT_COUNTS, ids=lambda n: f"{n}clients")
+@pytest.mark.parametrize('pool_size', POOL_SIZES, ids=lambda n: f"{n}size")
+@pytest.mark.parametrize('implementation', SYNC_POOLS)
+async def test_pool(async_benchmark, driver, driver_name, implementation, pool_size, clients,
+                    capture_benchmark_result):
+    """Benchmark SELECT 1 through a sync pool with `clients` threads."""
+
+    pool = get_sync_pool(driver, driver_name, implementation, pool_size)
+    executor = ThreadPoolExecutor(max_workers=clients)
+    per_client = max(1, OPERATIONS // clients)
+    acquire_times = []
+
+    async def run_round():
+        futures = [executor.submit(select_1, pool, per_client, acquire_times) for _ in range(clients)]
+        for future in futures:
+            future.result()
+
+    try:
+        result = await async_benchmark(run_round)
+    finally:
+        executor.shutdown()
+        pool.close()
+    return capture_benchmark_result(pool_result(result, driver_name, implementation, pool_size, clients,
+                                                per_client * clients, acquire_times))
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=20, warmup_rounds=2)
+@pytest.mark.parametrize('clients', CLIENT_COUNTS, ids=lambda n: f"{n}clients")
+@pytest.mark.parametrize('pool_size', POOL_SIZES, ids=lambda n: f"{n}size")
+@pytest.mark.parametrize('implementation', ASYNC_POOLS)
+async def test_pool_async(async_benchmark, driver, driver_name, implementation, pool_size, clients,
+                          capture_benchmark_result):
+    """Benchmark SELECT 1 through an async pool with `clients` tasks."""
+
+    pool = await get_async_pool(driver, driver_name, implementation, pool_size)
+    per_client = max(1, OPERATIONS // clients)
+    acquire_times = []
+
+    async def run_round():
+        await asyncio.gather(*(select_1_async(pool, driver_name, per_client, acquire_times)
+                               for _ in range(clients)))
+
+    try:
+        result = await async_benchmark(run_round)
+    finally:
+        await pool.close()
+    return capture_benchmark_result(pool_result(result, driver_name, implementation, pool_size, clients,
+                                                per_client * clients, acquire_times))
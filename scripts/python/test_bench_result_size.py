@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: result set size
+SELECT seq, REPEAT('a', width) FROM seq_1_to_rows, fetchall(), sweeping the
+row count and the string payload width per row, with text and binary
+protocol (binary for the mariadb drivers, as in the other benchmarks).
+
+Row counts come from TEST_DB_RESULT_ROWS (default 1,10,100,1000,10000,100000,1000000)
+and widths in bytes from TEST_DB_RESULT_WIDTHS (default 8,256,8192,65536).
+Combinations over TEST_DB_RESULT_MAX_MB (default 256) of payload are skipped.
+Rounds shrink with the row count so the large results stay affordable.
+
+extra_info records rows/s and payload MB/s; `run_benchmarks.py --result-size`
+fits time = per-query + rows * per-row cost for each driver, protocol and width.
+"""
+
+import os
+
+import pytest
+
+from conftest import get_async_cursor
+
+
+ROW_COUNTS = [int(n) for n in os.environ.get('TEST_DB_RESULT_ROWS', '1,10,100,1000,10000,100000,1000000').split(',')]
+WIDTHS = [int(n) for n in os.environ.get('TEST_DB_RESULT_WIDTHS', '8,256,8192,65536').split(',')]
+MAX_RESULT_BYTES = int(os.environ.get('TEST_DB_RESULT_MAX_MB', '256')) * 1024 * 1024
+
+
+def result_sql(rows, width, placeholder):
+    return f"SELECT seq, REPEAT('a', {width}) FROM seq_1_to_{rows} WHERE 1 = {placeholder}"
+
+
+def rounds_for(rows):
+    """About 100K rows per benchmark, between 5 and 200 rounds."""
+    return max(5, min(200, 100_000 // rows))
+
+
+def check_size(rows, width):
+    if rows * width > MAX_RESULT_BYTES:
+        pytest.skip(f"{rows} rows of {width} bytes exceed TEST_DB_RESULT_MAX_MB")
+
+
+def result_size(result, driver_name, protocol, rows, width):
+    result = dict(result)
+    result['params'] = dict(result.get('params', {}), driver=driver_name, protocol=protocol, rows=rows, width=width)
+    mean = result['mean']
+    result['extra_info'] = dict(result.get('extra_info', {}),
+                                rows_per_sec=rows / mean,
+                                mb_per_sec=rows * width / mean / 1e6)
+    return result
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('width', WIDTHS, ids=lambda n: f"{n}B")
+@pytest.mark.parametrize('rows', ROW_COUNTS, ids=lambda n: f"{n}rows")
+@pytest.mark.parametrize('protocol', ['text', 'binary'])
+async def test_result_size(async_benchmark, connection, driver_name, protocol, rows, width,
+                           capture_benchmark_result):
+    """Benchmark fetching `rows` rows with a `width` byte string each."""
+
+    if protocol == 'binary' and driver_name in ['pymysql', 'mysql_connector']:
+        pytest.skip(f"{driver_name} doesn't support binary protocol")
+    check_size(rows, width)
+    mariadb = driver_name in ['mariadb', 'mariadb_c']
+    sql = result_sql(rows, width, '?' if mariadb else '%s')
+
+    async def select_rows():
+        cursor = connection.cursor(binary=True) if protocol == 'binary' else connection.cursor()
+        cursor.execute(sql, (1,))
+        fetched = cursor.fetchall()
+        cursor.close()
+        return len(fetched)
+
+    result = await async_benchmark(select_rows, rounds=rounds_for(rows), warmup_rounds=2)
+    return capture_benchmark_result(result_size(result, driver_name, protocol, rows, width))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('width', WIDTHS, ids=lambda n: f"{n}B")
+@pytest.mark.parametrize('rows', ROW_COUNTS, ids=lambda n: f"{n}rows")
+async def test_result_size_async(async_benchmark, async_connection, driver_name, rows, width,
+                                 capture_benchmark_result):
+    """Benchmark fetching `rows` rows with a `width` byte string each (async)."""
+
+    check_size(rows, width)
+    sql = result_sql(rows, width, '?' if driver_name == 'async-mariadb' else '%s')
+
+    async def select_rows():
+        async with get_async_cursor(async_connection, driver_name) as cursor:
+            await cursor.execute(sql, (1,))
+            fetched = await cursor.fetchall()
+            return len(fetched)
+
+    result = await async_benchmark(select_rows, rounds=rounds_for(rows), warmup_rounds=2)
+    return capture_benchmark_result(result_size(result, driver_name, 'text', rows, width))
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: row factory overhead
+The select_1000_rows and select_100_cols workloads (text protocol) fetched as
+plain tuples, dicts and named tuples:
+
+- mariadb / mariadb_c / async-mariadb: cursor(dictionary=True), cursor(named_tuple=True)
+- pymysql: DictCursor
+- mysql_connector / mysql_connector_async: cursor(dictionary=True)
+- asyncmy: DictCursor
+
+Modes a driver doesn't have are skipped. extra_info records the time per row
+and, for dict and named_tuple, the overhead per row and relative to tuples,
+whose baseline each of those tests measures itself on the same connection.
+"""
+
+from contextlib import asynccontextmanager
+
+import pytest
+
+from conftest import mean_call_time
+
+
+ROW_MODES = ['tuple', 'dict', 'named_tuple']
+ROUNDS = 200
+WARMUP_ROUNDS = 20
+
+# name: (SQL, rows per execution)
+WORKLOADS = {
+    'select_1000_rows': ("SELECT seq, 'abcdefghijabcdefghijabcdefghijaa' FROM seq_1_to_1000 WHERE 1 = {}", 1000),
+    'select_100_cols': ("SELECT * FROM test100 WHERE 1 = {}", 1),
+}
+
+def cursor_options(driver_name, row_mode):
+    """(args, kwargs) for connection.cursor() in `row_mode`, None if the driver has no such mode."""
+    if row_mode == 'tuple':
+        return (), {}
+    if driver_name in ['mariadb', 'mariadb_c', 'async-mariadb']:
+        return (), {'dictionary': True} if row_mode == 'dict' else {'named_tuple': True}
+    if row_mode != 'dict':
+        return None
+    if driver_name == 'pymysql':
+        import pymysql.cursors
+        return (pymysql.cursors.DictCursor,), {}
+    if driver_name == 'asyncmy':
+        from asyncmy.cursors import DictCursor
+        return (DictCursor,), {}
+    return (), {'dictionary': True}
+
+
+def workload_sql(workload, driver_name):
+    sql, _ = WORKLOADS[workload]
+    return sql.format('?' if driver_name in ['mariadb', 'mariadb_c', 'async-mariadb'] else '%s')
+
+
+def row_mode_options(driver_name, row_mode):
+    options = cursor_options(driver_name, row_mode)
+    if options is None:
+        pytest.skip(f"{driver_name} has no {row_mode} rows")
+    return options
+
+
+def row_factory_result(result, driver_name, workload, row_mode, baseline=None):
+    """`result` with its params and per row times; `baseline` is the tuple mode's mean."""
+    rows = WORKLOADS[workload][1]
+    result = dict(result)
+    result['params'] = dict(result.get('params', {}), driver=driver_name, workload=workload, row_mode=row_mode)
+    extra_info = dict(result.get('extra_info', {}), per_row=result['mean'] / rows)
+    if baseline:
+        extra_info['per_row_overhead'] = (result['mean'] - baseline) / rows
+        extra_info['overhead_vs_tuple'] = result['mean'] / baseline - 1
+    result['extra_info'] = extra_info
+    return result
+
+
+@asynccontextmanager
+async def async_row_cursor(connection, driver_name, args, kwargs):
+    """get_async_cursor with cursor options."""
+    if driver_name == 'mysql_connector_async':
+        cursor = await connection.cursor(*args, **kwargs)
+        try:
+            yield cursor
+        finally:
+            await cursor.close()
+    else:
+        async with connection.cursor(*args, **kwargs) as cursor:
+            yield cursor
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=ROUNDS, warmup_rounds=WARMUP_ROUNDS)
+@pytest.mark.usefixtures("setup_database")
+@pytest.mark.parametrize('workload', list(WORKLOADS))
+@pytest.mark.parametrize('row_mode', ROW_MODES)
+async def test_row_factory(async_benchmark, connection, driver_name, workload, row_mode, capture_benchmark_result):
+    """Benchmark a select workload fetched as `row_mode` rows."""
+
+    args, kwargs = row_mode_options(driver_name, row_mode)
+    sql = workload_sql(workload, driver_name)
+
+    def select(args, kwargs):
+        async def select_rows():
+            cursor = connection.cursor(*args, **kwargs)
+            cursor.execute(sql, (1,))
+            rows = cursor.fetchall()
+            cursor.close()
+            return len(rows)
+        return select_rows
+
+    result = await async_benchmark(select(args, kwargs))
+    baseline = None
+    if row_mode != 'tuple':
+        baseline = await mean_call_time(select((), {}), ROUNDS, WARMUP_ROUNDS)
+    return capture_benchmark_result(row_factory_result(result, driver_name, workload, row_mode, baseline))
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=ROUNDS, warmup_rounds=WARMUP_ROUNDS)
+@pytest.mark.usefixtures("setup_database")
+@pytest.mark.parametrize('workload', list(WORKLOADS))
+@pytest.mark.parametrize('row_mode', ROW_MODES)
+async def test_row_factory_async(async_benchmark, async_connection, driver_name, workload, row_mode,
+                                 capture_benchmark_result):
+    """Benchmark a select workload fetched as `row_mode` rows (async)."""
+
+    args, kwargs = row_mode_options(driver_name, row_mode)
+    sql = workload_sql(workload, driver_name)
+
+    def select(args, kwargs):
+        async def select_rows():
+            async with async_row_cursor(async_connection, driver_name, args, kwargs) as cursor:
+                await cursor.execute(sql, (1,))
+                rows = await cursor.fetchall()
+                return len(rows)
+        return select_rows
+
+    result = await async_benchmark(select(args, kwargs))
+    baseline = None
+    if row_mode != 'tuple':
+        baseline = await mean_call_time(select((), {}), ROUNDS, WARMUP_ROUNDS)
+    return capture_benchmark_result(row_factory_result(result, driver_name, workload, row_mode, baseline))
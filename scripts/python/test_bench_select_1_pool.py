@@ -10,15 +10,17 @@ Test concurrent SELECT 1 queries using a connection pool with 16 connections
 and 100 concurrent tasks.
 """
 
-# Apply gevent monkey patching before any other imports
-#from gevent import monkey
-#monkey.patch_all()
+# gevent monkey patching isn't applied here: it would have to run before pytest
+# and the drivers are imported, so greenlets serialise on blocking socket I/O.
+# run_gevent.py runs the workloads cooperatively in a patched process.
 
 import pytest
 import os
 import gevent
 from gevent.pool import Pool
 
+from conftest import tls_options
+
 
 # Pool configuration
 POOL_SIZE = 64
@@ -39,6 +41,7 @@ def get_pool(driver_name):
         'password': os.getenv('TEST_DB_PASSWORD', ''),
         'database': os.getenv('TEST_DB_DATABASE', 'bench')
     }
+    db_config.update(tls_options(driver_name))
     
     # Import the appropriate driver module
     if driver_name == 'mariadb' or driver_name == 'mariadb_c':
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: SELECT 1 with connection pool (async)
+Test concurrent SELECT 1 queries using an async connection pool with the same
+pool size and task count as test_bench_select_1_pool.py: mariadb_pool's
+AsyncConnectionPool for async-mariadb, asyncmy's own pool for asyncmy.
+"""
+
+import asyncio
+
+import pytest
+
+from conftest import get_async_cursor
+from pools import get_async_pool
+
+
+# Pool configuration, same as test_bench_select_1_pool.py
+POOL_SIZE = 64
+NUM_TASKS = 500
+
+ASYNC_POOL = {'async-mariadb': 'mariadb_pool', 'asyncmy': 'asyncmy'}
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=100, warmup_rounds=10)
+async def test_select_1_pool_async(async_benchmark, driver, driver_name, capture_benchmark_result):
+    """Benchmark SELECT 1 with an async connection pool and NUM_TASKS concurrent tasks."""
+
+    pool = await get_async_pool(driver, driver_name, ASYNC_POOL.get(driver_name, 'none'), POOL_SIZE)
+
+    async def execute_select_1():
+        handle = await pool.acquire()
+        try:
+            async with get_async_cursor(pool.connection(handle), driver_name) as cursor:
+                await cursor.execute("SELECT 1")
+                result = await cursor.fetchone()
+                return result[0]
+        finally:
+            await pool.release(handle)
+
+    async def run_concurrent_selects():
+        await asyncio.gather(*(execute_select_1() for _ in range(NUM_TASKS)))
+        return NUM_TASKS
+
+    try:
+        result = await async_benchmark(run_concurrent_selects)
+    finally:
+        await pool.close()
+
+    return capture_benchmark_result(result)
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: prepared statement cache pressure
+Binary protocol executes cycling through K distinct parameterised statements
+(SELECT ?, k), one cursor(binary=True) per execute, with and without the
+client-side prepared statement cache:
+
+- cache:   cache_prep_stmts=True, prep_stmt_cache_size from
+           TEST_DB_PREP_CACHE_SIZE (default: the driver's, 100)
+- nocache: cache_prep_stmts=False
+
+Once K exceeds the cache size every execute is a miss and costs a
+COM_STMT_PREPARE (and a COM_STMT_CLOSE on eviction). mariadb_c has no
+connection-level statement cache and only runs nocache; pymysql,
+mysql_connector and asyncmy have no binary protocol here.
+
+K comes from TEST_DB_STATEMENT_COUNTS (default 1,10,100,1000,10000).
+extra_info records executes/s, time per execute and the server's
+Com_stmt_prepare / Com_stmt_close per execute over one extra cycle.
+"""
+
+import os
+
+import pytest
+
+from conftest import async_connect, connect_config, get_async_cursor
+
+
+STATEMENT_COUNTS = [int(n) for n in os.environ.get('TEST_DB_STATEMENT_COUNTS', '1,10,100,1000,10000').split(',')]
+CACHE_SIZE = os.environ.get('TEST_DB_PREP_CACHE_SIZE')
+CACHE_MODES = ['cache', 'nocache']
+STATUS_NAMES = ['Com_stmt_prepare', 'Com_stmt_close']
+
+
+def statements(count):
+    return [f"SELECT ?, {k}" for k in range(count)]
+
+
+def rounds_for(count):
+    """About 20K executes per benchmark, between 3 and 200 rounds."""
+    return max(3, min(200, 20_000 // count))
+
+
+def cache_options(driver_name, cache):
+    if driver_name not in ['mariadb', 'mariadb_c', 'async-mariadb']:
+        pytest.skip(f"{driver_name} doesn't support binary protocol")
+    if driver_name == 'mariadb_c':
+        if cache == 'cache':
+            pytest.skip("mariadb_c has no client-side statement cache")
+        return {}
+    options = {'cache_prep_stmts': cache == 'cache'}
+    if cache == 'cache' and CACHE_SIZE:
+        options['prep_stmt_cache_size'] = int(CACHE_SIZE)
+    return options
+
+
+def status_value(row):
+    """Value column of a SHOW STATUS row, None when the server has no such counter."""
+    if row is None:
+        return None
+    try:
+        return int(row[1])
+    except (TypeError, ValueError):
+        return None
+
+
+def stmt_cache_result(result, driver_name, cache, count, before, after):
+    result = dict(result)
+    result['params'] = dict(result.get('params', {}), driver=driver_name, cache=cache, statements=count,
+                            cache_size=int(CACHE_SIZE) if CACHE_SIZE and cache == 'cache' else None)
+    extra_info = dict(result.get('extra_info', {}),
+                      executes_per_sec=count / result['mean'],
+                      per_execute=result['mean'] / count)
+    for name, key in zip(STATUS_NAMES, ['prepares_per_execute', 'closes_per_execute']):
+        if before[name] is not None and after[name] is not None:
+            extra_info[key] = (after[name] - before[name]) / count
+    result['extra_info'] = extra_info
+    return result
+
+
+def read_status_sync(connection):
+    """Session Com_stmt_prepare / Com_stmt_close counters."""
+    status = {}
+    cursor = connection.cursor()
+    for name in STATUS_NAMES:
+        cursor.execute(f"SHOW SESSION STATUS LIKE '{name}'")
+        status[name] = status_value(cursor.fetchone())
+    cursor.close()
+    return status
+
+
+async def read_status_async(connection, driver_name):
+    """Async counterpart of read_status_sync."""
+    status = {}
+    async with get_async_cursor(connection, driver_name) as cursor:
+        for name in STATUS_NAMES:
+            await cursor.execute(f"SHOW SESSION STATUS LIKE '{name}'")
+            status[name] = status_value(await cursor.fetchone())
+    return status
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('count', STATEMENT_COUNTS, ids=lambda n: f"{n}stmts")
+@pytest.mark.parametrize('cache', CACHE_MODES)
+async def test_stmt_cache(async_benchmark, driver, driver_name, cache, count, capture_benchmark_result):
+    """Benchmark binary executes cycling through `count` distinct statements."""
+
+    if driver_name in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} requires async tests")
+    connection = driver.connect(**connect_config(driver_name, **cache_options(driver_name, cache)))
+    sqls = statements(count)
+
+    def cycle():
+        for sql in sqls:
+            cursor = connection.cursor(binary=True)
+            cursor.execute(sql, (1,))
+            cursor.fetchall()
+            cursor.close()
+
+    async def execute_all():
+        cycle()
+
+    try:
+        result = await async_benchmark(execute_all, rounds=rounds_for(count), warmup_rounds=1)
+        before = read_status_sync(connection)
+        cycle()
+        after = read_status_sync(connection)
+    finally:
+        connection.close()
+    return capture_benchmark_result(stmt_cache_result(result, driver_name, cache, count, before, after))
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('count', STATEMENT_COUNTS, ids=lambda n: f"{n}stmts")
+@pytest.mark.parametrize('cache', CACHE_MODES)
+async def test_stmt_cache_async(async_benchmark, driver, driver_name, cache, count, capture_benchmark_result):
+    """Benchmark binary executes cycling through `count` distinct statements (async)."""
+
+    if driver_name != 'async-mariadb':
+        pytest.skip(f"{driver_name} doesn't support async binary protocol")
+    connection = await async_connect(driver_name, **cache_options(driver_name, cache))
+    sqls = statements(count)
+
+    async def cycle():
+        for sql in sqls:
+            async with connection.cursor(binary=True) as cursor:
+                await cursor.execute(sql, (1,))
+                await cursor.fetchall()
+
+    try:
+        result = await async_benchmark(cycle, rounds=rounds_for(count), warmup_rounds=1)
+        before = await read_status_async(connection, driver_name)
+        await cycle()
+        after = await read_status_async(connection, driver_name)
+    finally:
+        await connection.close()
+    return capture_benchmark_result(stmt_cache_result(result, driver_name, cache, count, before, after))
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: multi-threaded scaling
+Run each sync workload on 1..N threads, each thread with its own connection,
+to show how well a driver releases the GIL during network waits and decoding.
+
+Thread counts are powers of two up to TEST_DB_THREAD (default 8), as for the
+C benchmarks. Results are per operation across all threads, so 1 / mean is
+aggregate ops/s; `run_benchmarks.py --scaling` prints scaling efficiency.
+"""
+
+import os
+import threading
+
+import pytest
+
+from conftest import connect_config, per_operation
+from workloads import WORKLOADS
+
+
+MAX_THREADS = int(os.environ.get('TEST_DB_THREAD', '8'))
+THREAD_COUNTS = sorted({1 << i for i in range(MAX_THREADS.bit_length()) if 1 << i <= MAX_THREADS} | {MAX_THREADS})
+
+
+class ThreadGroup:
+    """Worker threads, each with its own connection, released together for each round."""
+
+    def __init__(self, driver, driver_name, threads, workload, operations):
+        self.driver_name = driver_name
+        self.workload = workload
+        self.operations = operations
+        self.connections = [driver.connect(**connect_config(driver_name)) for _ in range(threads)]
+        self.start_barrier = threading.Barrier(threads + 1)
+        self.done_barrier = threading.Barrier(threads + 1)
+        self.stopping = False
+        self.errors = []
+        self.threads = [threading.Thread(target=self._worker, args=(conn,), daemon=True)
+                        for conn in self.connections]
+        for thread in self.threads:
+            thread.start()
+
+    def _worker(self, connection):
+        while True:
+            self.start_barrier.wait()
+            if self.stopping:
+                return
+            try:
+                for _ in range(self.operations):
+                    self.workload(connection, self.driver_name)
+            except Exception as e:
+                self.errors.append(e)
+            self.done_barrier.wait()
+
+    def run_round(self):
+        self.start_barrier.wait()
+        self.done_barrier.wait()
+        if self.errors:
+            raise self.errors[0]
+
+    def close(self):
+        self.stopping = True
+        self.start_barrier.wait()
+        for thread in self.threads:
+            thread.join()
+        for conn in self.connections:
+            try:
+                conn.close()
+            except:
+                pass
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=50, warmup_rounds=5)
+@pytest.mark.usefixtures("setup_database")
+@pytest.mark.parametrize('workload_name', list(WORKLOADS))
+@pytest.mark.parametrize('threads', THREAD_COUNTS, ids=lambda n: f"{n}threads")
+async def test_threads(async_benchmark, driver, driver_name, workload_name, threads, capture_benchmark_result):
+    """Benchmark a sync workload on `threads` threads with one connection each."""
+
+    if driver_name in ['async-mariadb', 'mysql_connector_async', 'asyncmy']:
+        pytest.skip(f"{driver_name} requires async tests")
+
+    workload, operations = WORKLOADS[workload_name]
+    group = ThreadGroup(driver, driver_name, threads, workload, operations)
+
+    async def run_round():
+        group.run_round()
+
+    try:
+        result = await async_benchmark(run_round)
+    finally:
+        group.close()
+    return capture_benchmark_result(per_operation(result, threads * operations,
+                                                  driver=driver_name, workload=workload_name,
+                                                  threads=threads))
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark: data type decoding
+Fetch all rows of one column family at a time, text and binary protocol,
+so each driver's converters are measured type by type:
+
+- str_test (scripts/setup/setup.py): emoji-heavy utf8mb4 VARCHAR(200) and TEXT up to ~10KB
+- num_test (scripts/setup/setup.py): SMALLINT/INT/BIGINT, FLOAT, DECIMAL(10,5)
+- type_test: DATETIME(6), TIMESTAMP(6), DATE, TIME(6), JSON, BLOB, BIT(64)
+  and ten mostly NULL INT columns
+
+str_test and num_test are created with setup.py's definitions and data when
+missing, and kept; type_test is created for the session and dropped after it.
+extra_info records values/s (rows x columns / time).
+"""
+
+import os
+
+import pytest
+
+from conftest import DB_CONFIG, get_async_cursor
+
+
+EMOJI_STRING = "abcdefghi🌟"
+NULL_COLUMNS = [f"n{i}" for i in range(10)]
+
+# name: (table, columns)
+TYPE_CASES = {
+    'varchar_utf8mb4': ('str_test', ['col1']),
+    'text_utf8mb4': ('str_test', ['col2', 'col3']),
+    'integer': ('num_test', ['col1', 'col2', 'col3', 'col4']),
+    'float': ('num_test', ['col5']),
+    'decimal': ('num_test', ['col6']),
+    'datetime': ('type_test', ['dt']),
+    'timestamp': ('type_test', ['ts']),
+    'date': ('type_test', ['d']),
+    'time': ('type_test', ['t']),
+    'json': ('type_test', ['j']),
+    'blob': ('type_test', ['b']),
+    'bit': ('type_test', ['bt']),
+    'null_heavy': ('type_test', NULL_COLUMNS),
+}
+TYPE_TEST_ROWS = 1000
+
+
+NULL_HEAVY = ", ".join(f"IF((seq + {n}) % 10 = 0, seq, NULL)" for n in range(len(NULL_COLUMNS)))
+TYPE_TEST_SELECT = (
+    "SELECT t, t, DATE(t), TIME(t), "
+    f"JSON_OBJECT('id', seq, 'name', '{EMOJI_STRING}', 'tags', JSON_ARRAY('a', 'b', 'c'), 'score', seq * 0.5), "
+    f"REPEAT(UNHEX(MD5(seq)), 64), seq * 0x0101010101, {NULL_HEAVY} "
+    f"FROM (SELECT seq, TIMESTAMP('2025-01-01') + INTERVAL seq * 3607000007 MICROSECOND AS t "
+    f"FROM seq_1_to_{TYPE_TEST_ROWS}) s"
+)
+
+
+@pytest.fixture(scope='session')
+def type_tables():
+    """Create str_test and num_test when missing, and type_test for the session."""
+    os.environ['MARIADB_PYTHON_CONNECTOR'] = 'python'
+    import mariadb
+
+    conn = mariadb.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    try:
+        # Same definitions and data as scripts/setup/setup.py, generated server side
+        cursor.execute("CREATE TABLE IF NOT EXISTS str_test (col1 varchar(200), col2 TEXT, col3 TEXT)")
+        cursor.execute("SELECT COUNT(*) FROM str_test")
+        if not cursor.fetchone()[0]:
+            cursor.execute(f"INSERT INTO str_test SELECT REPEAT('{EMOJI_STRING}', 10), "
+                           f"REPEAT('{EMOJI_STRING}', 24), REPEAT('{EMOJI_STRING}', 1024) FROM seq_1_to_100")
+
+        cursor.execute("CREATE TABLE IF NOT EXISTS num_test(col1 smallint, col2 int, col3 smallint, "
+                       "col4 bigint, col5 float, col6 decimal(10,5))")
+        cursor.execute("SELECT COUNT(*) FROM num_test")
+        if not cursor.fetchone()[0]:
+            cursor.execute("INSERT INTO num_test SELECT seq % 128, 0xFF + seq, 0xFFF + seq, 0xFFFF + seq, "
+                           "10000 + seq + 0.3123, 20000 + seq + 0.1234 FROM seq_0_to_999")
+
+        cursor.execute("DROP TABLE IF EXISTS type_test")
+        nulls = ", ".join(f"{name} INT" for name in NULL_COLUMNS)
+        cursor.execute("CREATE TABLE type_test (dt DATETIME(6), ts TIMESTAMP(6) NULL, d DATE, t TIME(6), "
+                       f"j JSON, b BLOB, bt BIT(64), {nulls}) COLLATE='utf8mb4_unicode_ci'")
+        cursor.execute(f"INSERT INTO type_test {TYPE_TEST_SELECT}")
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+    yield
+
+    conn = mariadb.connect(**DB_CONFIG)
+    cursor = conn.cursor()
+    try:
+        cursor.execute("DROP TABLE IF EXISTS type_test")
+        conn.commit()
+    finally:
+        cursor.close()
+        conn.close()
+
+
+def type_sql(type_name):
+    table, columns = TYPE_CASES[type_name]
+    return f"SELECT {', '.join(columns)} FROM {table}"
+
+
+def type_result(result, driver_name, type_name, protocol, values):
+    result = dict(result)
+    result['params'] = dict(result.get('params', {}), driver=driver_name, type=type_name, protocol=protocol)
+    result['extra_info'] = dict(result.get('extra_info', {}), values=values,
+                                values_per_sec=values / result['mean'])
+    return result
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=100, warmup_rounds=10)
+@pytest.mark.usefixtures("type_tables")
+@pytest.mark.parametrize('type_name', list(TYPE_CASES))
+@pytest.mark.parametrize('protocol', ['text', 'binary'])
+async def test_types(async_benchmark, connection, driver_name, protocol, type_name, capture_benchmark_result):
+    """Benchmark fetching all values of one type family."""
+
+    if protocol == 'binary' and driver_name in ['pymysql', 'mysql_connector']:
+        pytest.skip(f"{driver_name} doesn't support binary protocol")
+    sql = type_sql(type_name)
+
+    async def select_type():
+        cursor = connection.cursor(binary=True) if protocol == 'binary' else connection.cursor()
+        cursor.execute(sql)
+        rows = cursor.fetchall()
+        cursor.close()
+        return rows
+
+    rows = await select_type()
+    values = len(rows) * len(TYPE_CASES[type_name][1])
+    result = await async_benchmark(select_type)
+    return capture_benchmark_result(type_result(result, driver_name, type_name, protocol, values))
+
+
+@pytest.mark.asyncio
+@pytest.mark.async_benchmark(rounds=100, warmup_rounds=10)
+@pytest.mark.usefixtures("type_tables")
+@pytest.mark.parametrize('type_name', list(TYPE_CASES))
+async def test_types_async(async_benchmark, async_connection, driver_name, type_name, capture_benchmark_result):
+    """Benchmark fetching all values of one type family (async)."""
+
+    sql = type_sql(type_name)
+
+    async def select_type():
+        async with get_async_cursor(async_connection, driver_name) as cursor:
+            await cursor.execute(sql)
+            return await cursor.fetchall()
+
+    rows = await select_type()
+    values = len(rows) * len(TYPE_CASES[type_name][1])
+    result = await async_benchmark(select_type)
+    return capture_benchmark_result(type_result(result, driver_name, type_name, 'text', values))
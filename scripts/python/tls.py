@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+TLS settings of the benchmark connections, and their certificates.
+
+TEST_DB_TLS selects the mode (TLS_MODES): off, on (whatever version driver
+and server agree on), 1.2 or 1.3; bench.sh -s (TEST_USE_SSL=true) means on.
+With TEST_DB_TLS_CA the drivers verify the server certificate and host name
+against that CA, otherwise they don't verify it.
+
+Run as a script, writes a self-signed CA (ca.pem, key ca-key.pem) and a
+server certificate signed by it (server-cert.pem, server-key.pem; RSA 2048,
+valid for localhost, 127.0.0.1, ::1 and any --host given) to --dir with the
+openssl command line tool, then prints the server configuration and the
+TEST_DB_TLS_CA setting.
+
+Usage:
+    python tls.py --dir ./tls
+    python tls.py --dir /etc/mysql/bench-tls --host db.example.test
+"""
+
+import argparse
+import ipaddress
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+
+
+CA_FILE = 'ca.pem'
+CA_KEY_FILE = 'ca-key.pem'
+CERT_FILE = 'server-cert.pem'
+KEY_FILE = 'server-key.pem'
+DAYS = '3650'
+
+TLS_MODES = ['off', 'on', '1.2', '1.3']
+TLS_MODE = os.environ.get('TEST_DB_TLS') or ('on' if os.environ.get('TEST_USE_SSL') == 'true' else 'off')
+TLS_CA = os.environ.get('TEST_DB_TLS_CA')
+TLS_VERSIONS = {'1.2': 'TLSv1.2', '1.3': 'TLSv1.3'}
+
+
+def tls_options(driver_name, mode=TLS_MODE):
+    """
+    `driver_name`'s connection arguments for TLS `mode`. Off, mysql_connector
+    gets TLS disabled explicitly, as it otherwise upgrades to TLS on its own.
+    """
+    if mode not in TLS_MODES:
+        raise ValueError(f"unknown TLS mode {mode!r}, expected one of {', '.join(TLS_MODES)}")
+    version = TLS_VERSIONS.get(mode)
+    if driver_name in ['mysql_connector', 'mysql_connector_async']:
+        if mode == 'off':
+            return {'ssl_disabled': True}
+        options = {'ssl_disabled': False, 'ssl_verify_cert': bool(TLS_CA), 'ssl_verify_identity': bool(TLS_CA)}
+        if TLS_CA:
+            options['ssl_ca'] = TLS_CA
+        if version:
+            options['tls_versions'] = [version]
+        return options
+    if mode == 'off':
+        return {}
+    if driver_name in ['pymysql', 'asyncmy']:
+        if TLS_CA:
+            context = ssl.create_default_context(cafile=TLS_CA)
+        else:
+            context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+            context.check_hostname = False
+            context.verify_mode = ssl.CERT_NONE
+        if version:
+            context.minimum_version = context.maximum_version = getattr(ssl.TLSVersion, version.replace('.', '_'))
+        return {'ssl': context}
+    options = {'ssl': True, 'ssl_verify_cert': bool(TLS_CA)}
+    if TLS_CA:
+        options['ssl_ca'] = TLS_CA
+    if version:
+        options['tls_version'] = version
+    return options
+
+
+def subject_alt_names(hosts):
+    names = []
+    for host in ['localhost', '127.0.0.1', '::1', *hosts]:
+        try:
+            name = f"IP:{ipaddress.ip_address(host)}"
+        except ValueError:
+            name = f"DNS:{host}"
+        if name not in names:
+            names.append(name)
+    return ','.join(names)
+
+
+def generate(directory, hosts=()):
+    """Write the CA and server certificate to `directory`, returning (ca, cert, key) paths."""
+    os.makedirs(directory, exist_ok=True)
+    ca, ca_key, cert, key = (os.path.abspath(os.path.join(directory, name))
+                             for name in (CA_FILE, CA_KEY_FILE, CERT_FILE, KEY_FILE))
+
+    def openssl(*args):
+        subprocess.run(['openssl', *args], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+
+    openssl('req', '-x509', '-newkey', 'rsa:2048', '-nodes', '-keyout', ca_key, '-out', ca, '-days', DAYS,
+            '-subj', '/CN=Benchmark CA', '-addext', 'basicConstraints=critical,CA:TRUE',
+            '-addext', 'keyUsage=critical,keyCertSign,cRLSign')
+    with tempfile.TemporaryDirectory() as tmp:
+        request = os.path.join(tmp, 'server.csr')
+        extensions = os.path.join(tmp, 'server.ext')
+        with open(extensions, 'w') as f:
+            f.write("basicConstraints=CA:FALSE\n"
+                    "extendedKeyUsage=serverAuth\n"
+                    f"subjectAltName={subject_alt_names(hosts)}\n")
+        openssl('req', '-newkey', 'rsa:2048', '-nodes', '-keyout', key, '-out', request, '-subj', '/CN=localhost')
+        openssl('x509', '-req', '-in', request, '-CA', ca, '-CAkey', ca_key, '-set_serial',
+                str(int.from_bytes(os.urandom(8), 'big')), '-days', DAYS, '-extfile', extensions, '-out', cert)
+    return ca, cert, key
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a self-signed CA and server certificate')
+    parser.add_argument('--dir', default='tls', help='Output directory (default: %(default)s)')
+    parser.add_argument('--host', action='append', default=[],
+                        help='Extra server host name or address for the certificate (repeatable)')
+    args = parser.parse_args()
+
+    try:
+        ca, cert, key = generate(args.dir, args.host)
+    except FileNotFoundError:
+        print("Error: tls.py requires the openssl command line tool")
+        return 1
+    except subprocess.CalledProcessError as e:
+        print(f"Error: {' '.join(e.cmd)} failed: {e.stderr.decode(errors='replace').strip()}")
+        return 1
+    print("Server configuration (my.cnf):")
+    print("[mariadb]")
+    print(f"ssl_ca={ca}")
+    print(f"ssl_cert={cert}")
+    print(f"ssl_key={key}")
+    print("tls_version=TLSv1.2,TLSv1.3")
+    print("")
+    print("Benchmarks:")
+    print(f"export TEST_DB_TLS_CA={ca}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
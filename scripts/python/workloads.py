@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# SPDX-License-Identifier: LGPL-2.1-or-later
+# Copyright (c) 2012-2014 Monty Program Ab
+# Copyright (c) 2015-2025 MariaDB Corporation Ab
+
+"""
+Benchmark workload bodies shared by the threaded, multi-process, gevent and
+open-loop runners.
+
+Each workload takes an open connection and the driver name and runs one
+operation, the same way the single-connection test_bench_*.py files do.
+ASYNC_WORKLOADS holds the coroutine versions for the async drivers.
+Runners create the tables a workload uses (workload_tables()) with
+conftest.create_tables() before running it.
+"""
+
+from conftest import get_async_cursor
+
+
+SELECT_1000_ROWS_SQL = "SELECT seq, 'abcdefghijabcdefghijabcdefghijaa' FROM seq_1_to_1000"
+INSERT_BATCH_ROWS = [('a' * 100,) for _ in range(100)]
+
+
+def placeholder(driver_name):
+    """Return the parameter marker used by a driver ('?' for mariadb, '%s' otherwise)."""
+    if driver_name in ['mariadb', 'mariadb_c', 'async-mariadb']:
+        return '?'
+    return '%s'
+
+
+def do_1(connection, driver_name):
+    cursor = connection.cursor()
+    cursor.execute("DO 1")
+    cursor.close()
+
+
+def select_1(connection, driver_name):
+    cursor = connection.cursor()
+    cursor.execute("SELECT 1")
+    rows = cursor.fetchall()
+    cursor.close()
+    return len(rows)
+
+
+def select_1000_rows(connection, driver_name):
+    cursor = connection.cursor()
+    cursor.execute(SELECT_1000_ROWS_SQL + " WHERE 1 = " + placeholder(driver_name), (1,))
+    rows = cursor.fetchall()
+    cursor.close()
+    return len(rows)
+
+
+def select_100_cols(connection, driver_name):
+    cursor = connection.cursor()
+    cursor.execute("SELECT * FROM test100 WHERE 1 = " + placeholder(driver_name), (1,))
+    row = cursor.fetchone()
+    cursor.close()
+    return len(row)
+
+
+def insert_batch(connection, driver_name):
+    cursor = connection.cursor()
+    cursor.executemany("INSERT INTO perfTestTextBatch(t0) VALUES (" + placeholder(driver_name) + ")",
+                       INSERT_BATCH_ROWS)
+    cursor.close()
+
+
+# name -> (workload, operations per measured round)
+WORKLOADS = {
+    'do_1': (do_1, 100),
+    'select_1': (select_1, 100),
+    'select_1000_rows': (select_1000_rows, 5),
+    'select_100_cols': (select_100_cols, 50),
+    'insert_batch': (insert_batch, 5),
+}
+
+# name -> tables the workload uses
+WORKLOAD_TABLES = {
+    'select_100_cols': ['test100'],
+    'insert_batch': ['perfTestTextBatch'],
+}
+
+
+def workload_tables(workload_names):
+    """The tables the named workloads use, each once."""
+    return list(dict.fromkeys(table for name in workload_names for table in WORKLOAD_TABLES.get(name, [])))
+
+
+async def do_1_async(connection, driver_name):
+    async with get_async_cursor(connection, driver_name) as cursor:
+        await cursor.execute("DO 1")
+
+
+async def select_1_async(connection, driver_name):
+    async with get_async_cursor(connection, driver_name) as cursor:
+        await cursor.execute("SELECT 1")
+        rows = await cursor.fetchall()
+    return len(rows)
+
+
+async def select_1000_rows_async(connection, driver_name):
+    async with get_async_cursor(connection, driver_name) as cursor:
+        await cursor.execute(SELECT_1000_ROWS_SQL + " WHERE 1 = " + placeholder(driver_name), (1,))
+        rows = await cursor.fetchall()
+    return len(rows)
+
+
+async def insert_batch_async(connection, driver_name):
+    async with get_async_cursor(connection, driver_name) as cursor:
+        await cursor.executemany("INSERT INTO perfTestTextBatch(t0) VALUES (" + placeholder(driver_name) + ")",
+                                 INSERT_BATCH_ROWS)
+
+
+# name -> (async workload, operations per measured round)
+ASYNC_WORKLOADS = {
+    'do_1': (do_1_async, 100),
+    'select_1': (select_1_async, 100),
+    'select_1000_rows': (select_1000_rows_async, 5),
+    'insert_batch': (insert_batch_async, 5),
+}
@@ -9,6 +9,28 @@ BINARY_EXECUTE_ONLY="BINARY EXECUTE ONLY"
 BINARY_PIPELINE="BINARY PIPELINE"
 BULK="BULK"
 REWRITE="REWRITE"
+PER_ROW="PER ROW"
+
+# executemany strategy detected on the wire (test_bench_executemany.py)
+STRATEGIES = {
+    'bulk': BULK,
+    'rewrite': REWRITE,
+    'per_row': PER_ROW,
+}
+
+# prepare/execute mode (test_bench_pipeline.py)
+PIPELINE_MODES = {
+    'execute_only': BINARY_EXECUTE_ONLY,
+    'prepare_execute_close': BINARY,
+    'pipeline': BINARY_PIPELINE,
+}
+
+# row suffix of the Python TLS modes (scripts/python/tls.py), plaintext has none
+TLS_SUFFIXES = {
+    'on': 'TLS',
+    '1.2': 'TLS1.2',
+    '1.3': 'TLS1.3',
+}
 
 DO_1 = "do 1"
 DO_1000 = "do 1000 parameters"
@@ -18,6 +40,15 @@ SELECT_1_POOL = "select 1 pool"
 SELECT_100 = "Select 100 int cols"
 SELECT_1000_ROWS = "select 1000 rows"
 
+# Python multi-threaded scaling workloads (test_bench_threads.py)
+THREAD_WORKLOADS = {
+    'do_1': DO_1,
+    'select_1': SELECT_1,
+    'select_1000_rows': SELECT_1000_ROWS,
+    'select_100_cols': SELECT_100,
+    'insert_batch': BATCH_100,
+}
+
 def around(x):
     if (x > 1000):
         return int(x)
@@ -36,6 +67,10 @@ if args.language:
 filter_mode = args.mode
 
 res = { }
+# Latency percentiles (seconds) where the results carry them: bench -> type -> connector -> summary
+latencies = { }
+memory = { }
+phases = { }
 
 # JAVA results
 if(os.path.exists('./bench_results_java.json') and (filter_languages is None or 'java' in filter_languages)):
@@ -430,6 +465,12 @@ def parsePythonBenchResults(file, connType):
                 bench = SELECT_1
             elif "test_select_1_pool[" in test_name:
                 bench = SELECT_1_POOL
+            elif "test_select_1_pool_async[" in test_name:
+                bench = SELECT_1_POOL
+            elif "test_pool[" in test_name or "test_pool_async[" in test_name:
+                params = i.get('params') or {}
+                bench = "select 1 {} pool size {}".format(params.get('pool', '?'), params.get('pool_size', '?'))
+                type = "{} CLIENTS".format(params.get('clients', '?'))
             elif "test_select_100_cols_text[" in test_name:
                 bench = SELECT_100
                 type = TEXT
@@ -469,15 +510,105 @@ def parsePythonBenchResults(file, connType):
             elif "test_do_1000_params_binary[" in test_name:
                 bench = DO_1000
                 type = BINARY_EXECUTE_ONLY
+            elif "test_threads[" in test_name:
+                params = i.get('params') or {}
+                bench = THREAD_WORKLOADS.get(params.get('workload'), params.get('workload', '')) + " threads"
+                type = "{} THREADS".format(params.get('threads', '?'))
+            elif "test_processes[" in test_name:
+                params = i.get('params') or {}
+                bench = THREAD_WORKLOADS.get(params.get('workload'), params.get('workload', '')) + " processes"
+                type = "{} PROCESSES".format(params.get('processes', '?'))
+            elif "test_gevent[" in test_name:
+                params = i.get('params') or {}
+                bench = THREAD_WORKLOADS.get(params.get('workload'), params.get('workload', '')) + " gevent"
+                type = "{} GREENLETS".format(params.get('greenlets', '?'))
+                if 'pool_size' in params:
+                    type += " / {} POOL".format(params['pool_size'])
+            elif "test_result_size[" in test_name or "test_result_size_async[" in test_name:
+                params = i.get('params') or {}
+                bench = "select {} rows x {}B".format(params.get('rows', '?'), params.get('width', '?'))
+                type = BINARY_EXECUTE_ONLY if params.get('protocol') == 'binary' else TEXT
+            elif "test_connect[" in test_name or "test_connect_async[" in test_name:
+                params = i.get('params') or {}
+                bench = "connect {}".format(params.get('auth', '?'))
+                type = params.get('tls', '?').upper()
+            elif "test_pool_warmup[" in test_name or "test_pool_warmup_async[" in test_name:
+                params = i.get('params') or {}
+                bench = "pool warm-up min {}".format(params.get('min_size', '?'))
+                type = params.get('pool', '?').upper()
+            elif "test_pipeline[" in test_name or "test_pipeline_async[" in test_name:
+                params = i.get('params') or {}
+                rtt = params.get('rtt_ms') or 0
+                bench = SELECT_100 if not rtt else "{} +{:g}ms RTT".format(SELECT_100, rtt)
+                type = PIPELINE_MODES.get(params.get('mode'), '?')
+            elif "test_stmt_cache[" in test_name or "test_stmt_cache_async[" in test_name:
+                params = i.get('params') or {}
+                bench = "stmt cache {} statements".format(params.get('statements', '?'))
+                type = "BINARY CACHE" if params.get('cache') == 'cache' else "BINARY NO CACHE"
+            elif "test_row_factory[" in test_name or "test_row_factory_async[" in test_name:
+                params = i.get('params') or {}
+                bench = "row factory {}".format(params.get('workload', '?'))
+                type = params.get('row_mode', '?').replace('_', ' ').upper()
+            elif "test_types[" in test_name or "test_types_async[" in test_name:
+                params = i.get('params') or {}
+                bench = "decode {}".format(params.get('type', '?'))
+                type = BINARY_EXECUTE_ONLY if params.get('protocol') == 'binary' else TEXT
+            elif "test_executemany[" in test_name or "test_executemany_async[" in test_name:
+                params = i.get('params') or {}
+                bench = "executemany {} x {}".format(params.get('batch_size', '?'), params.get('columns', '?'))
+                strategy = (i.get('extra_info') or {}).get('strategy')
+                type = STRATEGIES.get(strategy, strategy or '?')
+            elif "test_load_data[" in test_name:
+                params = i.get('params') or {}
+                bench = "load {} {} rows".format(params.get('dataset', '?'), params.get('rows', '?'))
+                type = "LOAD DATA" if params.get('method') == 'load_data' else "EXECUTEMANY"
+            elif "test_ingest[" in test_name:
+                params = i.get('params') or {}
+                bench = "ingest {} rows {}".format(params.get('rows', '?'), params.get('mode', '?'))
+                type = "ROWS/S"
+            elif "test_streaming[" in test_name:
+                params = i.get('params') or {}
+                bench = "stream {} rows {}".format(params.get('rows', '?'), params.get('mode', '?'))
+                if params.get('fetch_size'):
+                    bench += "({})".format(params['fetch_size'])
+                type = TEXT
+            elif "test_async_concurrency[" in test_name:
+                params = i.get('params') or {}
+                bench = "{} {} async tasks".format(params.get('workload', '?'), params.get('tasks', '?'))
+                type = "{} CONNECTIONS".format(params.get('connections', '?'))
+                if params.get('threads') and params['threads'] != params.get('connections'):
+                    type += " {} THREADS".format(params['threads'])
+            elif "test_open_loop[" in test_name:
+                params = i.get('params') or {}
+                bench = "{} open loop {}".format(params.get('workload', '?'), params.get('executor', '?'))
+                type = "{} RPS TARGET".format(params.get('target_rate', '?'))
             else:
                 print("bench not recognized : " + test_name)
 
+            # async benchmarks run on a non-default event loop (event_loops.py) get their own rows
+            event_loop = (i.get('params') or {}).get('event_loop')
+            if event_loop and event_loop != "asyncio":
+                type = type + " " + event_loop.upper()
+            # and so do benchmarks run over TLS (TEST_DB_TLS)
+            tls = (i.get('params') or {}).get('tls')
+            if tls in TLS_SUFFIXES:
+                type = type + " " + TLS_SUFFIXES[tls]
+
             if bench != "":
                 if not bench in res:
                     res[bench] = {}
                 if not type in res[bench]:
                     res[bench][type] = {}
                 res[bench][type]['python ' + connType] = val
+                latency = (i.get('extra_info') or {}).get('latency')
+                if latency:
+                    latencies.setdefault(bench, {}).setdefault(type, {})['python ' + connType] = latency
+                mem = (i.get('extra_info') or {}).get('memory')
+                if mem:
+                    memory.setdefault(bench, {}).setdefault(type, {})['python ' + connType] = mem
+                connect_phases = (i.get('extra_info') or {}).get('phases')
+                if connect_phases:
+                    phases.setdefault(bench, {}).setdefault(type, {})['python ' + connType] = connect_phases
 
         f.close()
 
@@ -489,6 +620,23 @@ if filter_languages is None or 'python' in filter_languages:
     parsePythonBenchResults("bench_results_python_mysql_connector_results.json", "mysql_connector")
     parsePythonBenchResults("bench_results_python_mysql_connector_async_results.json", "mysql_connector_async")
     parsePythonBenchResults("bench_results_python_asyncmy_results.json", "asyncmy")
+    for driver in ["mariadb", "mariadb_c", "pymysql", "mysql_connector"]:
+        parsePythonBenchResults("bench_results_python_" + driver + "_mp_results.json", driver)
+    for driver in ["mariadb", "pymysql", "mysql_connector"]:
+        parsePythonBenchResults("bench_results_python_" + driver + "_gevent_results.json", driver)
+    for driver in ["mariadb", "mariadb_c", "async-mariadb", "pymysql", "mysql_connector", "mysql_connector_async", "asyncmy"]:
+        parsePythonBenchResults("bench_results_python_" + driver + "_open_loop_results.json", driver)
+        parsePythonBenchResults("bench_results_python_" + driver + "_streaming_results.json", driver)
+        parsePythonBenchResults("bench_results_python_" + driver + "_ingest_results.json", driver)
+        parsePythonBenchResults("bench_results_python_" + driver + "_load_data_results.json", driver)
+        parsePythonBenchResults("bench_results_python_" + driver + "_async_concurrency_results.json", driver)
+    for driver in ["async-mariadb", "mysql_connector_async", "asyncmy"]:
+        for event_loop in ["selector", "proactor", "uvloop", "winloop"]:
+            parsePythonBenchResults("bench_results_python_" + driver + "_" + event_loop + "_results.json", driver)
+            parsePythonBenchResults("bench_results_python_" + driver + "_" + event_loop + "_async_concurrency_results.json", driver)
+    for driver in ["mariadb", "mariadb_c", "async-mariadb", "pymysql", "mysql_connector", "mysql_connector_async", "asyncmy"]:
+        for tls in ["tls", "tls12", "tls13"]:
+            parsePythonBenchResults("bench_results_python_" + driver + "_" + tls + "_results.json", driver)
 
 
 
@@ -716,3 +864,131 @@ else:
     # Print single table for filtered mode
     print_results_table(connectorTypes)
 
+
+def print_latency_table(connectorTypes):
+    """Print latency percentiles (microseconds) for the results that record them."""
+    rows = []
+    for bench in latencies:
+        for type in latencies[bench]:
+            for connectorType in connectorTypes:
+                if connectorType in latencies[bench][type]:
+                    rows.append((bench, type, connectorType, latencies[bench][type][connectorType]))
+    if not rows:
+        return
+
+    print("")
+    print("latency percentiles (us):")
+    print("")
+    print("{:53} | {:22} | {:>8} | {:>10} | {:>10} | {:>10} | {:>10} |".format(
+        "", "connector", "samples", "p50", "p99", "p99.9", "max"))
+    separator = "{:54}|{:24}|{:10}|{:12}|{:12}|{:12}|{:12}|".format(
+        "".ljust(54, "-"), "".ljust(24, "-"), "".ljust(10, "-"), "".ljust(12, "-"), "".ljust(12, "-"),
+        "".ljust(12, "-"), "".ljust(12, "-"))
+    print(separator)
+
+    def us(latency, key):
+        # percentiles the sample count can't support aren't recorded
+        value = latency.get(key)
+        return "-" if value is None else "{:.1f}".format(value * 1e6)
+
+    for bench, type, connectorType, latency in rows:
+        print("{:30} - {:20} | {:22} | {:>8} | {:>10} | {:>10} | {:>10} | {:10.1f} |".format(
+            bench, type, connectorType, latency.get('count', '-'), us(latency, 'p50'), us(latency, 'p99'),
+            us(latency, 'p99.9'), latency['max'] * 1e6))
+    print(separator)
+
+
+print_latency_table(connectorTypes)
+
+
+def print_memory_table(connectorTypes):
+    """Print tracemalloc peak, retained blocks per operation and RSS delta for the results that record them."""
+    rows = []
+    for bench in memory:
+        for type in memory[bench]:
+            for connectorType in connectorTypes:
+                if connectorType in memory[bench][type]:
+                    rows.append((bench, type, connectorType, memory[bench][type][connectorType]))
+    if not rows:
+        return
+
+    print("")
+    print("memory:")
+    print("")
+    print("{:53} | {:22} | {:>10} | {:>10} | {:>10} |".format(
+        "", "connector", "peak KB", "blocks/op", "RSS +KB"))
+    separator = "{:54}|{:24}|{:12}|{:12}|{:12}|".format(
+        "".ljust(54, "-"), "".ljust(24, "-"), "".ljust(12, "-"), "".ljust(12, "-"), "".ljust(12, "-"))
+    print(separator)
+    for bench, type, connectorType, mem in rows:
+        rss_delta = mem.get('rss_delta')
+        print("{:30} - {:20} | {:22} | {:10.1f} | {:10.1f} | {:>10} |".format(
+            bench, type, connectorType, mem['tracemalloc_peak'] / 1024, mem['blocks'],
+            "-" if rss_delta is None else "{:.0f}".format(rss_delta / 1024)))
+    print(separator)
+
+
+print_memory_table(connectorTypes)
+
+
+def print_phases_table(connectorTypes):
+    """Print the connect() phase breakdown (microseconds) for the results that record it."""
+    rows = []
+    for bench in phases:
+        for type in phases[bench]:
+            for connectorType in connectorTypes:
+                if connectorType in phases[bench][type]:
+                    rows.append((bench, type, connectorType, phases[bench][type][connectorType]))
+    if not rows:
+        return
+
+    print("")
+    print("connect phases (us):")
+    print("")
+    print("{:53} | {:22} | {:>8} | {:>8} | {:>8} | {:>8} | {:>8} | {:>8} |".format(
+        "", "connector", "tcp", "greeting", "tls", "auth", "session", "close"))
+    separator = "{:54}|{:24}|{:10}|{:10}|{:10}|{:10}|{:10}|{:10}|".format(
+        "".ljust(54, "-"), "".ljust(24, "-"), *["".ljust(10, "-")] * 6)
+    print(separator)
+    for bench, type, connectorType, phase in rows:
+        print("{:30} - {:20} | {:22} | {:8.1f} | {:8.1f} | {:8.1f} | {:8.1f} | {:8.1f} | {:8.1f} |".format(
+            bench, type, connectorType, phase['tcp'] * 1e6, phase['greeting'] * 1e6, phase['tls'] * 1e6,
+            phase['auth'] * 1e6, phase['session_setup'] * 1e6, phase['close'] * 1e6))
+    print(separator)
+
+
+print_phases_table(connectorTypes)
+
+
+def print_tls_table(connectorTypes):
+    """Print the throughput lost over TLS, against the same benchmark over plaintext."""
+    rows = []
+    for bench in res:
+        for type in res[bench]:
+            for suffix in TLS_SUFFIXES.values():
+                if not type.endswith(" " + suffix):
+                    continue
+                plain = res[bench].get(type[:-len(suffix) - 1])
+                if not plain:
+                    continue
+                for connectorType in connectorTypes:
+                    if connectorType in res[bench][type] and plain.get(connectorType):
+                        rows.append((bench, type, connectorType, plain[connectorType], res[bench][type][connectorType]))
+    if not rows:
+        return
+
+    print("")
+    print("TLS penalty (ops/s):")
+    print("")
+    print("{:53} | {:22} | {:>12} | {:>12} | {:>8} |".format(
+        "", "connector", "plaintext", "TLS", "penalty"))
+    separator = "{:54}|{:24}|{:14}|{:14}|{:10}|".format(
+        "".ljust(54, "-"), "".ljust(24, "-"), "".ljust(14, "-"), "".ljust(14, "-"), "".ljust(10, "-"))
+    print(separator)
+    for bench, type, connectorType, plain, tls in rows:
+        print("{:30} - {:20} | {:22} | {:12.0f} | {:12.0f} | {:7.1f}% |".format(
+            bench, type, connectorType, plain, tls, (1 - tls / plain) * 100))
+    print(separator)
+
+
+print_tls_table(connectorTypes)